@@ -0,0 +1,3 @@
+"""
+Benchmarks reproductibles (driver SDL "dummy") : lancer depuis src/, ex. python -m benchmarks.match_scenarios
+"""
@@ -0,0 +1,134 @@
+"""
+Benchmark de la broadphase (combat/spatial_grid.py) : coût d'un tick de Simulation et d'une requête de
+collision quand le nombre de plateformes et de projectiles augmente. Avec la grille, le coût par entité
+doit rester à peu près constant (contre une croissance linéaire pour le parcours de toutes les entités).
+
+    cd src && python -m benchmarks.broadphase [--ticks 300] [--output broadphase.json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from benchmarks.match_scenarios import summarize, BENCH_LIVES, RANDOM_SEED
+from combat.projectile_sprite import ProjectileSprite
+from combat.spatial_grid import SpatialGrid
+from game.simulation import create_headless_simulation, collision_query_rect
+from player.player_input import NEUTRAL_INPUT
+from smash_platform.game_platform import Platform
+
+DEFAULT_TICKS = 300
+DEFAULT_WARMUP = 20
+# (plateformes en plus de la scène, projectiles maintenus en vol)
+STAGE_SIZES = ((0, 0), (12, 16), (48, 64), (192, 256))
+QUERY_COUNTS = (16, 64, 256, 1024, 4096)
+QUERY_SAMPLES = 2000
+# Px monde par entité (côté) pour les requêtes : ~1 entité par carré de QUERY_SPACING
+QUERY_SPACING = 400
+EXTRA_PLATFORM_SIZE = (220, 20)
+
+
+def add_platforms(sim, count, rng):
+    """Plateformes one-way réparties au hasard dans le monde (hors de la scène principale)."""
+    world_w, world_h = sim.players[0].screen_width, sim.players[0].screen_height
+    for _ in range(count):
+        pos = (rng.randrange(0, world_w - EXTRA_PLATFORM_SIZE[0]), rng.randrange(0, world_h - EXTRA_PLATFORM_SIZE[1]))
+        sim.platforms.add(Platform(EXTRA_PLATFORM_SIZE, pos, one_way=True))
+
+
+def top_up_projectiles(sim, count):
+    """Garde count projectiles en vol (tirés alternativement par chaque joueur)."""
+    i = 0
+    while len(sim.hitboxes) < count:
+        ProjectileSprite(sim.players[i % len(sim.players)], sim.hitboxes)
+        i += 1
+
+
+def bench_simulation(extra_platforms, projectiles, ticks, warmup):
+    rng = random.Random(RANDOM_SEED)
+    random.seed(RANDOM_SEED)
+    sim = create_headless_simulation()
+    sim.reset_match(lives=BENCH_LIVES)
+    add_platforms(sim, extra_platforms, rng)
+    inputs = [NEUTRAL_INPUT] * len(sim.players)
+    samples = []
+    perf = time.perf_counter
+    for tick in range(warmup + ticks):
+        top_up_projectiles(sim, projectiles)
+        t0 = perf()
+        sim.step(inputs)
+        if tick >= warmup:
+            samples.append((perf() - t0) * 1000.0)
+    entities = len(sim.players) + len(sim.platforms) + projectiles
+    stats = summarize(samples)
+    return {
+        "platforms": len(sim.platforms),
+        "projectiles": projectiles,
+        "step_ms": stats,
+        "us_per_entity": round(stats["mean"] * 1000.0 / entities, 3),
+    }
+
+
+def bench_queries(count, samples):
+    """
+    Requête de collision d'un joueur : grille contre parcours de toutes les entités (µs par requête).
+    Densité constante (le monde grandit avec count) : chaque requête trouve à peu près autant de voisins.
+    """
+    rng = random.Random(RANDOM_SEED)
+    side = int(QUERY_SPACING * count ** 0.5)
+    world = pygame.Rect(0, 0, side, side)
+    rects = [
+        pygame.Rect(rng.randrange(world.w - 220), rng.randrange(world.h - 130), rng.choice((40, 220)), rng.choice((20, 130)))
+        for _ in range(count)
+    ]
+    grid = SpatialGrid()
+    for i, rect in enumerate(rects):
+        grid.insert(i, rect)
+    probe = create_headless_simulation().players[0]
+    areas = []
+    for _ in range(samples):
+        probe.rect.topleft = (rng.randrange(world.w), rng.randrange(world.h))
+        areas.append(collision_query_rect(probe))
+    perf = time.perf_counter
+    t0 = perf()
+    for area in areas:
+        grid.query(area)
+    grid_us = (perf() - t0) * 1e6 / samples
+    t0 = perf()
+    for area in areas:
+        [i for i, rect in enumerate(rects) if area.colliderect(rect)]
+    brute_us = (perf() - t0) * 1e6 / samples
+    return {"entities": count, "grid_us": round(grid_us, 3), "brute_force_us": round(brute_us, 3)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de la broadphase (JSON sur stdout).")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--output", help="écrit aussi le JSON dans ce fichier")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "simulation": [bench_simulation(p, n, args.ticks, args.warmup) for p, n in STAGE_SIZES],
+        "queries": [bench_queries(n, QUERY_SAMPLES) for n in QUERY_COUNTS],
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
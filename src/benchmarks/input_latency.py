@@ -0,0 +1,258 @@
+"""
+Latence entrée -> affichage : un thread injecte des appuis horodatés (attaque, saut) à un instant quelconque
+du frame, la boucle de combat tourne comme dans main.py (pas fixe, rendu plafonné, flip) et l'appel de
+start_attack / jump qui en résulte chez P1 est marqué. Pour chaque périphérique on mesure le temps (ms) et le
+nombre de frames rendus entre l'appui et le flip du frame qui affiche le nouvel état, sur beaucoup d'appuis.
+
+    cd src && python -m benchmarks.input_latency [--samples 60] [--device keyboard ...] [--fps 240] [--output out.json]
+
+Périphériques : clavier (KEYDOWN), manette par events SDL (JOYBUTTONDOWN), manette lue par le polling de
+secours (get_joystick_poll_events, aucun event SDL). Les manettes sont virtuelles (slot 0 du GamepadManager).
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from benchmarks.match_scenarios import build_playing_context, reset_scenario, summarize, RANDOM_SEED
+from game.config import WIDTH, HEIGHT, SIM_STEP_MS, RENDER_FPS_CAP, MAX_FRAME_MS, JOY_BTN_ATTACK, JOY_BTN_JUMP
+from game.gamepads import get_gamepads
+from game.input_handling import tick_gamepads
+from game.screens import PlayingScreen
+
+DEFAULT_SAMPLES = 60
+DEVICES = ("keyboard", "pad_event", "pad_poll")
+ACTIONS = ("start_attack", "jump")
+# Appui non suivi d'effet après autant de frames rendus : compté comme manqué
+MAX_WAIT_FRAMES = 120
+# Ticks sans animation d'attaque avant l'appui suivant (saut précédent retombé, attaque finie)
+SETTLE_TICKS = 45
+# Bouton manette / touche (commandes de P1) de chaque action
+PAD_BUTTONS = {"start_attack": JOY_BTN_ATTACK, "jump": JOY_BTN_JUMP}
+KEY_ACTIONS = {"start_attack": "attacking", "jump": "jump"}
+
+
+class VirtualPad:
+    """Manette virtuelle (interface de pygame.joystick.Joystick lue par le jeu) : boutons posés par l'injecteur."""
+
+    def __init__(self, instance_id: int = -1):
+        self.instance_id = instance_id
+        self.buttons = [False] * 10
+
+    def get_instance_id(self):
+        return self.instance_id
+
+    def get_name(self):
+        return "virtual pad"
+
+    def get_numaxes(self):
+        return 2
+
+    def get_axis(self, axis):
+        return 0.0
+
+    def get_numhats(self):
+        return 0
+
+    def get_hat(self, hat):
+        return 0, 0
+
+    def get_numbuttons(self):
+        return len(self.buttons)
+
+    def get_button(self, button):
+        return self.buttons[button]
+
+
+class Injector(threading.Thread):
+    """
+    Appuis d'un périphérique, un à la fois : attend que la boucle soit prête, laisse passer un délai aléatoire
+    (phase quelconque par rapport aux frames et aux ticks), horodate puis injecte.
+    """
+
+    def __init__(self, device, player, pad, actions, seed):
+        super().__init__(daemon=True)
+        self.device = device
+        self.player = player
+        self.pad = pad
+        self.actions = actions
+        self.rng = random.Random(seed)
+        self.ready = threading.Event()
+        self.pending = None  # (action, instant de l'appui) en attente d'effet
+        self.stop = False
+
+    def run(self):
+        for action in self.actions:
+            self.ready.wait()
+            if self.stop:
+                return
+            self.ready.clear()
+            time.sleep(self.rng.uniform(0.0, 2 * SIM_STEP_MS) / 1000.0)
+            self.pending = (action, time.perf_counter())
+            self.press(action)
+
+    def press(self, action):
+        if self.device == "keyboard":
+            key = self.player.controls[KEY_ACTIONS[action]]
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+        elif self.device == "pad_event":
+            pygame.event.post(pygame.event.Event(
+                pygame.JOYBUTTONDOWN, joy=0, instance_id=self.pad.instance_id, button=PAD_BUTTONS[action],
+            ))
+        else:
+            self.pad.buttons[PAD_BUTTONS[action]] = True
+
+    def release(self):
+        if self.pad is not None:
+            self.pad.buttons[:] = [False] * len(self.pad.buttons)
+
+
+def tag_actions(player, calls):
+    """Enveloppe start_attack / jump du joueur : chaque appel ajoute (nom, instant) à calls."""
+    for name in ACTIONS:
+        original = getattr(player, name)
+
+        def tagged(*args, _name=name, _original=original, **kwargs):
+            calls.append((_name, time.perf_counter()))
+            return _original(*args, **kwargs)
+
+        setattr(player, name, tagged)
+
+
+def untag_actions(player):
+    for name in ACTIONS:
+        player.__dict__.pop(name, None)
+
+
+def measure_device(ctx, screen, device, samples, fps, seed):
+    """Joue le combat jusqu'à samples appuis (moitié attaques, moitié sauts) ; latences par action."""
+    reset_scenario(ctx)
+    sim = ctx.simulation
+    p1 = sim.players[0]
+    gamepads = get_gamepads()
+    pad = None
+    if device != "keyboard":
+        pad = VirtualPad()
+        gamepads.attach(pad)
+    tick_gamepads(sim.players)
+    pygame.event.clear()
+
+    calls = []
+    tag_actions(p1, calls)
+    actions = [ACTIONS[i % len(ACTIONS)] for i in range(samples)]
+    injector = Injector(device, p1, pad, actions, f"{seed}:{device}")
+    results = {name: {"display_ms": [], "state_ms": [], "frames": [], "missed": 0} for name in ACTIONS}
+    clock = pygame.time.Clock()
+    perf = time.perf_counter
+    settle = 0
+    frames_waiting = 0
+    done = 0
+    armed = False  # injecteur autorisé à appuyer, appui pas encore mesuré
+    injector.start()
+    try:
+        while done < samples:
+            frame_dt_ms = clock.tick(fps)
+            tick_gamepads(sim.players)
+            ctx.sim_accumulator_ms += min(frame_dt_ms, MAX_FRAME_MS)
+            screen.handle_events(ctx)
+            while ctx.sim_accumulator_ms >= SIM_STEP_MS:
+                screen.step(ctx)
+                ctx.sim_accumulator_ms -= SIM_STEP_MS
+                settle = settle + 1 if p1._attack_animation_remaining <= 0 else 0
+            screen.draw(ctx, ctx.sim_accumulator_ms / SIM_STEP_MS)
+            flipped = perf()
+
+            pending = injector.pending
+            if pending is None:
+                if settle >= SETTLE_TICKS and not armed:
+                    calls.clear()
+                    armed = True
+                    injector.ready.set()
+                continue
+            action, pressed_at = pending
+            if pressed_at > flipped:
+                continue
+            frames_waiting += 1
+            hit = next((t for name, t in calls if name == action and t >= pressed_at), None)
+            if hit is None and frames_waiting < MAX_WAIT_FRAMES:
+                continue
+            if hit is None:
+                results[action]["missed"] += 1
+            else:
+                results[action]["display_ms"].append((flipped - pressed_at) * 1000.0)
+                results[action]["state_ms"].append((hit - pressed_at) * 1000.0)
+                results[action]["frames"].append(frames_waiting)
+            injector.release()
+            injector.pending = None
+            frames_waiting = 0
+            settle = 0
+            armed = False
+            done += 1
+    finally:
+        injector.stop = True
+        injector.ready.set()
+        untag_actions(p1)
+        if pad is not None:
+            gamepads.detach(pad.instance_id)
+
+    report = {}
+    for name, r in results.items():
+        frames = sorted(r["frames"])
+        report[name] = {
+            "samples": len(r["frames"]),
+            "missed": r["missed"],
+            "display_ms": summarize(r["display_ms"]),
+            "state_ms": summarize(r["state_ms"]),
+            "frames": {
+                "mean": round(sum(frames) / len(frames), 2) if frames else 0.0,
+                "min": frames[0] if frames else 0,
+                "max": frames[-1] if frames else 0,
+            },
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latence entrée -> affichage par périphérique (JSON sur stdout).")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="appuis par périphérique")
+    parser.add_argument("--device", action="append", choices=DEVICES,
+                        help="périphérique à mesurer (répétable) ; tous par défaut")
+    parser.add_argument("--fps", type=int, default=RENDER_FPS_CAP, help="plafond de rendu (comme en combat)")
+    parser.add_argument("--size", type=int, nargs=2, default=(WIDTH, HEIGHT), metavar=("W", "H"))
+    parser.add_argument("--output", help="écrit aussi le JSON dans ce fichier")
+    args = parser.parse_args(argv)
+
+    ctx = build_playing_context(tuple(args.size))
+    screen = PlayingScreen()
+    report = {
+        "screen_size": [ctx.screen_w, ctx.screen_h],
+        "video_driver": pygame.display.get_driver(),
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "render_fps_cap": args.fps,
+        "sim_step_ms": round(SIM_STEP_MS, 3),
+        "devices": {},
+    }
+    # Clavier d'abord : le nombre de manettes est collant après le retrait d'une manette virtuelle
+    for device in [d for d in DEVICES if d in (args.device or DEVICES)]:
+        report["devices"][device] = measure_device(ctx, screen, device, args.samples, args.fps, RANDOM_SEED)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
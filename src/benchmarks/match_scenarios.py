@@ -0,0 +1,241 @@
+"""
+Benchmark de combat : pilote PlayingScreen (events + tick + dessin) avec des entrées scriptées
+sur des scénarios reproductibles et mesure le coût d'un frame (moyenne, p95, p99) en JSON.
+
+    cd src && python -m benchmarks.match_scenarios [--frames 600] [--scenario idle ...] [--players 8] [--output out.json]
+
+Un tick de simulation par frame rendu (alpha = 1) : on mesure le coût du jeu, pas la boucle à pas fixe.
+Avec --players N > 2, les scripts pilotent P1 et P2 ; les autres joueurs restent neutres (free-for-all chargé).
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from game.config import WIDTH, HEIGHT, MAX_PLAYERS
+from game.context import GameContext
+from game.match_setup import create_players, create_platforms
+from game.simulation import Simulation
+from game.screens import PlayingScreen
+from player.player_input import InputFrame, NEUTRAL_INPUT
+
+DEFAULT_FRAMES = 600
+DEFAULT_WARMUP = 30
+RANDOM_SEED = 15
+# Stocks "infinis" : un KO ne doit pas terminer le scénario sur l'écran de victoire
+BENCH_LIVES = 99
+# Distance (px entre centres) à partir de laquelle les joueurs s'arrêtent pour frapper
+CLOSE_RANGE = 130
+# Frames entre deux attaques d'un même joueur
+ATTACK_PERIOD = 10
+# Tumble : P2 revient vers le centre de la scène au-delà de cette distance (px)
+RECOVERY_MARGIN = 150
+
+
+def _toward(player, other):
+    """(left, right) pour marcher vers l'autre joueur."""
+    dx = other.rect.centerx - player.rect.centerx
+    return dx < 0, dx > 0
+
+
+def script_idle(frame, sim):
+    return [NEUTRAL_INPUT] * len(sim.players)
+
+
+def script_walk(frame, sim):
+    """Les deux joueurs marchent en sens opposés, demi-tour toutes les 1,5 s."""
+    go_right = (frame // 90) % 2 == 0
+    return [
+        InputFrame(left=not go_right, right=go_right),
+        InputFrame(left=go_right, right=not go_right),
+    ]
+
+
+def script_jab_exchange(frame, sim):
+    """Rapprochement puis échange constant : jab et ftilt en alternance, chaque joueur à son tour."""
+    p1, p2 = sim.players[0], sim.players[1]
+    inputs = []
+    for i, (me, other) in enumerate(((p1, p2), (p2, p1))):
+        left, right = _toward(me, other)
+        if abs(other.rect.centerx - me.rect.centerx) > CLOSE_RANGE:
+            inputs.append(InputFrame(left=left, right=right))
+            continue
+        attack = (frame + i * 5) % ATTACK_PERIOD == 0
+        use_ftilt = (frame // ATTACK_PERIOD) % 2 == 1
+        inputs.append(InputFrame(
+            left=left and use_ftilt,
+            right=right and use_ftilt,
+            attack_pressed=attack,
+        ))
+    return inputs
+
+
+def script_projectile_spam(frame, sim):
+    """Special neutre en boucle : rafales de ProjectileSprite dès que le cooldown le permet."""
+    press = frame % 4 == 0
+    return [InputFrame(special_pressed=press), InputFrame(special_pressed=(frame + 2) % 4 == 0)]
+
+
+def script_tumble_recovery(frame, sim):
+    """
+    P2 à haut pourcentage : P1 le lance en ftilt (tumble), P2 revient vers le centre
+    (DI vers la scène, sauts puis up special) ; on recommence à chaque retour au sol.
+    """
+    p1, p2 = sim.players[0], sim.players[1]
+    if p2.stats.percent < 120:
+        p2.stats.percent = 150
+    center_x = sum(p.rect.centerx for p in sim.platforms) / max(1, len(sim.platforms))
+    left1, right1 = _toward(p1, p2)
+    if p2.hitstun > 0 or abs(p2.rect.centerx - p1.rect.centerx) > CLOSE_RANGE:
+        in1 = InputFrame(left=left1 and p2.hitstun <= 0, right=right1 and p2.hitstun <= 0)
+    else:
+        in1 = InputFrame(left=left1, right=right1, attack_pressed=frame % 8 == 0)
+    offstage = abs(p2.rect.centerx - center_x) > RECOVERY_MARGIN or p2.hitstun > 0
+    if not offstage:
+        in2 = NEUTRAL_INPUT
+    else:
+        recover = frame % 20 == 0
+        in2 = InputFrame(
+            left=p2.rect.centerx > center_x,
+            right=p2.rect.centerx < center_x,
+            up=recover,
+            jump=recover,
+            jump_pressed=recover,
+            special_pressed=recover and p2.jump_count >= p2.jump_max,
+        )
+    return [in1, in2]
+
+
+SCENARIOS = {
+    "idle": script_idle,
+    "walk": script_walk,
+    "jab_exchange": script_jab_exchange,
+    "projectile_spam": script_projectile_spam,
+    "tumble_recovery": script_tumble_recovery,
+}
+
+
+def build_playing_context(screen_size=(WIDTH, HEIGHT), count: int = 2):
+    """GameContext prêt pour un combat de count joueurs (comme main.py), sur un écran SDL "dummy"."""
+    pygame.init()
+    screen = pygame.display.set_mode(screen_size)
+    screen_w, screen_h = screen.get_size()
+    world_size = (screen_w * 2, screen_h * 2)
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ctx = GameContext(screen, pygame.time.Clock(), base_dir, (screen_w, screen_h), world_size)
+    players = create_players(world_size, count=count)
+    ctx.player1, ctx.player2 = players[0], players[1]
+    ctx.players = pygame.sprite.Group(*players)
+    ctx.hitboxes = pygame.sprite.Group()
+    a = ctx.assets
+    ctx.platforms = create_platforms(
+        world_size, a.main_platform_size, a.main_platform_image, a.small_platform_size, a.small_platform_image,
+    )
+    ctx.simulation = Simulation(players, ctx.platforms, ctx.hitboxes)
+    return ctx
+
+
+def reset_scenario(ctx):
+    """Même état de départ pour chaque scénario."""
+    random.seed(RANDOM_SEED)
+    ctx.simulation.reset_match(lives=BENCH_LIVES)
+    for pl in ctx.simulation.players:
+        pl.stats.percent = 0
+        pl._smoke_frames_remaining = 0
+    ctx.camera_x = ctx.camera_prev_x = ctx.world_w // 2 - ctx.screen_w // 2
+    ctx.camera_y = ctx.camera_prev_y = ctx.world_h // 2 - ctx.screen_h // 2
+    ctx.paused = False
+    ctx.game_state = "playing"
+
+
+def percentile(sorted_values, pct):
+    """Percentile au rang le plus proche (liste déjà triée)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples_ms):
+    ordered = sorted(samples_ms)
+    n = len(ordered)
+    return {
+        "mean": round(sum(ordered) / n, 4) if n else 0.0,
+        "p95": round(percentile(ordered, 95), 4),
+        "p99": round(percentile(ordered, 99), 4),
+        "max": round(ordered[-1], 4) if n else 0.0,
+    }
+
+
+def run_scenario(ctx, screen, script, frames=DEFAULT_FRAMES, warmup=DEFAULT_WARMUP):
+    """Joue warmup + frames ticks scriptés ; renvoie les stats du frame complet, du tick et du dessin (ms)."""
+    reset_scenario(ctx)
+    sim = ctx.simulation
+    frame_ms, step_ms, draw_ms = [], [], []
+    perf = time.perf_counter
+    for frame in range(warmup + frames):
+        inputs = script(frame, sim)
+        t0 = perf()
+        screen.handle_events(ctx)
+        screen.step(ctx, inputs)
+        t1 = perf()
+        screen.draw(ctx, 1.0)
+        t2 = perf()
+        if frame >= warmup:
+            frame_ms.append((t2 - t0) * 1000.0)
+            step_ms.append((t1 - t0) * 1000.0)
+            draw_ms.append((t2 - t1) * 1000.0)
+    return {
+        "frames": frames,
+        "frame_ms": summarize(frame_ms),
+        "step_ms": summarize(step_ms),
+        "draw_ms": summarize(draw_ms),
+        "projectiles_alive": len(ctx.hitboxes),
+        "percent": [round(p.stats.percent, 1) for p in sim.players],
+        "kos": [BENCH_LIVES - p.lives for p in sim.players],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des scénarios de combat (JSON sur stdout).")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scénario à jouer (répétable) ; tous par défaut")
+    parser.add_argument("--size", type=int, nargs=2, default=(WIDTH, HEIGHT), metavar=("W", "H"))
+    parser.add_argument("--players", type=int, default=2, choices=range(2, MAX_PLAYERS + 1), metavar="N",
+                        help=f"nombre de combattants (2 à {MAX_PLAYERS})")
+    parser.add_argument("--output", help="écrit aussi le JSON dans ce fichier")
+    args = parser.parse_args(argv)
+
+    ctx = build_playing_context(tuple(args.size), args.players)
+    screen = PlayingScreen()
+    names = args.scenario or list(SCENARIOS)
+    report = {
+        "screen_size": [ctx.screen_w, ctx.screen_h],
+        "video_driver": pygame.display.get_driver(),
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "players": args.players,
+        "scenarios": {},
+    }
+    for name in names:
+        report["scenarios"][name] = run_scenario(ctx, screen, SCENARIOS[name], args.frames, args.warmup)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark du rollback (net/rollback.py) : deux Simulation headless reliées par un LoopbackNetwork (latence,
+gigue, pertes), entrées scriptées reproductibles, horloge virtuelle. Mesure rollbacks, profondeur et coût des
+resimulations, attentes ; vérifie qu'à la fin les deux machines ont le même état que la partie jouée hors
+ligne avec les mêmes entrées.
+
+    cd src && python -m benchmarks.rollback [--frames 1200] [--latency 60] [--jitter 15] [--loss 0.05] [--output out.json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from benchmarks.match_scenarios import summarize, BENCH_LIVES, RANDOM_SEED
+from game.config import SIM_STEP_MS, NET_INPUT_DELAY, NET_MAX_ROLLBACK
+from game.match_state import capture, checksum
+from game.simulation import create_headless_simulation
+from net.rollback import RollbackSession, RollbackStats
+from net.transport import LoopbackNetwork
+from player.player_input import InputFrame, PRESS_BITS, NEUTRAL_INPUT
+
+DEFAULT_FRAMES = 1200
+# Frames pendant lesquels une direction tenue reste la même dans le script
+HOLD_FRAMES = 12
+PRESS_CHANCE = 0.06
+# Ticks max pour que les dernières entrées arrivent après la fin du script
+DRAIN_TICKS = 600
+# Ticks max (× frames) pour jouer le script : les attentes (stalls) ralentissent la partie
+MAX_TICKS_PER_FRAME = 20
+
+
+def scripted_input(side: int, frame: int) -> InputFrame:
+    """Entrée reproductible du joueur side pour le frame où elle est jouée : directions tenues + appuis rares."""
+    # Bits 0-4 : left, right, up, down, jump (FLAGS)
+    held = random.Random(f"{RANDOM_SEED}:{side}:hold:{frame // HOLD_FRAMES}").getrandbits(5)
+    rng = random.Random(f"{RANDOM_SEED}:{side}:press:{frame}")
+    presses = 0
+    for bit in range(PRESS_BITS.bit_length()):
+        if PRESS_BITS >> bit & 1 and rng.random() < PRESS_CHANCE:
+            presses |= 1 << bit
+    return InputFrame.from_bits(held | presses)
+
+
+def new_simulation():
+    random.seed(RANDOM_SEED)
+    sim = create_headless_simulation()
+    sim.reset_match(lives=BENCH_LIVES)
+    return sim
+
+
+def offline_checksum(frames: int, delay: int) -> str:
+    """État après frames ticks joués sur une seule machine (entrées décalées du même retard)."""
+    sim = new_simulation()
+    for frame in range(frames):
+        played = frame - delay
+        sim.step([NEUTRAL_INPUT if played < 0 else scripted_input(side, played) for side in (0, 1)])
+    return checksum(sim)
+
+
+def run(frames, latency, jitter, loss, delay, max_rollback):
+    clock = [0.0]
+    network = LoopbackNetwork(latency, jitter, loss, seed=RANDOM_SEED, clock=lambda: clock[0])
+    sims = [new_simulation(), new_simulation()]
+    sessions = [
+        RollbackSession(sim, side, endpoint, input_delay=delay, max_rollback=max_rollback)
+        for side, (sim, endpoint) in enumerate(zip(sims, network.endpoints()))
+    ]
+    for session in sessions:
+        session.stats = RollbackStats(history=None)
+    # Entrées locales enregistrées par chaque machine (la n-ième sert au frame n + delay)
+    registered = [0, 0]
+    target = frames + delay
+    ticks = 0
+    while min(sim.frame for sim in sims) < target and ticks < frames * MAX_TICKS_PER_FRAME:
+        clock[0] += SIM_STEP_MS
+        ticks += 1
+        for side, (sim, session) in enumerate(zip(sims, sessions)):
+            if sim.frame >= target:
+                session.poll()
+                continue
+            played = registered[side]
+            inputs = session.advance(scripted_input(side, played) if played < frames else NEUTRAL_INPUT)
+            if inputs is not None:
+                registered[side] += 1
+                sim.step(inputs)
+    # Dernières entrées en route : on les laisse arriver (rollback éventuel) sans avancer
+    for _ in range(DRAIN_TICKS):
+        if all(s.confirmed_frame >= target - 1 for s in sessions):
+            break
+        clock[0] += SIM_STEP_MS
+        for session in sessions:
+            session.poll()
+
+    t0 = time.perf_counter()
+    for _ in range(100):
+        capture(sims[0])
+    capture_us = (time.perf_counter() - t0) * 1e6 / 100
+    reference = offline_checksum(target, delay)
+    peers = [checksum(sim) for sim in sims]
+    return {
+        "frames": target,
+        "ticks": ticks,
+        "latency_ms": latency,
+        "jitter_ms": jitter,
+        "loss": loss,
+        "input_delay": delay,
+        "max_rollback": max_rollback,
+        "packets": {"sent": network.sent_packets, "lost": network.lost_packets},
+        "capture_us": round(capture_us, 2),
+        "in_sync": peers[0] == peers[1],
+        "matches_offline": peers[0] == reference and peers[1] == reference,
+        "peers": [
+            {
+                "frame": sim.frame,
+                "rollbacks": s.stats.rollbacks,
+                "mispredictions": s.stats.mispredictions,
+                "resimulated_frames": s.stats.resimulated_frames,
+                "stalls": s.stats.stalls,
+                "max_depth": max(s.stats.rollback_depths, default=0),
+                "rollback_ms": summarize(list(s.stats.rollback_ms)),
+            }
+            for sim, s in zip(sims, sessions)
+        ],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark du rollback sur réseau simulé (JSON sur stdout).")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--latency", type=float, default=60.0, help="latence aller simple (ms)")
+    parser.add_argument("--jitter", type=float, default=15.0, help="gigue ± (ms)")
+    parser.add_argument("--loss", type=float, default=0.05, help="probabilité de perte d'un paquet")
+    parser.add_argument("--delay", type=int, default=NET_INPUT_DELAY, help="retard d'entrée local (frames)")
+    parser.add_argument("--max-rollback", type=int, default=NET_MAX_ROLLBACK)
+    parser.add_argument("--output", help="écrit aussi le JSON dans ce fichier")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "rollback": run(args.frames, args.latency, args.jitter, args.loss, args.delay, args.max_rollback),
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    pygame.quit()
+    return 0 if report["rollback"]["matches_offline"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,7 +13,15 @@ from .knockback import (
 )
 from .hitstun import compute_hitstun_frames
 from .attack import resolve_hit, HitResult, VictimStats, ActiveAttack, get_active_hitboxes
-from .attacks_data import ATTACKS, get_attack_hitboxes, AttackType, ATTACK_IDS_PROJECTILE
+from .attacks_data import (
+    ATTACKS,
+    get_attack_hitboxes,
+    get_attack_table,
+    AttackTable,
+    ATTACK_INDEX,
+    AttackType,
+    ATTACK_IDS_PROJECTILE,
+)
 from .projectile_sprite import ProjectileSprite
 
 __all__ = [
@@ -36,6 +44,9 @@ __all__ = [
     "get_active_hitboxes",
     "ATTACKS",
     "get_attack_hitboxes",
+    "get_attack_table",
+    "AttackTable",
+    "ATTACK_INDEX",
     "AttackType",
     "ATTACK_IDS_PROJECTILE",
     "ProjectileSprite",
@@ -5,16 +5,23 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 from .hitbox import Hitbox, HitboxType
 from .knockback import (
     compute_knockback,
+    compute_knockback_batch,
     apply_directional_influence,
+    apply_directional_influence_batch,
     apply_gravity_modifier_tumble,
+    apply_gravity_modifier_tumble_batch,
     causes_tumble,
     compute_rage_mult,
+    compute_rage_mult_batch,
     KnockbackResult,
+    TUMBLE_THRESHOLD,
 )
-from .hitstun import compute_hitstun_frames
+from .hitstun import compute_hitstun_frames, compute_hitstun_frames_batch
 
 
 class VictimStats:
@@ -122,6 +129,105 @@ def resolve_hit(
     )
 
 
+class HitboxArrays:
+    """Paramètres de plusieurs hitbox en tableaux NumPy (un élément par hitbox), pour resolve_hit_batch."""
+
+    def __init__(self, hitboxes):
+        hitboxes = list(hitboxes)
+        self.damage = np.array([h.damage for h in hitboxes], dtype=np.float64)
+        self.base_knockback = np.array([h.base_knockback for h in hitboxes], dtype=np.float64)
+        self.knockback_scaling = np.array([h.knockback_scaling for h in hitboxes], dtype=np.float64)
+        self.angle_deg = np.array([h.angle_deg for h in hitboxes], dtype=np.float64)
+        self.set_knockback = np.array([h.hitbox_type == HitboxType.SET_KNOCKBACK for h in hitboxes], dtype=np.bool_)
+        self.set_knockback_p = np.array([h.set_knockback_val or 10.0 for h in hitboxes], dtype=np.float64)
+        self.weight_independent = np.array([h.weight_independent for h in hitboxes], dtype=np.bool_)
+        self.hitstun_modifier = np.array([h.hitstun_modifier for h in hitboxes], dtype=np.int64)
+        self.no_knockback = np.array([h.hitbox_type == HitboxType.NO_KNOCKBACK for h in hitboxes], dtype=np.bool_)
+
+    def take(self, index):
+        """Copie réindexée (index : tableau d'indices de hitbox, un par cas à résoudre)."""
+        taken = HitboxArrays(())
+        for name, values in vars(self).items():
+            setattr(taken, name, values[index])
+        return taken
+
+
+class HitResultBatch:
+    """Équivalent de HitResult en tableaux ; landed = False là où resolve_hit renverrait None."""
+
+    def __init__(self, landed, damage_dealt, knockback_units, hitstun_frames, tumble, velocity_x, velocity_y):
+        self.landed = landed
+        self.damage_dealt = damage_dealt
+        self.knockback_units = knockback_units
+        self.hitstun_frames = hitstun_frames
+        self.tumble = tumble
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+
+
+def resolve_hit_batch(
+    hitboxes: HitboxArrays,
+    victim_percent,
+    victim_weight,
+    attacker_facing_right=True,
+    *,
+    crouch_cancel=1.0,
+    launch_rate=1.0,
+    rage_mult=1.0,
+    di_angle_rad=np.nan,
+    di_strength: float = 0.18,
+    hitstun_style: str = "ultimate",
+    attacker_percent=0.0,
+    victim_gravity=0.05,
+    stale_damage_mult=1.0,
+) -> HitResultBatch:
+    """
+    resolve_hit sur des tableaux diffusables (hitboxes, pourcentage, poids, DI...) : même calcul, élément par
+    élément. di_angle_rad NaN = pas de DI.
+    """
+    damage_dealt = hitboxes.damage * stale_damage_mult
+    units, _, angle_rad, vx, vy = compute_knockback_batch(
+        victim_percent + damage_dealt,
+        damage_dealt,
+        victim_weight,
+        hitboxes.base_knockback,
+        hitboxes.knockback_scaling,
+        hitboxes.angle_deg,
+        set_knockback=hitboxes.set_knockback,
+        set_knockback_p=hitboxes.set_knockback_p,
+        weight_independent=hitboxes.weight_independent,
+        launch_rate=launch_rate,
+        rage_mult=rage_mult * compute_rage_mult_batch(attacker_percent),
+        crouch_cancel=crouch_cancel,
+    )
+
+    vx = np.where(attacker_facing_right, vx, -vx)
+    angle_rad = np.where(attacker_facing_right, angle_rad, math.pi - angle_rad)
+
+    tumble = units >= TUMBLE_THRESHOLD
+    tvx, tvy = apply_gravity_modifier_tumble_batch(vx, vy, victim_gravity)
+    vx, vy = np.where(tumble, tvx, vx), np.where(tumble, tvy, vy)
+    vx, vy = apply_directional_influence_batch(vx, vy, angle_rad, di_angle_rad, di_strength)
+
+    hitstun = compute_hitstun_frames_batch(
+        units,
+        style=hitstun_style,
+        hitstun_modifier=hitboxes.hitstun_modifier,
+        sent_tumbling=tumble,
+        electric_attack=False,
+    )
+    shape = np.broadcast(units, vx, vy, hitstun).shape
+    return HitResultBatch(
+        landed=np.broadcast_to(~hitboxes.no_knockback, shape),
+        damage_dealt=np.broadcast_to(damage_dealt, shape),
+        knockback_units=np.broadcast_to(units, shape),
+        hitstun_frames=np.broadcast_to(hitstun, shape),
+        tumble=np.broadcast_to(tumble, shape),
+        velocity_x=np.broadcast_to(vx, shape),
+        velocity_y=np.broadcast_to(vy, shape),
+    )
+
+
 class ActiveAttack:
     def __init__(
         self,
@@ -354,12 +354,63 @@ def get_projectile_hitbox() -> Hitbox:
     return _projectile_hitbox()
 
 
+# Frames de récupération après la dernière hitbox active (fin de l'attaque)
+ATTACK_RECOVERY_FRAMES = 15
+SMASH_BUILDERS = {
+    "fsmash": _forward_smash_hitbox,
+    "usmash": _up_smash_hitbox,
+    "dsmash": _down_smash_hitbox,
+}
+# Pas de quantification de la charge des smash : une table compilée (en cache) par palier
+CHARGE_BUCKET = 0.05
+
+
+class AttackTable:
+    """
+    Attaque compilée une fois, partagée par toutes ses HitboxSprite (à ne pas modifier) : index (id interné),
+    hitboxes, total_frames, reach (demi-étendue x, y des hitbox autour du centre de l'attaquant) et
+    frames[f] = tuple des hitboxes actives au frame f.
+    """
+
+    __slots__ = ("attack_id", "index", "hitboxes", "total_frames", "reach", "frames")
+
+    def __init__(self, attack_id: str, index: int, hitboxes):
+        hitboxes = tuple(hitboxes)
+        self.attack_id = attack_id
+        self.index = index
+        self.hitboxes = hitboxes
+        self.total_frames = max(h.frame_end for h in hitboxes) + ATTACK_RECOVERY_FRAMES if hitboxes else 1
+        self.reach = (
+            max((abs(h.offset_x) + h.width / 2 for h in hitboxes), default=0),
+            max((abs(h.offset_y) + h.height / 2 for h in hitboxes), default=0),
+        )
+        self.frames = tuple(
+            tuple(h for h in hitboxes if h.is_active(frame)) for frame in range(self.total_frames)
+        )
+
+
+# Ids internés : ATTACK_INDEX[attack_id] -> petit entier, ATTACK_TABLES[index] -> table compilée (charge 1.0)
+ATTACK_NAMES = tuple(ATTACKS)
+ATTACK_INDEX = {attack_id: i for i, attack_id in enumerate(ATTACK_NAMES)}
+ATTACK_TABLES = tuple(AttackTable(attack_id, i, ATTACKS[attack_id]) for i, attack_id in enumerate(ATTACK_NAMES))
+_EMPTY_TABLE = AttackTable("", -1, ())
+_charged_tables = {}
+
+
+def get_attack_table(attack_id: str, charge_mult: float = 1.0) -> AttackTable:
+    """Table compilée de attack_id (table vide si inconnu) ; smash chargé : palier de CHARGE_BUCKET le plus proche."""
+    index = ATTACK_INDEX.get(attack_id)
+    if index is None:
+        return _EMPTY_TABLE
+    if charge_mult == 1.0 or attack_id not in SMASH_BUILDERS:
+        return ATTACK_TABLES[index]
+    bucket = round(charge_mult / CHARGE_BUCKET)
+    table = _charged_tables.get((index, bucket))
+    if table is None:
+        table = AttackTable(attack_id, index, SMASH_BUILDERS[attack_id](bucket * CHARGE_BUCKET))
+        _charged_tables[(index, bucket)] = table
+    return table
+
+
 def get_attack_hitboxes(attack_id: str, charge_mult: float = 1.0) -> list[Hitbox]:
-    if attack_id in ("fsmash", "usmash", "dsmash"):
-        builders = {
-            "fsmash": _forward_smash_hitbox,
-            "usmash": _up_smash_hitbox,
-            "dsmash": _down_smash_hitbox,
-        }
-        return builders[attack_id](charge_mult)
-    return list(ATTACKS.get(attack_id, []))
+    return list(get_attack_table(attack_id, charge_mult).hitboxes)
@@ -3,14 +3,12 @@ Sprite d’hitbox mêlée : suit l’attaquant, teste collision avec hurtbox, ap
 Gère invincibilité et super dégâts (triches).
 """
 import math
-import os
 import pygame
-from .attacks_data import get_attack_hitboxes
+from game.sound_bank import get_sound_bank
+from .attacks_data import get_attack_table
 from .attack import (
     resolve_hit,
-    get_active_hitboxes,
     check_hitbox_vs_circle,
-    ActiveAttack,
     VictimStats,
     HitResult,
 )
@@ -21,57 +19,26 @@ COUNTER_DAMAGE = 6
 COUNTER_HITSTUN = 18
 COUNTER_LAUNCH_SPEED = 4
 
-_base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-_melee_attack_sound = None
-
-def _get_melee_attack_sound():
-    global _melee_attack_sound
-    if _melee_attack_sound is None:
-        path = os.path.join(_base_dir, "assets", "song", "combat", "body to body", "aerial-attack.wav")
-        try:
-            _melee_attack_sound = pygame.mixer.Sound(path)
-        except Exception:
-            _melee_attack_sound = False
-    return _melee_attack_sound if _melee_attack_sound else None
-
-_counter_sound = None
-
-def _get_counter_sound():
-    global _counter_sound
-    if _counter_sound is None:
-        path = os.path.join(_base_dir, "assets", "song", "combat", "counter", "dash-attack.wav")
-        try:
-            _counter_sound = pygame.mixer.Sound(path)
-        except Exception:
-            _counter_sound = False
-    return _counter_sound if _counter_sound else None
-
-
 class HitboxSprite(pygame.sprite.Sprite):
 
     def __init__(self, owner, attack_id: str, charge_mult: float = 1.0):
         super().__init__()
         self.owner = owner
         self.attack_id = attack_id
-        self.hitboxes = get_attack_hitboxes(attack_id, charge_mult)
-        if not self.hitboxes:
-            self.total_frames = 1
-        else:
-            self.total_frames = max(h.frame_end for h in self.hitboxes) + 15
+        # Table compilée à l'import (attacks_data) : hitboxes actives par frame, rien à recalculer par tick
+        self.table = get_attack_table(attack_id, charge_mult)
+        self.hitboxes = self.table.hitboxes
+        self.total_frames = self.table.total_frames
         self.current_frame = 0
         self.hit_this_attack = set()
+        # Demi-étendue (x, y) de toutes les hitbox de l'attaque autour du centre de l'attaquant, hurtbox comprise
+        self._reach = (self.table.reach[0] + HURTBOX_RADIUS, self.table.reach[1] + HURTBOX_RADIUS)
 
         self.image = pygame.Surface((1, 1))
         self.image.set_alpha(0)
         self.rect = self.image.get_rect(center=getattr(owner, "rect", pygame.Rect(0, 0, 50, 50)).center)
         self.debug_draw = True
-        snd = _get_melee_attack_sound()
-        if snd is not None:
-            try:
-                snd.set_volume(0.35)
-                snd.play()
-            except Exception:
-                pass
+        get_sound_bank().play("melee_attack")
 
     def _owner_center(self):
         r = getattr(self.owner, "rect", None)
@@ -82,20 +49,18 @@ class HitboxSprite(pygame.sprite.Sprite):
     def _owner_facing_right(self) -> bool:
         return getattr(self.owner, "facing_right", True)
 
+    def reach_rect(self) -> pygame.Rect:
+        """Zone (monde) où une hitbox de l'attaque peut toucher un centre de victime : requête broadphase."""
+        rx, ry = self._reach
+        ox, oy = self._owner_center()
+        return pygame.Rect(int(ox - rx), int(oy - ry), int(2 * rx) + 1, int(2 * ry) + 1)
+
     def update(self, potential_victims=None):
         potential_victims = potential_victims or []
         ox, oy = self._owner_center()
         facing_right = self._owner_facing_right()
-
-        active = get_active_hitboxes(
-            ActiveAttack(
-                attack_id=self.attack_id,
-                current_frame=self.current_frame,
-                total_frames=self.total_frames,
-                hitboxes=self.hitboxes,
-                hit_this_attack=self.hit_this_attack,
-            )
-        )
+        sign = 1 if facing_right else -1
+        active = self.table.frames[self.current_frame]
 
         for victim in potential_victims:
             if victim is self.owner:
@@ -104,20 +69,19 @@ class HitboxSprite(pygame.sprite.Sprite):
                 continue
             if getattr(victim, "respawn_invuln", 0) > 0:
                 continue
-            if getattr(victim, "cheat_invincible_until", 0) > pygame.time.get_ticks():
+            if getattr(victim, "cheat_invincible_until", 0) > getattr(victim, "clock_ms", 0):
                 continue
             vx, vy = victim.rect.centerx, victim.rect.centery
 
             for hb in active:
-                if (id(victim), id(hb)) in self.hit_this_attack:
-                    continue
-                sign = 1 if facing_right else -1
                 hb_wx = ox + hb.offset_x * sign
                 hb_wy = oy + hb.offset_y
                 if not check_hitbox_vs_circle(
                     hb, hb_wx, hb_wy, vx, vy, HURTBOX_RADIUS, facing_right
                 ):
                     continue
+                if (id(victim), id(hb)) in self.hit_this_attack:
+                    continue
 
                 w = getattr(victim.stats, "weight", 1.0)
                 crouch_cancel = victim.CROUCH_CANCEL_MULT if getattr(victim, "crouching", False) else 1.0
@@ -129,7 +93,7 @@ class HitboxSprite(pygame.sprite.Sprite):
                 attacker_percent = getattr(self.owner.stats, "percent", 0)
                 victim_gravity = getattr(victim, "gravity_for_kb", 0.05)
                 stale_mult = self.owner.get_stale_damage_mult(self.attack_id) if hasattr(self.owner, "get_stale_damage_mult") else 1.0
-                if getattr(self.owner, "cheat_super_damage_until", 0) > pygame.time.get_ticks():
+                if getattr(self.owner, "cheat_super_damage_until", 0) > getattr(self.owner, "clock_ms", 0):
                     stale_mult *= 5
                 di_angle = victim.get_di_angle_rad() if hasattr(victim, "get_di_angle_rad") else None
                 result = resolve_hit(
@@ -147,13 +111,7 @@ class HitboxSprite(pygame.sprite.Sprite):
                     counter_remaining = getattr(victim, "_counter_remaining", 0)
                     if counter_remaining > 0:
                         victim._counter_remaining = 0
-                        snd = _get_counter_sound()
-                        if snd is not None:
-                            try:
-                                snd.set_volume(0.4)
-                                snd.play()
-                            except Exception:
-                                pass
+                        get_sound_bank().play("counter")
                         ax, ay = self.owner.rect.centerx, self.owner.rect.centery
                         dx = ax - vx
                         dy = ay - vy
@@ -188,15 +146,8 @@ class HitboxSprite(pygame.sprite.Sprite):
             return
         ox, oy = self._owner_center()
         sign = 1 if self._owner_facing_right() else -1
-        active = get_active_hitboxes(
-            ActiveAttack(
-                attack_id=self.attack_id,
-                current_frame=self.current_frame,
-                total_frames=self.total_frames,
-                hitboxes=self.hitboxes,
-                hit_this_attack=self.hit_this_attack,
-            )
-        )
+        frames = self.table.frames
+        active = frames[self.current_frame] if self.current_frame < len(frames) else ()
         for hb in active:
             hx = ox + hb.offset_x * sign
             hy = oy + hb.offset_y
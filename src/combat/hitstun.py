@@ -1,6 +1,8 @@
 """
 Calcul des frames de hitstun selon le knockback et le style (melee, 64, smash4, ultimate).
 """
+import numpy as np
+
 HITSTUN_MULTIPLIER_MELEE = 0.4
 HITSTUN_MULTIPLIER_64 = 0.533
 HITSTUN_FRAME_SUBTRACT = 1
@@ -33,5 +35,26 @@ def compute_hitstun_frames(
     return max(MIN_HITSTUN_FLINCH, frames)
 
 
+def compute_hitstun_frames_batch(
+    knockback_units,
+    *,
+    style: str = "melee",
+    hitstun_modifier=0,
+    sent_tumbling=False,
+    electric_attack=False,
+):
+    """compute_hitstun_frames sur des tableaux (style commun à tous les éléments) ; renvoie des entiers int64."""
+    multiplier = HITSTUN_MULTIPLIER_64 if style == "64" else HITSTUN_MULTIPLIER_MELEE
+    frames = knockback_units * multiplier
+    if style == "smash4" or style == "ultimate":
+        frames = frames - HITSTUN_FRAME_SUBTRACT
+        if style == "smash4":
+            frames = frames + np.where(np.logical_or(sent_tumbling, electric_attack), 1, 0)
+
+    frames = np.floor(np.maximum(0, frames)).astype(np.int64) + hitstun_modifier
+    frames = np.maximum(MIN_HITSTUN_FLINCH, frames)
+    return np.where(knockback_units <= 0, np.maximum(MIN_HITSTUN_FLINCH, hitstun_modifier), frames)
+
+
 def get_hitstun_style_options() -> list[str]:
     return ["melee", "64", "smash4", "ultimate"]
@@ -1,7 +1,9 @@
 """
 Calcul du knockback (vitesse de lancement, angle) selon pourcentage, poids, rage, etc.
+Les fonctions *_batch font le même calcul sur des tableaux NumPy (un élément par cas : outils d'équilibrage).
 """
 import math
+import numpy as np
 
 LAUNCH_SPEED_FACTOR = 0.03
 KNOCKBACK_DECAY = 0.051
@@ -74,6 +76,39 @@ def compute_knockback(
     )
 
 
+def compute_knockback_batch(
+    victim_percent_after_hit,
+    damage_dealt,
+    victim_weight,
+    base_knockback,
+    knockback_scaling,
+    angle_deg,
+    *,
+    set_knockback=False,
+    set_knockback_p=10.0,
+    weight_independent=False,
+    launch_rate=1.0,
+    rage_mult=1.0,
+    crouch_cancel=1.0,
+):
+    """
+    compute_knockback sur des tableaux (ou scalaires) diffusables entre eux.
+    Renvoie (knockback_units, launch_speed, angle_rad, velocity_x, velocity_y), des tableaux.
+    """
+    p = np.where(set_knockback, set_knockback_p, victim_percent_after_hit)
+    d = np.where(set_knockback, set_knockback_p, damage_dealt)
+    w = np.where(weight_independent, WEIGHT_DEFAULT_KB, victim_weight)
+
+    damage_term = (p / 10.0) + (p * d / 20.0)
+    weight_factor = 200.0 / (w + 100.0)
+    knockback_units = ((damage_term * weight_factor * 1.4 + 18.0) * knockback_scaling) + base_knockback
+    knockback_units = np.maximum(0.0, knockback_units * (launch_rate * rage_mult * crouch_cancel))
+
+    launch_speed = knockback_units * LAUNCH_SPEED_FACTOR
+    angle_rad = np.radians(angle_deg) + np.zeros_like(launch_speed)
+    return knockback_units, launch_speed, angle_rad, launch_speed * np.cos(angle_rad), launch_speed * np.sin(angle_rad)
+
+
 def apply_directional_influence(
     velocity_x: float,
     velocity_y: float,
@@ -92,6 +127,17 @@ def apply_directional_influence(
     )
 
 
+def apply_directional_influence_batch(velocity_x, velocity_y, original_angle_rad, di_angle_rad, di_strength=1.0):
+    """apply_directional_influence sur des tableaux ; di_angle_rad NaN = pas de DI (None en scalaire)."""
+    speed = np.hypot(velocity_x, velocity_y)
+    apply = ~np.isnan(di_angle_rad) & (speed > 0)
+    new_angle = original_angle_rad + (di_angle_rad - original_angle_rad) * di_strength
+    return (
+        np.where(apply, speed * np.cos(new_angle), velocity_x),
+        np.where(apply, speed * np.sin(new_angle), velocity_y),
+    )
+
+
 def decay_launch_speed(current_vx: float, current_vy: float) -> tuple[float, float]:
     speed = math.hypot(current_vx, current_vy)
     if speed <= 0:
@@ -123,6 +169,12 @@ def apply_gravity_modifier_tumble(
     return velocity_x, velocity_y * factor
 
 
+def apply_gravity_modifier_tumble_batch(velocity_x, velocity_y, victim_gravity):
+    """apply_gravity_modifier_tumble sur des tableaux."""
+    factor = np.clip(1.0 + (victim_gravity - 0.075) * 5.0, 0.5, 1.5)
+    return velocity_x, np.where(victim_gravity <= 0, velocity_y, velocity_y * factor)
+
+
 def compute_rage_mult(attacker_percent: float, rage_start: float = 35.0, rage_cap: float = 150.0, rage_max_mult: float = 1.1) -> float:
     """
     Ultimate: rage entre 35% et 150% → mult 1.0 à 1.1.
@@ -132,3 +184,9 @@ def compute_rage_mult(attacker_percent: float, rage_start: float = 35.0, rage_ca
     t = (attacker_percent - rage_start) / (rage_cap - rage_start)
     t = min(1.0, max(0.0, t))
     return 1.0 + t * (rage_max_mult - 1.0)
+
+
+def compute_rage_mult_batch(attacker_percent, rage_start: float = 35.0, rage_cap: float = 150.0, rage_max_mult: float = 1.1):
+    """compute_rage_mult sur un tableau de pourcentages de l'attaquant."""
+    t = np.clip((attacker_percent - rage_start) / (rage_cap - rage_start), 0.0, 1.0)
+    return np.where(attacker_percent < rage_start, 1.0, 1.0 + t * (rage_max_mult - 1.0))
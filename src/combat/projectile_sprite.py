@@ -5,6 +5,7 @@ Respecte cheat_invincible_until et cheat_super_damage_until.
 import math
 import os
 import pygame
+from game.sound_bank import get_sound_bank
 from .attacks_data import get_projectile_hitbox
 from .attack import (
     resolve_hit,
@@ -26,30 +27,6 @@ PROJECTILE_CARROT_SIZE = 90
 _base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _judy_projectile_path = os.path.join(_base_dir, "assets", "JUDY_HOPPS", "munition", "munition.png")
 _nick_projectile_path = os.path.join(_base_dir, "assets", "Nick", "munition_nick", "munition.png")
-_distance_attack_sound = None
-
-def _get_distance_attack_sound():
-    global _distance_attack_sound
-    if _distance_attack_sound is None:
-        path = os.path.join(_base_dir, "assets", "song", "combat", "distance_attack", "tilt-attack.wav")
-        try:
-            _distance_attack_sound = pygame.mixer.Sound(path)
-        except Exception:
-            _distance_attack_sound = False
-    return _distance_attack_sound if _distance_attack_sound else None
-
-_counter_sound = None
-
-def _get_counter_sound():
-    global _counter_sound
-    if _counter_sound is None:
-        path = os.path.join(_base_dir, "assets", "song", "combat", "counter", "dash-attack.wav")
-        try:
-            _counter_sound = pygame.mixer.Sound(path)
-        except Exception:
-            _counter_sound = False
-    return _counter_sound if _counter_sound else None
-
 _judy_projectile_image = None
 _nick_projectile_image = None
 
@@ -115,13 +92,14 @@ class ProjectileSprite(pygame.sprite.Sprite):
 
         self.rect = self.image.get_rect(center=(start_x, start_y))
         hitboxes_group.add(self)
-        snd = _get_distance_attack_sound()
-        if snd is not None:
-            try:
-                snd.set_volume(0.35)
-                snd.play()
-            except Exception:
-                pass
+        get_sound_bank().play("distance_attack")
+
+    def reach_rect(self) -> pygame.Rect:
+        """Zone (monde) du prochain update (après déplacement) où un centre de victime peut être touché."""
+        moved = self.rect.move(int(self.velocity_x), int(self.velocity_y))
+        reach = pygame.Rect(0, 0, int(self.hitbox.width) + 2 * HURTBOX_RADIUS, int(self.hitbox.height) + 2 * HURTBOX_RADIUS)
+        reach.center = moved.center
+        return reach
 
     def update(self, potential_victims=None):
         potential_victims = potential_victims or []
@@ -141,7 +119,7 @@ class ProjectileSprite(pygame.sprite.Sprite):
                 continue
             if getattr(victim, "respawn_invuln", 0) > 0:
                 continue
-            if getattr(victim, "cheat_invincible_until", 0) > pygame.time.get_ticks():
+            if getattr(victim, "cheat_invincible_until", 0) > getattr(victim, "clock_ms", 0):
                 continue
             if getattr(victim, "lives", 1) <= 0:
                 continue
@@ -162,7 +140,7 @@ class ProjectileSprite(pygame.sprite.Sprite):
             attacker_percent = getattr(self.owner.stats, "percent", 0)
             victim_gravity = getattr(victim, "gravity_for_kb", 0.05)
             stale_mult = self.owner.get_stale_damage_mult("neutral_special") if hasattr(self.owner, "get_stale_damage_mult") else 1.0
-            if getattr(self.owner, "cheat_super_damage_until", 0) > pygame.time.get_ticks():
+            if getattr(self.owner, "cheat_super_damage_until", 0) > getattr(self.owner, "clock_ms", 0):
                 stale_mult *= 5
             di_angle = victim.get_di_angle_rad() if hasattr(victim, "get_di_angle_rad") else None
             result = resolve_hit(
@@ -180,13 +158,7 @@ class ProjectileSprite(pygame.sprite.Sprite):
                 counter_remaining = getattr(victim, "_counter_remaining", 0)
                 if counter_remaining > 0:
                     victim._counter_remaining = 0
-                    snd = _get_counter_sound()
-                    if snd is not None:
-                        try:
-                            snd.set_volume(0.4)
-                            snd.play()
-                        except Exception:
-                            pass
+                    get_sound_bank().play("counter")
                     ax, ay = self.owner.rect.centerx, self.owner.rect.centery
                     dx = ax - vx
                     dy = ay - vy
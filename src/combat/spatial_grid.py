@@ -0,0 +1,98 @@
+"""
+Broadphase par grille uniforme (hash spatial) : chaque entité est rangée dans les cellules que couvre son rect,
+une requête ne regarde que les cellules de la zone demandée. Coût d'une requête indépendant du nombre total
+d'entités (plateformes, joueurs) ; le test précis (colliderect, hitbox vs cercle) reste chez l'appelant.
+Les résultats sont rendus dans l'ordre d'insertion, pour que la résolution des collisions reste déterministe.
+"""
+import pygame
+
+# Côté d'une cellule (px monde) : de l'ordre d'un perso / d'une petite plateforme
+DEFAULT_CELL_SIZE = 256
+
+
+class SpatialGrid:
+    """insert(item, rect), move(item, rect), query(rect) -> items dont le rect touche rect, ordre d'insertion."""
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}
+        # item -> (ordre d'insertion, rect au moment de l'insertion / du dernier move, cellules occupées)
+        self._entries = {}
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+        self._counter = 0
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (
+            rect.left // cs, (rect.right - 1) // cs,
+            rect.top // cs, (rect.bottom - 1) // cs,
+        )
+
+    def _keys(self, rect):
+        x0, x1, y0, y1 = self._cell_range(rect)
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, item, rect):
+        rect = pygame.Rect(rect)
+        keys = self._keys(rect)
+        self._entries[item] = (self._counter, rect, keys)
+        self._counter += 1
+        for key in keys:
+            self._cells.setdefault(key, []).append(item)
+
+    def remove(self, item):
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return
+        for key in entry[2]:
+            bucket = self._cells[key]
+            bucket.remove(item)
+            if not bucket:
+                del self._cells[key]
+
+    def move(self, item, rect):
+        """Met à jour le rect d'un item déjà inséré (garde son rang d'insertion)."""
+        order, _, old_keys = self._entries[item]
+        rect = pygame.Rect(rect)
+        keys = self._keys(rect)
+        if keys != old_keys:
+            for key in old_keys:
+                bucket = self._cells[key]
+                bucket.remove(item)
+                if not bucket:
+                    del self._cells[key]
+            for key in keys:
+                self._cells.setdefault(key, []).append(item)
+        self._entries[item] = (order, rect, keys)
+
+    def query(self, rect, exclude=None):
+        """Items (sauf exclude) dont le rect chevauche rect, dans l'ordre d'insertion."""
+        rect = pygame.Rect(rect)
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self._cells
+        entries = self._entries
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for item in bucket:
+                    if item is exclude or item in found:
+                        continue
+                    order, item_rect, _ = entries[item]
+                    if rect.colliderect(item_rect):
+                        found[item] = order
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=found.__getitem__)
@@ -0,0 +1,43 @@
+"""
+Collision balayée (swept AABB) : instant de premier contact d'un rect qui se déplace pendant le tick contre
+un rect immobile. Un lancer rapide (knockback × KNOCKBACK_SCALE) peut traverser une plateforme ou un
+joueur en un seul tick ; le balayage le détecte sans découper le tick en sous-pas.
+"""
+import math
+
+
+def _axis_times(start_min, start_max, delta, target_min, target_max):
+    """(entrée, sortie) sur un axe, en fraction du tick ; infinies si pas de mouvement et déjà alignés, None sinon."""
+    if delta > 0:
+        return (target_min - start_max) / delta, (target_max - start_min) / delta
+    if delta < 0:
+        return (target_max - start_min) / delta, (target_min - start_max) / delta
+    if start_max <= target_min or start_min >= target_max:
+        return None
+    return -math.inf, math.inf
+
+
+def sweep_rect(start, dx: int, dy: int, target):
+    """
+    Premier contact de start déplacé de (dx, dy) contre target : (t, axe) avec t dans [0, 1] et axe "x" ou "y"
+    (la face touchée), ou None. Des rects qui se chevauchent déjà au départ ou ne font que se frôler ne
+    comptent pas (le test de chevauchement habituel s'en charge).
+    """
+    x_times = _axis_times(start.left, start.right, dx, target.left, target.right)
+    if x_times is None:
+        return None
+    y_times = _axis_times(start.top, start.bottom, dy, target.top, target.bottom)
+    if y_times is None:
+        return None
+    entry = max(x_times[0], y_times[0])
+    leave = min(x_times[1], y_times[1])
+    if entry >= leave or entry < 0 or entry > 1:
+        return None
+    return entry, ("x" if x_times[0] > y_times[0] else "y")
+
+
+def contact_position(rect, dx: int, dy: int, target, axis: str):
+    """Position (x, y) de rect (fin du tick) ramené au contact de target sur l'axe touché, l'autre axe inchangé."""
+    if axis == "x":
+        return (target.left - rect.width if dx > 0 else target.right), rect.y
+    return rect.x, (target.top - rect.height if dy > 0 else target.bottom)
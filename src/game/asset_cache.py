@@ -0,0 +1,190 @@
+"""
+Cache disque des images mises à l'échelle : pixels prêts à l'affichage, clé = hash du fichier source +
+taille cible + mode (lissage, alpha / colorkey). Au lancement suivant, une seule lecture du fichier
+cache remplace décodage PNG/JPG + smoothscale. Une source modifiée (taille / date) est re-hachée ;
+son nouveau hash ne correspond à aucune entrée, elle est reconstruite et les anciennes supprimées.
+"""
+import hashlib
+import json
+import os
+import struct
+import threading
+import pygame
+
+CACHE_DIR_NAME = ".asset_cache"
+INDEX_FILE = "index.json"
+# Entrée : magic, largeur, hauteur, format pygame ("RGBA"/"RGB\0"), colorkey présente, colorkey RGB, puis les pixels
+_HEADER = struct.Struct("<4sHH4sB3B")
+_MAGIC = b"SMC1"
+_DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), CACHE_DIR_NAME)
+
+
+def _file_sha1(path) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class AssetCache:
+    """
+    scaled(path, size, ...) : image source mise à l'échelle, depuis le cache si possible.
+    size est un tuple (w, h) ou une fonction (w_source, h_source) -> (w, h) ; source_size(path)
+    donne les dimensions de la source (depuis l'index, sans décodage, quand elles sont connues).
+    Sans écriture possible (dossier en lecture seule), tout marche comme sans cache.
+    """
+
+    def __init__(self, cache_dir: str = _DEFAULT_DIR):
+        self.cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._index = None
+        self._sources = {}
+        self.hits = 0
+        self.misses = 0
+
+    # --- Index : chemin source -> (mtime_ns, taille fichier, sha1, largeur, hauteur) ---
+    # Les dimensions servent aux tailles cibles qui dépendent de la source, sans la décoder quand le cache répond
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with open(os.path.join(self.cache_dir, INDEX_FILE), "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = os.path.join(self.cache_dir, INDEX_FILE + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp, os.path.join(self.cache_dir, INDEX_FILE))
+        except OSError:
+            pass
+
+    def _source_record(self, path):
+        """[mtime_ns, taille, sha1, w, h] à jour pour path (w, h à None tant que la source n'a pas été décodée)."""
+        index = self._load_index()
+        st = os.stat(path)
+        key = os.path.abspath(path)
+        record = index.get(key)
+        if record is None or record[0] != st.st_mtime_ns or record[1] != st.st_size:
+            digest = _file_sha1(path)
+            if record is not None and record[2] != digest:
+                self._drop_entries(record[2])
+            record = [st.st_mtime_ns, st.st_size, digest, None, None]
+            index[key] = record
+            self._save_index()
+        return record
+
+    def _drop_entries(self, digest):
+        try:
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(digest):
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
+
+    def _decoded_source(self, path, record):
+        """Source décodée (gardée jusqu'au scaled() qui suit un source_size())."""
+        surf = self._sources.get(path)
+        if surf is None:
+            surf = pygame.image.load(path)
+            self._sources[path] = surf
+            if record[3] is None:
+                record[3], record[4] = surf.get_size()
+                self._save_index()
+        return surf
+
+    # --- API ---
+
+    def source_size(self, path):
+        with self._lock:
+            record = self._source_record(path)
+            if record[3] is None:
+                self._decoded_source(path, record)
+            return record[3], record[4]
+
+    def scaled(self, path, size, alpha: bool = True, colorkey=None) -> pygame.Surface:
+        """
+        Image path mise à l'échelle (smoothscale) à size, convert_alpha() si alpha, sinon convert()
+        (+ colorkey appliquée avant la mise à l'échelle, comme au chargement direct).
+        Lève les mêmes erreurs que pygame.image.load si la source est absente ou illisible.
+        """
+        with self._lock:
+            record = self._source_record(path)
+            if callable(size):
+                if record[3] is None:
+                    self._decoded_source(path, record)
+                size = size(record[3], record[4])
+            size = (max(1, int(size[0])), max(1, int(size[1])))
+            mode = "a" if alpha else ("k%02x%02x%02x" % tuple(colorkey[:3]) if colorkey is not None else "o")
+            entry = os.path.join(self.cache_dir, f"{record[2]}_{size[0]}x{size[1]}_smooth_{mode}.bin")
+            surf = self._read_entry(entry, size)
+            if surf is not None:
+                self._sources.pop(path, None)
+                self.hits += 1
+                return surf
+            self.misses += 1
+            source = self._decoded_source(path, record)
+            self._sources.pop(path, None)
+        if alpha:
+            source = source.convert_alpha()
+        else:
+            source = source.convert()
+            if colorkey is not None:
+                source.set_colorkey(colorkey)
+        surf = pygame.transform.smoothscale(source, size)
+        self._write_entry(entry, surf)
+        return surf
+
+    def _read_entry(self, entry, size):
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, w, h, fmt, has_key, kr, kg, kb = _HEADER.unpack_from(data)
+        fmt = fmt.rstrip(b"\0").decode("ascii")
+        if magic != _MAGIC or (w, h) != size or len(data) - _HEADER.size != w * h * len(fmt):
+            return None
+        surf = pygame.image.frombuffer(memoryview(data)[_HEADER.size:], (w, h), fmt)
+        if fmt == "RGBA":
+            return surf.convert_alpha()
+        surf = surf.convert()
+        if has_key:
+            surf.set_colorkey((kr, kg, kb))
+        return surf
+
+    def _write_entry(self, entry, surf):
+        key = surf.get_colorkey()
+        fmt = "RGBA" if surf.get_flags() & pygame.SRCALPHA else "RGB"
+        header = _HEADER.pack(
+            _MAGIC, surf.get_width(), surf.get_height(), fmt.encode("ascii").ljust(4, b"\0"),
+            1 if key else 0, *((key or (0, 0, 0))[:3]),
+        )
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = entry + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(header)
+                f.write(pygame.image.tobytes(surf, fmt))
+            os.replace(tmp, entry)
+        except OSError:
+            pass
+
+
+_asset_cache = None
+
+
+def get_asset_cache() -> AssetCache:
+    """Cache partagé (assets du jeu et frames des persos), dossier src/.asset_cache."""
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache()
+    return _asset_cache
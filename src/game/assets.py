@@ -1,68 +1,180 @@
 """
 Chargement des assets : cartes, GIFs victoire, HUD (portraits, icônes vies), plateformes, polices, smog, musiques/sons.
+Seuls le menu, la police et les plateformes sont chargés au démarrage ; le reste est groupé par écran
+(ASSET_GROUPS) et chargé au premier accès, ou à l'avance en arrière-plan via preload().
 """
 import os
+import threading
 import pygame
+from game.asset_cache import get_asset_cache
+from game.gif_stream import GifStream
+from game.sound_bank import get_sound_bank
 
-try:
-    from PIL import Image, ImageSequence
-    _HAS_PIL = True
-except ImportError:
-    _HAS_PIL = False
 
-
-def load_gif_frames(path, scale_size=None):
-    """Charge les frames d'un GIF animé. Retourne liste de (Surface, duration_ms)."""
-    if not _HAS_PIL:
-        try:
-            surf = pygame.image.load(path).convert_alpha()
-            if scale_size:
-                surf = pygame.transform.smoothscale(surf, scale_size)
-            return [(surf, 50)]
-        except Exception:
-            return []
-    frames = []
+def load_platform_surfaces(base_dir: str):
+    """Plateformes (Grande / PETITE). Retourne (main_size, main_image, small_size, small_image) ; image None si absente."""
+    plat_dir = os.path.join(base_dir, "assets", "plaform")
+    cache = get_asset_cache()
+    main_w, main_h = 1000, 25
+    small_w, small_h = 220, 18
     try:
-        with Image.open(path) as gif:
-            for frame in ImageSequence.Iterator(gif):
-                f = frame.convert("RGBA")
-                size = f.size
-                data = f.tobytes()
-                surf = pygame.image.frombytes(data, size, "RGBA")
-                surf = surf.convert_alpha()
-                if scale_size:
-                    surf = pygame.transform.smoothscale(surf, scale_size)
-                duration = 50
-                if hasattr(frame, "info") and "duration" in frame.info:
-                    duration = max(20, frame.info["duration"])
-                frames.append((surf, duration))
+        main_image = cache.scaled(
+            os.path.join(plat_dir, "Grande.png"), lambda w, h: (main_w, max(25, int(h * main_w / w))),
+        )
+        main_size = main_image.get_size()
     except Exception:
-        try:
-            surf = pygame.image.load(path).convert_alpha()
-            if scale_size:
-                surf = pygame.transform.smoothscale(surf, scale_size)
-            return [(surf, 50)]
-        except Exception:
-            return []
-    return frames if frames else []
+        main_size = (main_w, 25)
+        main_image = None
+    stretch = 1.12
+    try:
+        small_image = cache.scaled(
+            os.path.join(plat_dir, "PETITE.png"),
+            lambda w, h: (int(small_w * stretch), int(max(18, int(h * small_w / w)) * stretch)),
+        )
+        small_size = small_image.get_size()
+    except Exception:
+        small_size = (small_w, 18)
+        small_image = None
+    return main_size, main_image, small_size, small_image
+
+
+def _preload_character_frames():
+    from player.player import Player
+    for character in ("judy", "nick"):
+        Player.preload_frames(character)
+
+
+# Groupe -> (méthodes de chargement, attributs produits). Un accès à l'un de ces attributs charge le groupe.
+ASSET_GROUPS = {
+    "maps": (("_load_maps",), ("map_surfaces", "map_labels", "background", "map_select_background")),
+    "select_screens": (("_load_select_screens",), ("title_screen", "character_select_background")),
+    "versus_gifs": (
+        ("_load_versus_gifs",),
+        ("versus_gif_frames", "p1_confirm_gif_frames", "enter_gif_frames", "enter_then_a_gif_frames"),
+    ),
+    "win_gifs": (("_load_win_gifs",), ("nick_win_frames", "judy_win_frames")),
+    "combat": (
+        ("_load_counter", "_load_ping", "_load_portraits", "_load_life_icons", "_load_smog"),
+        (
+            "counter_height", "counter_surfaces",
+            "ping_height", "ping_p1", "ping_p2", "ping_offset_above",
+            "portrait_height", "portrait_side_margin", "hud_bottom_y_offset", "judy_portrait", "nick_portrait",
+            "life_icon_size", "life_icon_judy", "life_icon_nick",
+            "smog_display_size", "smog_surfaces",
+        ),
+    ),
+    # Frames des persos (caches de classe de Player), pas d'attribut ici
+    "characters": (("_load_characters",), ()),
+    # Effets sonores (coups, projectiles, voix de victoire), tous chargés d'un coup avant le combat
+    "sounds": (("_load_sounds",), ("sound_bank",)),
+}
+_GROUP_BY_ATTR = {attr: group for group, (_, attrs) in ASSET_GROUPS.items() for attr in attrs}
+
+
+class _StagedLoad:
+    """
+    Cible d'un loader : lit base_dir / tailles sur les assets mais écrit à part ; les attributs
+    ne sont publiés qu'une fois le groupe complet (pas de liste à moitié remplie vue par un autre thread).
+    """
+
+    def __init__(self, assets):
+        object.__setattr__(self, "_assets", assets)
+
+    def __getattr__(self, name):
+        attr = getattr(type(self._assets), name, None)
+        if callable(attr):
+            return attr.__get__(self)
+        return getattr(self._assets, name)
+
+    def published(self):
+        return {k: v for k, v in vars(self).items() if k != "_assets"}
 
 
 class GameAssets:
-    """Contient tous les assets chargés (cartes, GIFs, HUD, counter, etc.)."""
+    """Contient tous les assets (cartes, GIFs, HUD, counter, etc.), chargés par groupe à la demande."""
     def __init__(self, base_dir: str, screen_size: tuple, world_size: tuple):
         self.base_dir = base_dir
         self.screen_w, self.screen_h = screen_size
         self.world_w, self.world_h = world_size
-        self._load_maps()
-        self._load_gifs()
+        self._loaded_groups = set()
+        self._load_lock = threading.RLock()
+        # File du préchargement : verrou à part, jamais tenu pendant un chargement (preload() ne bloque pas)
+        self._pending_lock = threading.Lock()
+        self._pending_groups = []
+        self._preload_thread = None
+        # Groupes dont le préchargement a échoué -> exception ; plus remis en file, à charger sur le thread principal
+        self._failed_groups = {}
         self._load_menu()
-        self._load_counter()
-        self._load_ping()
-        self._load_portraits()
-        self._load_life_icons()
         self._load_font()
         self._load_platforms()
-        self._load_smog()
+
+    def __getattr__(self, name):
+        # Appelé seulement si l'attribut n'existe pas encore : premier accès à un asset d'un groupe non chargé
+        group = _GROUP_BY_ATTR.get(name)
+        if group is None or "_load_lock" not in self.__dict__:
+            raise AttributeError(name)
+        self.load_group(group)
+        return self.__dict__[name]
+
+    def is_loaded(self, *groups) -> bool:
+        return all(g in self._loaded_groups for g in groups)
+
+    def failed_groups(self, *groups) -> list:
+        """Groupes parmi groups dont le préchargement a échoué (load_group les recharge et relance l'erreur)."""
+        return [g for g in groups if g in self._failed_groups]
+
+    def load_group(self, group: str):
+        """Charge un groupe maintenant (attend si le thread de préchargement est déjà dessus)."""
+        if group in self._loaded_groups:
+            return
+        with self._load_lock:
+            if group in self._loaded_groups:
+                return
+            staged = _StagedLoad(self)
+            for method in ASSET_GROUPS[group][0]:
+                getattr(staged, method)()
+            self.__dict__.update(staged.published())
+            self._loaded_groups.add(group)
+            self._failed_groups.pop(group, None)
+
+    def preload(self, *groups):
+        """Charge ces groupes en arrière-plan (un seul thread, dans l'ordre) ; sans effet s'ils sont prêts ou en échec."""
+        missing = [g for g in groups if g not in self._loaded_groups and g not in self._failed_groups]
+        if not missing:
+            return
+        with self._pending_lock:
+            for group in missing:
+                if group not in self._pending_groups:
+                    self._pending_groups.append(group)
+            if not self._pending_groups or (self._preload_thread is not None and self._preload_thread.is_alive()):
+                return
+            self._preload_thread = threading.Thread(target=self._preload_worker, name="asset-preload", daemon=True)
+            self._preload_thread.start()
+
+    def _preload_worker(self):
+        while True:
+            with self._pending_lock:
+                if not self._pending_groups:
+                    # Sous le verrou : un preload() qui voit encore le thread vivant a déjà ajouté son groupe
+                    self._preload_thread = None
+                    return
+                group = self._pending_groups[0]
+            try:
+                self.load_group(group)
+                error = None
+            except Exception as e:
+                error = e
+            with self._pending_lock:
+                if error is not None:
+                    self._failed_groups[group] = error
+                self._pending_groups.remove(group)
+
+    def _load_characters(self):
+        _preload_character_frames()
+
+    def _load_sounds(self):
+        self.sound_bank = get_sound_bank()
+        self.sound_bank.preload()
 
     def _load_smog(self):
         """Fumée d'impact (smog/1.png à 9.png) affichée aléatoirement quand un joueur reçoit un coup."""
@@ -72,10 +184,8 @@ class GameAssets:
         for i in range(1, 10):
             path = os.path.join(smog_dir, f"{i}.png")
             try:
-                img = pygame.image.load(path).convert()
-                img.set_colorkey((0, 0, 0))
                 self.smog_surfaces.append(
-                    pygame.transform.smoothscale(img, self.smog_display_size)
+                    get_asset_cache().scaled(path, self.smog_display_size, alpha=False, colorkey=(0, 0, 0))
                 )
             except Exception:
                 pass
@@ -88,13 +198,11 @@ class GameAssets:
         map_files = ("BG.png", "2.png", "3.png", "4.png")
         self.map_labels = ("Sahara Square", "Rainforest District", "Zootopie", "Tundra")
         self.map_surfaces = []
+        cache = get_asset_cache()
         for name in map_files:
             path = os.path.join(bg_dir, name)
             try:
-                img = pygame.image.load(path).convert()
-                self.map_surfaces.append(
-                    pygame.transform.smoothscale(img, (self.world_w, self.world_h))
-                )
+                self.map_surfaces.append(cache.scaled(path, (self.world_w, self.world_h), alpha=False))
             except Exception:
                 if self.map_surfaces:
                     self.map_surfaces.append(self.map_surfaces[0].copy())
@@ -106,52 +214,74 @@ class GameAssets:
             self.map_surfaces = [pygame.Surface((self.world_w, self.world_h))]
             self.map_surfaces[0].fill((40, 40, 60))
         self.background = self.map_surfaces[0].copy()
+        screen_size = (self.screen_w, self.screen_h)
         try:
-            bg_map = pygame.image.load(os.path.join(bg_dir, "BG_map.png")).convert()
-            self.map_select_background = pygame.transform.smoothscale(bg_map, (self.screen_w, self.screen_h))
+            self.map_select_background = cache.scaled(os.path.join(bg_dir, "BG_map.png"), screen_size, alpha=False)
         except Exception:
             try:
-                bg_map = pygame.image.load(os.path.join(bp_dir, "1_7.png")).convert()
-                self.map_select_background = pygame.transform.smoothscale(bg_map, (self.screen_w, self.screen_h))
+                self.map_select_background = cache.scaled(os.path.join(bp_dir, "1_7.png"), screen_size, alpha=False)
             except Exception:
                 self.map_select_background = None
 
-    def _load_gifs(self):
+    def _load_versus_gifs(self):
+        """GIFs versus / enter en flux (GifStream) : durées lues ici, premières frames décodées d'avance."""
         bp = os.path.join(self.base_dir, "assets", "BG_perso")
         scale = (self.screen_w, self.screen_h)
-        self.nick_win_frames = load_gif_frames(os.path.join(self.base_dir, "assets", "Nick", "win_nick", "1.gif"), scale_size=scale)
-        self.judy_win_frames = load_gif_frames(os.path.join(self.base_dir, "assets", "JUDY_HOPPS", "judy_win", "1 (1).gif"), scale_size=scale)
-        self.versus_gif_frames = load_gif_frames(os.path.join(bp, "1 (4).gif"), scale_size=scale)
-        self.p1_confirm_gif_frames = load_gif_frames(os.path.join(bp, "1 (5).gif"), scale_size=scale)
-        self.enter_gif_frames = load_gif_frames(os.path.join(bp, "1 (2).gif"), scale_size=scale)
-        self.enter_then_a_gif_frames = load_gif_frames(os.path.join(bp, "1 (3).gif"), scale_size=scale)
+        self.versus_gif_frames = GifStream(os.path.join(bp, "1 (4).gif"), scale_size=scale)
+        self.p1_confirm_gif_frames = GifStream(os.path.join(bp, "1 (5).gif"), scale_size=scale)
+        self.enter_gif_frames = GifStream(os.path.join(bp, "1 (2).gif"), scale_size=scale)
+        self.enter_then_a_gif_frames = GifStream(os.path.join(bp, "1 (3).gif"), scale_size=scale)
+        for stream in (self.versus_gif_frames, self.enter_gif_frames):
+            stream.prime()
+
+    def _load_win_gifs(self):
+        scale = (self.screen_w, self.screen_h)
+        self.nick_win_frames = GifStream(
+            os.path.join(self.base_dir, "assets", "Nick", "win_nick", "1.gif"), scale_size=scale, loop=True,
+        )
+        self.judy_win_frames = GifStream(
+            os.path.join(self.base_dir, "assets", "JUDY_HOPPS", "judy_win", "1 (1).gif"), scale_size=scale, loop=True,
+        )
+        for stream in (self.nick_win_frames, self.judy_win_frames):
+            stream.prime()
+
+    def release_gif_streams(self, *attrs):
+        """Libère les frames décodées de ces GIFs (écran quitté) ; un GIF pas encore chargé est ignoré."""
+        for attr in attrs:
+            stream = self.__dict__.get(attr)
+            if stream is not None:
+                stream.release()
+
+    def _load_select_screens(self):
+        bp = os.path.join(self.base_dir, "assets", "BG_perso")
+        cache = get_asset_cache()
+        screen_size = (self.screen_w, self.screen_h)
         try:
-            title_img = pygame.image.load(os.path.join(bp, "1.png")).convert()
-            self.title_screen = pygame.transform.smoothscale(title_img, (self.screen_w, self.screen_h))
+            self.title_screen = cache.scaled(os.path.join(bp, "1.png"), screen_size, alpha=False)
         except Exception:
             try:
-                title_img = pygame.image.load(os.path.join(bp, "1_7.png")).convert()
-                self.title_screen = pygame.transform.smoothscale(title_img, (self.screen_w, self.screen_h))
+                self.title_screen = cache.scaled(os.path.join(bp, "1_7.png"), screen_size, alpha=False)
             except Exception:
                 self.title_screen = None
         try:
-            char_bg = pygame.image.load(os.path.join(bp, "1_7.png")).convert()
-            self.character_select_background = pygame.transform.smoothscale(char_bg, (self.screen_w, self.screen_h))
+            self.character_select_background = cache.scaled(os.path.join(bp, "1_7.png"), screen_size, alpha=False)
         except Exception:
             self.character_select_background = None
 
     def _load_menu(self):
         menu_dir = os.path.join(self.base_dir, "assets", "menu")
+        cache = get_asset_cache()
         try:
-            bg = pygame.image.load(os.path.join(menu_dir, "background menu", "menu.jpg")).convert()
-            self.menu_background = pygame.transform.smoothscale(bg, (self.screen_w, self.screen_h))
+            self.menu_background = cache.scaled(
+                os.path.join(menu_dir, "background menu", "menu.jpg"), (self.screen_w, self.screen_h), alpha=False,
+            )
         except Exception:
             self.menu_background = None
         try:
-            tit = pygame.image.load(os.path.join(menu_dir, "background menu", "title.png")).convert_alpha()
             tw = int(self.screen_w * 0.36)
-            th = max(1, int(tit.get_height() * tw / tit.get_width()))
-            self.menu_title_image = pygame.transform.smoothscale(tit, (tw, th))
+            self.menu_title_image = cache.scaled(
+                os.path.join(menu_dir, "background menu", "title.png"), lambda w, h: (tw, max(1, int(h * tw / w))),
+            )
         except Exception:
             self.menu_title_image = None
         btn_dir = os.path.join(menu_dir, "button")
@@ -161,11 +291,10 @@ class GameAssets:
                 setattr(self, attr, img)
             except Exception:
                 setattr(self, attr, None)
-        try:
-            pygame.mixer.music.load(os.path.join(self.base_dir, "assets", "song", "menu", "Recording 2026-02-04 215949.mp3"))
-            self.menu_music_loaded = True
-        except Exception:
-            self.menu_music_loaded = False
+        self.menu_music_path = os.path.join(
+            self.base_dir, "assets", "song", "menu", "Recording 2026-02-04 215949.mp3"
+        )
+        self.menu_music_loaded = os.path.isfile(self.menu_music_path)
         self.combat_music_path = os.path.join(
             self.base_dir, "assets", "song", "combat",
             "Sonic Unleashed Final Boss - Dark Gaia Phase 2 - Endless Possibility.mp3"
@@ -176,24 +305,6 @@ class GameAssets:
             "Fanfare du Héros.mp3"
         )
         self.win_music_loaded = os.path.isfile(self.win_music_path)
-        self.judy_win_sound_paths = [
-            os.path.join(self.base_dir, "assets", "song", "JudyWin", "winJudy.wav"),
-            os.path.join(self.base_dir, "assets", "song", "JudyWin", "WinJudy3.wav"),
-        ]
-        self.judy_win_sounds_loaded = [
-            os.path.isfile(p) for p in self.judy_win_sound_paths
-        ]
-        self.nick_win_sound_path_wav = os.path.join(self.base_dir, "assets", "song", "nick win", "nick_win.wav")
-        self.nick_win_sound_path_mp3 = os.path.join(
-            self.base_dir, "assets", "song", "nick win",
-            "[Fandub] Zootopie - La Rencontre de Judy et Nick (mp3cut (mp3cut.net).mp3"
-        )
-        self.nick_win_sound_loaded = (
-            os.path.isfile(self.nick_win_sound_path_wav) or os.path.isfile(self.nick_win_sound_path_mp3)
-        )
-        self.nick_win_sound_path = (
-            self.nick_win_sound_path_wav if os.path.isfile(self.nick_win_sound_path_wav) else self.nick_win_sound_path_mp3
-        )
 
     def _load_counter(self):
         """Countdown 3-2-1-GO : charge les assets counter/3.png, 2.png, 1.png, go.png."""
@@ -201,36 +312,35 @@ class GameAssets:
         counter_dir = os.path.join(self.base_dir, "assets", "counter")
         order = ("3.png", "2.png", "1.png", "go.png")
         self.counter_surfaces = []
+        cache = get_asset_cache()
+        ch = self.counter_height
         for fname in order:
             try:
-                img = pygame.image.load(os.path.join(counter_dir, fname)).convert_alpha()
-                h = self.counter_height
-                w = max(1, int(img.get_width() * h / img.get_height()))
-                self.counter_surfaces.append(pygame.transform.smoothscale(img, (w, h)))
+                self.counter_surfaces.append(
+                    cache.scaled(os.path.join(counter_dir, fname), lambda w, h: (max(1, int(w * ch / h)), ch))
+                )
             except Exception:
                 self.counter_surfaces.append(None)
 
     def _load_ping(self):
         ping_dir = os.path.join(self.base_dir, "assets", "Ping")
         self.ping_height = 60
+        cache = get_asset_cache()
+        ph = self.ping_height
         try:
-            p1 = pygame.image.load(os.path.join(ping_dir, "P1.png")).convert_alpha()
-            self.ping_p1 = pygame.transform.smoothscale(p1, (int(p1.get_width() * self.ping_height / p1.get_height()), self.ping_height))
+            self.ping_p1 = cache.scaled(os.path.join(ping_dir, "P1.png"), lambda w, h: (int(w * ph / h), ph))
         except Exception:
             self.ping_p1 = None
         try:
-            p2 = pygame.image.load(os.path.join(ping_dir, "P2.png")).convert_alpha()
-            self.ping_p2 = pygame.transform.smoothscale(p2, (int(p2.get_width() * self.ping_height / p2.get_height()), self.ping_height))
+            self.ping_p2 = cache.scaled(os.path.join(ping_dir, "P2.png"), lambda w, h: (int(w * ph / h), ph))
         except Exception:
             self.ping_p2 = None
         self.ping_offset_above = 15
 
     def _load_portrait_no_black(self, path):
         """Charge un portrait et rend le fond noir transparent (colorkey)."""
-        surf = pygame.image.load(path).convert()
-        surf.set_colorkey((0, 0, 0))
-        w = int(surf.get_width() * self.portrait_height / surf.get_height())
-        return pygame.transform.smoothscale(surf, (w, self.portrait_height))
+        ph = self.portrait_height
+        return get_asset_cache().scaled(path, lambda w, h: (int(w * ph / h), ph), alpha=False, colorkey=(0, 0, 0))
 
     def _load_portraits(self):
         self.portrait_height = 200
@@ -251,16 +361,19 @@ class GameAssets:
         """Charge les icônes PV (vies) pour Judy et Nick."""
         self.life_icon_size = 44
         size = (self.life_icon_size, self.life_icon_size)
+        cache = get_asset_cache()
         try:
-            j = pygame.image.load(os.path.join(self.base_dir, "assets", "JUDY_HOPPS", "vie", "Pv_juddy.png")).convert()
-            j.set_colorkey((0, 0, 0))
-            self.life_icon_judy = pygame.transform.smoothscale(j, size)
+            self.life_icon_judy = cache.scaled(
+                os.path.join(self.base_dir, "assets", "JUDY_HOPPS", "vie", "Pv_juddy.png"), size,
+                alpha=False, colorkey=(0, 0, 0),
+            )
         except Exception:
             self.life_icon_judy = None
         try:
-            n = pygame.image.load(os.path.join(self.base_dir, "assets", "Nick", "pv", "pv_nick.png")).convert()
-            n.set_colorkey((0, 0, 0))
-            self.life_icon_nick = pygame.transform.smoothscale(n, size)
+            self.life_icon_nick = cache.scaled(
+                os.path.join(self.base_dir, "assets", "Nick", "pv", "pv_nick.png"), size,
+                alpha=False, colorkey=(0, 0, 0),
+            )
         except Exception:
             self.life_icon_nick = None
 
@@ -275,23 +388,9 @@ class GameAssets:
             self.font_percent = pygame.font.Font(None, 64)
 
     def _load_platforms(self):
-        plat_dir = os.path.join(self.base_dir, "assets", "plaform")
-        main_w, main_h = 1000, 25
-        small_w, small_h = 220, 18
-        try:
-            g = pygame.image.load(os.path.join(plat_dir, "Grande.png")).convert_alpha()
-            gh = max(25, int(g.get_height() * main_w / g.get_width()))
-            self.main_platform_size = (main_w, gh)
-            self.main_platform_image = pygame.transform.smoothscale(g, self.main_platform_size)
-        except Exception:
-            self.main_platform_size = (main_w, 25)
-            self.main_platform_image = None
-        stretch = 1.12
-        try:
-            p = pygame.image.load(os.path.join(plat_dir, "PETITE.png")).convert_alpha()
-            ph = max(18, int(p.get_height() * small_w / p.get_width()))
-            self.small_platform_size = (int(small_w * stretch), int(ph * stretch))
-            self.small_platform_image = pygame.transform.smoothscale(p, self.small_platform_size)
-        except Exception:
-            self.small_platform_size = (small_w, 18)
-            self.small_platform_image = None
+        (
+            self.main_platform_size,
+            self.main_platform_image,
+            self.small_platform_size,
+            self.small_platform_image,
+        ) = load_platform_surfaces(self.base_dir)
@@ -22,6 +22,30 @@ JOY_BTN_START = 9
 # Caméra : plus la valeur est basse, plus le suivi est fluide
 CAMERA_LERP = 0.08
 
+# Combattants : nombre par match (free-for-all au-delà de 2) et maximum géré (manettes 0..MAX_PLAYERS-1)
+MATCH_PLAYERS = 2
+MAX_PLAYERS = 8
+
+# Simulation : ticks de physique / combat par seconde (toutes les durées en frames s'y réfèrent)
+SIM_FPS = 60
+SIM_STEP_MS = 1000.0 / SIM_FPS
+# Rendu : plafond d'images par seconde pendant le combat (interpolé entre deux ticks) et pour les menus
+RENDER_FPS_CAP = 240
+MENU_FPS = 60
+# Un frame plus long que ça (chargement, fenêtre déplacée) ne rattrape pas plus de ticks
+MAX_FRAME_MS = 250
+
+# Jeu en ligne (rollback) : port UDP par défaut, retard d'entrée local (frames), frames rejouables au plus
+# après une mauvaise prédiction, et temps max (ms) par frame consacré à la resimulation
+NET_PORT = 7000
+NET_INPUT_DELAY = 2
+NET_MAX_ROLLBACK = 8
+NET_ROLLBACK_BUDGET_MS = 8.0
+
+# Replays : chaque versus est enregistré dans src/replays (entrées par frame) ; fichiers gardés au plus
+RECORD_REPLAYS = True
+REPLAY_KEEP = 2000
+
 # Countdown 3-2-1-GO (ms)
 COUNTDOWN_DURATION_MS = 1000
 
@@ -30,9 +54,19 @@ WAIT_AFTER_GIF_MS = 2000
 WAIT_AFTER_P1_CONFIRM_MS = 2000
 WAIT_AFTER_ENTER_GIF_MS = 2000
 WAIT_AFTER_ENTER_THEN_A_MS = 2000
+# GIF plein écran : frames décodées gardées en mémoire par lecteur (frame courante + avance)
+GIF_RING_FRAMES = 4
+
+# Aucune manette vue : réénumération forcée (fallback macOS) au plus une fois par intervalle
+JOY_RESCAN_INTERVAL_MS = 2000
+
+# Trace de debug (game/trace.py) : tampon circulaire, écrit dans src/traces/ sur F9 ou au crash
+TRACE_CAPACITY = 4096
+TRACE_LEVELS = {"joy": "warn", "input": "warn", "net": "warn", "replay": "warn"}
+TRACE_DUMP_KEY = pygame.K_F9
 
-# Debug : logs manette (init, rescan, events)
-DEBUG_JOYSTICK = True
-DEBUG_JOYSTICK_VERBOSE = True
+# Debug manettes : branchements / boutons (trace "joy" au niveau info), + état du polling (niveau debug)
+DEBUG_JOYSTICK = False
+DEBUG_JOYSTICK_VERBOSE = False
 DEBUG_JOYSTICK_VERBOSE_INTERVAL = 30
 DEBUG_HUD_BLACK = False
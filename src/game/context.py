@@ -1,9 +1,13 @@
 """
 Contexte de jeu : tout l’état partagé entre les écrans (écran, clock, assets,
-monde, joueurs, game_state, curseurs, timers pour chaque phase).
+monde, joueurs, game_state, choix du match). L'état propre à un écran (curseurs, timers d'animation)
+est dans l'écran lui-même, remis à zéro à chaque entrée.
 """
 import pygame
 from game.assets import GameAssets
+from game.music import MusicPlayer
+from game.profiler import FrameProfiler
+from game.stage_layer import StageLayer
 
 
 class GameContext:
@@ -15,76 +19,54 @@ class GameContext:
         self.screen_w, self.screen_h = screen_size
         self.world_w, self.world_h = world_size
         self.assets = GameAssets(base_dir, screen_size, world_size)
-        self.world_surface = pygame.Surface(world_size)
         self.running = True
         self.fullscreen_mode = True
         self.window_size = screen_size
 
         # Remplis par main.py après création des joueurs / plateformes / hitboxes
+        # player1 / player2 : P1 et P2 des menus (sélection carte / perso) ; tous les combattants dans simulation.players
         self.player1 = None
         self.player2 = None
         self.players = None
         self.platforms = None
         self.hitboxes = None
+        self.simulation = None
+        # RollbackSession (net/rollback.py) pendant un match en ligne, sinon None (versus local)
+        self.netplay = None
+        # Replay (game/replay.py) lu à la place des entrées des joueurs (main.py --replay), sinon None
+        self.replay = None
 
         self.camera_x = world_size[0] // 2 - screen_size[0] // 2
         self.camera_y = world_size[1] // 2 - screen_size[1] // 2
+        # Caméra au tick précédent (interpolation du rendu)
+        self.camera_prev_x = self.camera_x
+        self.camera_prev_y = self.camera_y
+
+        # Boucle à pas fixe : durée du dernier frame rendu et temps de simulation pas encore consommé
+        self.frame_dt_ms = 0
+        self.sim_accumulator_ms = 0.0
+        # Overlay de profilage par phase (F3 en combat)
+        self.profiler = FrameProfiler()
 
         self.game_state = "main_menu"
-        self.menu_music_playing = False
-        self.combat_music_playing = False
+        # Piste de musique en cours (lancée par le registre des écrans, voir game/screens/base.py)
+        self.music = MusicPlayer()
 
-        # Map select : chaque joueur a son curseur + confirm, puis on détermine la carte
+        # Carte choisie en sélection de carte (jouée par countdown / playing)
         self.selected_map_index = 0
-        self.map_select_cursor = 0
-        self.map_select_cursor_p1 = 0
-        self.map_select_cursor_p2 = 0
-        self.map_select_p1_confirmed = False
-        self.map_select_p2_confirmed = False
-        self.map_select_ignore_confirm_frame = False
+        # Fond + plateformes de la carte choisie, composés une fois (voir game/stage_layer.py)
+        self.stage_layer = StageLayer()
 
-        # Character select : P1 puis P2, avec persos (judy, nick)
-        self.char_select_phase = "p1"
-        self.char_select_cursor = 0
-        self.p1_character_choice = None
-        self.p2_character_choice = None
+        # Personnages jouables (sélection de perso)
         self.characters = ("judy", "nick")
         self.character_labels = ("Judy Hopps", "Nick Wilde")
 
         self.paused = False
         self.pause_menu_cursor = 0
 
-        self.countdown_step = 0
-        self.countdown_timer_ms = 0
-
+        # Vidéo d'intro choisie par la sélection de perso (None : pas de vidéo, direct versus)
         self.intro_video_filename = None
 
-        # Timers / index pour chaque écran GIF (versus, enter, etc.)
-        self.versus_gif_frame_index = 0
-        self.versus_gif_timer_ms = 0
-        self.versus_gif_phase = "playing"
-        self.wait_after_gif_timer_ms = 0
-
-        self.p1_confirm_frame_index = 0
-        self.p1_confirm_timer_ms = 0
-        self.p1_confirm_phase = "playing"
-        self.wait_after_p1_confirm_timer_ms = 0
-
-        self.enter_gif_frame_index = 0
-        self.enter_gif_timer_ms = 0
-        self.enter_gif_phase = "playing"
-        self.wait_after_enter_gif_timer_ms = 0
-
-        self.enter_then_a_frame_index = 0
-        self.enter_then_a_timer_ms = 0
-        self.enter_then_a_phase = "playing"
-        self.wait_after_enter_then_a_timer_ms = 0
-
-        self.nick_win_frame_index = 0
-        self.nick_win_frame_timer_ms = 0
-        self.judy_win_frame_index = 0
-        self.judy_win_frame_timer_ms = 0
-
     # Raccourci pour la carte de fond (utilisée par playing / countdown)
     @property
     def background(self):
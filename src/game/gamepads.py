@@ -0,0 +1,160 @@
+"""
+Manettes branchées, suivies par événements (JOYDEVICEADDED / JOYDEVICEREMOVED) : chaque manette est ouverte
+une seule fois et gardée par instance_id ; le slot i (= joystick du joueur i, joy_id des menus) est la i-ème
+manette connectée, comme l'index de périphérique SDL. Rien n'est réouvert ni réénuméré à chaque frame.
+"""
+import pygame
+from game.config import MAX_PLAYERS, JOY_RESCAN_INTERVAL_MS
+from game.trace import get_trace, define, JOY, WARN, INFO
+
+# Une manette qui disparaît moins longtemps que ça (flicker Bluetooth) garde sa place de joueur
+STICKY_JOY_FRAMES = 90
+DEVICE_EVENTS = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+
+_TR_OPEN_FAILED = define(JOY, WARN, "ouverture impossible device_index={a:.0f}")
+_TR_ADDED = define(JOY, INFO, "manette branchée slot={a:.0f} instance={b:.0f} boutons={c:.0f}")
+_TR_REMOVED = define(JOY, INFO, "manette débranchée instance={a:.0f} -> {b:.0f} connectée(s)")
+_TR_RESCAN = define(JOY, INFO, "rescan -> {a:.0f} manette(s)")
+
+
+class GamepadManager:
+    def __init__(self):
+        self._devices = {}  # instance_id -> pygame.joystick.Joystick (ouvert)
+        self._slots = []  # instance_id par ordre de connexion : slot i = joueur i
+        self._effective_count = 0
+        self._frames_below_effective = 0
+        self._last_rescan_ms = None
+        self.frames_without_pad = 0
+
+    @property
+    def count(self) -> int:
+        """Manettes réellement connectées."""
+        return len(self._slots)
+
+    @property
+    def effective_count(self) -> int:
+        """Nombre de manettes à utiliser (collant quand une manette disparaît un instant, pour éviter les flickers Bluetooth)."""
+        return self._effective_count
+
+    def joystick(self, slot):
+        """Manette du slot (déjà ouverte), ou None."""
+        if slot is None or not 0 <= slot < len(self._slots):
+            return None
+        return self._devices[self._slots[slot]]
+
+    def joysticks(self):
+        """Manettes connectées, dans l'ordre des slots."""
+        return [self._devices[iid] for iid in self._slots]
+
+    def start(self):
+        """Ouvre les manettes déjà présentes (SDL renverra aussi un JOYDEVICEADDED pour chacune : ignoré)."""
+        for index in range(pygame.joystick.get_count()):
+            self._open(index)
+        self._update_effective_count()
+
+    def _open(self, device_index: int):
+        try:
+            joy = pygame.joystick.Joystick(device_index)
+            joy.init()
+        except pygame.error:
+            tr = get_trace()
+            if tr.on[_TR_OPEN_FAILED]:
+                tr.emit(_TR_OPEN_FAILED, device_index)
+            return
+        self.attach(joy)
+
+    def attach(self, joy):
+        """Ajoute une manette déjà ouverte au slot suivant (ou un équivalent virtuel : benchmarks)."""
+        iid = joy.get_instance_id()
+        if iid in self._devices:
+            return
+        self._devices[iid] = joy
+        self._slots.append(iid)
+        tr = get_trace()
+        if tr.on[_TR_ADDED]:
+            tr.emit(_TR_ADDED, len(self._slots) - 1, iid, joy.get_numbuttons())
+
+    def detach(self, instance_id: int):
+        joy = self._devices.pop(instance_id, None)
+        if joy is None:
+            return
+        self._slots.remove(instance_id)
+        tr = get_trace()
+        if tr.on[_TR_REMOVED]:
+            tr.emit(_TR_REMOVED, instance_id, len(self._slots))
+
+    def handle_event(self, event):
+        """Branchement / débranchement ; les autres events sont ignorés."""
+        if event.type == pygame.JOYDEVICEADDED:
+            self._open(event.device_index)
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self.detach(event.instance_id)
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type in DEVICE_EVENTS:
+                self.handle_event(event)
+
+    def _update_effective_count(self):
+        raw = min(len(self._slots), MAX_PLAYERS)
+        if raw >= self._effective_count and raw > 0:
+            self._effective_count = raw
+            self._frames_below_effective = 0
+        elif raw > 0:
+            self._frames_below_effective += 1
+            if self._frames_below_effective >= STICKY_JOY_FRAMES:
+                self._effective_count = raw
+                self._frames_below_effective = 0
+        else:
+            self._effective_count = 0
+            self._frames_below_effective = 0
+
+    def _rescan(self, now_ms: int):
+        """
+        Fallback macOS (branchement pas signalé) : quit+init du module joystick, seulement quand aucune manette
+        n'est ouverte et au plus une fois par JOY_RESCAN_INTERVAL_MS. SDL exige le thread principal pour ça.
+        """
+        if self._last_rescan_ms is not None and now_ms - self._last_rescan_ms < JOY_RESCAN_INTERVAL_MS:
+            return
+        self._last_rescan_ms = now_ms
+        try:
+            pygame.joystick.quit()
+            pygame.joystick.init()
+            pygame.event.pump()
+        except pygame.error:
+            return
+        self.start()
+        tr = get_trace()
+        if self._slots and tr.on[_TR_RESCAN]:
+            tr.emit(_TR_RESCAN, len(self._slots))
+
+    def update(self, now_ms: int = None):
+        """Une fois par frame : events de branchement en attente, nombre effectif, fallback de rescan."""
+        try:
+            self.handle_events(pygame.event.get(DEVICE_EVENTS))
+        except (KeyError, SystemError, pygame.error):
+            pass
+        if self._slots:
+            self.frames_without_pad = 0
+        else:
+            self.frames_without_pad += 1
+            self._rescan(pygame.time.get_ticks() if now_ms is None else now_ms)
+        self._update_effective_count()
+
+    def assign(self, players):
+        """Joueur i -> slot i s'il y a assez de manettes (nombre effectif) ; joystick = handle du cache."""
+        n_effective = self._effective_count
+        for i, pl in enumerate(players):
+            pl.joy_id = i if n_effective > i else None
+            pl.joystick = self.joystick(pl.joy_id)
+
+
+_gamepads = None
+
+
+def get_gamepads() -> GamepadManager:
+    """Manettes partagées (boucle principale, écrans, menus)."""
+    global _gamepads
+    if _gamepads is None:
+        _gamepads = GamepadManager()
+    return _gamepads
@@ -0,0 +1,185 @@
+"""
+Lecture des GIF plein écran en flux : seules les durées sont lues à l'ouverture, les frames sont décodées
+et mises à l'échelle juste avant d'être affichées, dans un anneau de GIF_RING_FRAMES surfaces
+(frame courante + les suivantes, préparées par un thread). La mémoire d'un lecteur est donc bornée
+quelle que soit la longueur du GIF, au lieu de garder toutes les frames en RGBA plein écran.
+"""
+import threading
+import pygame
+from game.config import GIF_RING_FRAMES
+
+try:
+    from PIL import Image
+    _HAS_PIL = True
+except ImportError:
+    _HAS_PIL = False
+
+DEFAULT_FRAME_MS = 50
+MIN_FRAME_MS = 20
+
+
+def _frame_duration(info) -> int:
+    duration = info.get("duration")
+    return max(MIN_FRAME_MS, duration) if duration else DEFAULT_FRAME_MS
+
+
+class GifStream:
+    """
+    Lecteur d'un GIF : len(), duration(i) sans décodage, surface(i) décode à la demande si la frame
+    n'est pas déjà dans l'anneau et lance la préparation des suivantes (en boucle si loop).
+    Un GIF illisible donne un lecteur vide (faux) ; sans PIL, une seule image fixe.
+    """
+
+    def __init__(self, path, scale_size=None, ring_frames: int = GIF_RING_FRAMES, loop: bool = False):
+        self.path = path
+        self.scale_size = scale_size
+        self.ring_frames = max(2, ring_frames)
+        self.loop = loop
+        self._durations = []
+        self._ring = {}
+        self._playhead = 0
+        self._image = None
+        self._still = None
+        # _lock : anneau et position (sections courtes) ; _decode_lock : image PIL (seek + décodage)
+        self._lock = threading.Lock()
+        self._decode_lock = threading.Lock()
+        self._ahead_thread = None
+        # Incrémenté par release() : une frame préparée avant la libération n'est pas remise dans l'anneau
+        self._generation = 0
+        self._read_durations()
+
+    def _read_durations(self):
+        if _HAS_PIL:
+            try:
+                with Image.open(self.path) as gif:
+                    for index in range(getattr(gif, "n_frames", 1)):
+                        gif.seek(index)
+                        self._durations.append(_frame_duration(gif.info))
+                return
+            except Exception:
+                self._durations = []
+        # Sans PIL (ou GIF illisible) : première image seulement, comme une image fixe
+        try:
+            self._still = self._scaled(pygame.image.load(self.path))
+            self._durations = [DEFAULT_FRAME_MS]
+        except Exception:
+            self._durations = []
+
+    def __len__(self):
+        return len(self._durations)
+
+    def duration(self, index: int) -> int:
+        return self._durations[index]
+
+    @property
+    def max_memory_bytes(self) -> int:
+        """Plafond mémoire des frames décodées de ce lecteur."""
+        if not self._durations or self.scale_size is None:
+            return 0
+        w, h = self.scale_size
+        return w * h * 4 * min(self.ring_frames, len(self._durations))
+
+    def surface(self, index: int) -> pygame.Surface:
+        """Frame index (négatif accepté) ; devient la position de lecture, les suivantes sont préparées."""
+        if self._still is not None:
+            return self._still
+        index %= len(self._durations)
+        with self._lock:
+            self._playhead = index
+            surf = self._ring.get(index)
+        if surf is None:
+            # Pas encore préparée (début de lecture, saut) : décodage sur place
+            surf = self._decode(index)
+            with self._lock:
+                self._store(index, surf)
+        self._prepare_ahead()
+        return surf
+
+    def prime(self):
+        """Décode les premières frames maintenant (appelé par le chargement des assets, hors thread principal)."""
+        if self._still is not None or not self._durations:
+            return
+        with self._lock:
+            self._playhead = 0
+            missing = [i for i in self._window() if i not in self._ring]
+        for index in missing:
+            surf = self._decode(index)
+            with self._lock:
+                self._store(index, surf)
+
+    def release(self):
+        """Libère les frames décodées et le fichier (l'écran n'est plus affiché) ; rechargé au prochain surface()."""
+        with self._decode_lock, self._lock:
+            self._ring.clear()
+            self._playhead = 0
+            self._generation += 1
+            if self._image is not None:
+                self._image.close()
+                self._image = None
+
+    def _window(self):
+        """Indices à garder : frame courante puis les suivantes (bouclées si loop)."""
+        n = len(self._durations)
+        indices = []
+        for offset in range(min(self.ring_frames, n)):
+            index = self._playhead + offset
+            if index >= n:
+                if not self.loop:
+                    break
+                index %= n
+            indices.append(index)
+        return indices
+
+    def _store(self, index, surf):
+        self._ring[index] = surf
+        if len(self._ring) > self.ring_frames:
+            keep = set(self._window())
+            for old in [i for i in self._ring if i not in keep]:
+                del self._ring[old]
+                if len(self._ring) <= self.ring_frames:
+                    break
+
+    def _prepare_ahead(self):
+        if self._ahead_thread is not None and self._ahead_thread.is_alive():
+            return
+        with self._lock:
+            missing = any(i not in self._ring for i in self._window())
+        if missing:
+            self._ahead_thread = threading.Thread(target=self._ahead_worker, name="gif-ahead", daemon=True)
+            self._ahead_thread.start()
+
+    def _ahead_worker(self):
+        with self._lock:
+            generation = self._generation
+        while True:
+            with self._lock:
+                missing = [i for i in self._window() if i not in self._ring]
+            if not missing:
+                return
+            try:
+                surf = self._decode(missing[0])
+            except Exception:
+                # Redécodée sur le thread principal au besoin
+                return
+            with self._lock:
+                if generation != self._generation:
+                    return
+                self._store(missing[0], surf)
+
+    def _decode(self, index) -> pygame.Surface:
+        """Frame index en surface d'affichage."""
+        with self._decode_lock:
+            if self._image is None:
+                self._image = Image.open(self.path)
+            self._image.seek(index)
+            frame = self._image.convert("RGBA")
+        return self._scaled(pygame.image.frombytes(frame.tobytes(), frame.size, "RGBA"))
+
+    def _scaled(self, surf):
+        try:
+            surf = surf.convert_alpha()
+        except pygame.error:
+            pass
+        if self.scale_size and surf.get_size() != tuple(self.scale_size):
+            surf = pygame.transform.smoothscale(surf, self.scale_size)
+        return surf
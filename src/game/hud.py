@@ -1,39 +1,97 @@
 """
-HUD : pourcentages avec contour lisible, stocks (icônes vies), portraits P1/P2 selon personnage.
+HUD : pourcentages avec contour lisible, stocks (icônes vies), portraits P1/P2 selon personnage
+(à plus de deux joueurs : stocks + pourcentage seulement, sur des rangées de HUD_COLUMNS blocs).
+HudCompositor garde en cache les blits du HUD de chaque joueur (pourcentage déjà composé) et ne les refait
+que si pourcentage, stocks ou personnage changent ; les chiffres contourés viennent d'un cache de glyphes.
 """
 import pygame
 
+OUTLINE_PX = 2
+HUD_COLORKEY = (1, 0, 0)
+# Free-for-all : blocs HUD par rangée et hauteur d'une rangée (px)
+HUD_COLUMNS = 4
+HUD_ROW_HEIGHT = 60
 
-def draw_player_ping(surface, player, ping_surface, offset_above: int = 15):
-    """Dessine l'indicateur P1/P2 au-dessus du joueur."""
+
+def player_ping_surface(assets, index: int):
+    """Indicateur du joueur index : images P1 / P2, puis "P3".."P8" contourés (cache de glyphes)."""
+    if index == 0:
+        return assets.ping_p1
+    if index == 1:
+        return assets.ping_p2
+    return _glyph_cache.render(assets.font_percent, f"P{index + 1}", (255, 255, 255))
+
+
+def draw_player_ping(surface, player, ping_surface, offset_above: int = 15, player_rect=None):
+    """Dessine l'indicateur P1/P2 au-dessus du joueur (player_rect : rect à utiliser, ex. interpolé en coordonnées écran ; sinon player.rect)."""
     if ping_surface is None or getattr(player, "lives", 1) <= 0:
         return
-    r = ping_surface.get_rect(centerx=player.rect.centerx, bottom=player.rect.top - offset_above)
+    anchor = player_rect if player_rect is not None else player.rect
+    r = ping_surface.get_rect(centerx=anchor.centerx, bottom=anchor.top - offset_above)
     surface.blit(ping_surface, r.topleft)
 
 
+class OutlinedGlyphCache:
+    """
+    Glyphes (un caractère) rendus une fois : contour noir et remplissage séparés. Un texte = tous les contours
+    puis tous les remplissages (comme le rendu d'une chaîne entière : un contour ne mord pas la lettre voisine).
+    """
+
+    def __init__(self):
+        self._glyphs = {}
+
+    def glyph(self, font, char: str, fg):
+        """(contour, remplissage) du caractère ; le remplissage se place à (OUTLINE_PX, OUTLINE_PX) du contour."""
+        key = (id(font), char, fg)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            img = font.render(char, True, fg)
+            outline = font.render(char, True, (0, 0, 0))
+            w, h = img.get_size()
+            surf = pygame.Surface((w + 2 * OUTLINE_PX, h + 2 * OUTLINE_PX), pygame.SRCALPHA)
+            for dx in range(-OUTLINE_PX, OUTLINE_PX + 1):
+                for dy in range(-OUTLINE_PX, OUTLINE_PX + 1):
+                    if dx == 0 and dy == 0:
+                        continue
+                    surf.blit(outline, (OUTLINE_PX + dx, OUTLINE_PX + dy))
+            glyph = (surf, img)
+            self._glyphs[key] = glyph
+        return glyph
+
+    def render(self, font, text: str, fg):
+        """Texte contouré composé à partir des glyphes, chacun calé sur le bord droit du préfixe rendu (crénage compris)."""
+        glyphs = [self.glyph(font, c, fg) for c in text]
+        pens = [font.size(text[:i + 1])[0] - font.size(c)[0] for i, c in enumerate(text)]
+        width = font.size(text)[0] + 2 * OUTLINE_PX
+        height = max((outline.get_height() for outline, _ in glyphs), default=font.get_height() + 2 * OUTLINE_PX)
+        out = pygame.Surface((max(1, width), height), pygame.SRCALPHA)
+        for (outline, _), x in zip(glyphs, pens):
+            out.blit(outline, (x, 0))
+        for (_, img), x in zip(glyphs, pens):
+            out.blit(img, (x + OUTLINE_PX, OUTLINE_PX))
+        return out
+
+
+_glyph_cache = OutlinedGlyphCache()
+
+
 def _render_percent_text(font, percent: int, lives: int, player_color):
-    """Rendu du pourcentage en texte lisible (contour noir + blanc)."""
-    text = f"{int(percent)}%"
+    """Rendu du pourcentage en texte lisible (contour noir + blanc), sur fond colorkey (blit opaque RLE)."""
     fg = (255, 255, 255) if lives > 0 else (180, 180, 180)
-    img = font.render(text, True, fg)
-    outline = font.render(text, True, (0, 0, 0))
-    w, h = img.get_size()
-    out_surf = pygame.Surface((w + 4, h + 4))
-    out_surf.set_colorkey((1, 0, 0))
-    out_surf.fill((1, 0, 0))
-    for dx in (-2, -1, 0, 1, 2):
-        for dy in (-2, -1, 0, 1, 2):
-            if dx == 0 and dy == 0:
-                continue
-            out_surf.blit(outline, (2 + dx, 2 + dy))
-    out_surf.blit(img, (2, 2))
-    out_surf.set_colorkey((1, 0, 0))
-    return out_surf.convert()
+    text = _glyph_cache.render(font, f"{int(percent)}%", fg)
+    out_surf = pygame.Surface(text.get_size())
+    out_surf.fill(HUD_COLORKEY)
+    out_surf.blit(text, (0, 0))
+    out_surf.set_colorkey(HUD_COLORKEY, pygame.RLEACCEL)
+    try:
+        return out_surf.convert()
+    except pygame.error:
+        return out_surf
 
 
-def draw_percent_hud(surface, player, x: int, y: int, assets, align_left: bool = True):
-    """Dessine le pourcentage et les stocks (icônes vies ou nombre)."""
+def _percent_hud_blits(player, x: int, y: int, assets, align_left: bool = True):
+    """Liste (surface, position) du pourcentage et des stocks (icônes vies ou nombre)."""
+    blits = []
     font = assets.font_percent
     life_icon = assets.life_icon_judy if getattr(player, "character", None) == "judy" else assets.life_icon_nick
     if getattr(player, "character", None) != "judy" and getattr(player, "character", None) != "nick":
@@ -46,39 +104,136 @@ def draw_percent_hud(surface, player, x: int, y: int, assets, align_left: bool =
     if align_left:
         if life_icon and lives > 0:
             for i in range(lives):
-                surface.blit(life_icon, (x + i * (icon_w + gap), y - icon_w // 2))
+                blits.append((life_icon, (x + i * (icon_w + gap), y - icon_w // 2)))
             stocks_right = x + lives * (icon_w + gap) - gap
             r_percent = img_percent.get_rect(midleft=(stocks_right + 24, y))
         else:
             text_stocks = font.render(f"{lives}", True, (255, 255, 255))
             r_stocks = text_stocks.get_rect(midleft=(x, y))
-            surface.blit(text_stocks, r_stocks)
+            blits.append((text_stocks, r_stocks))
             r_percent = img_percent.get_rect(midleft=(r_stocks.right + 20, y))
-        surface.blit(img_percent, r_percent)
+        blits.append((img_percent, r_percent))
     else:
         r_percent = img_percent.get_rect(midright=(x, y))
-        surface.blit(img_percent, r_percent)
+        blits.append((img_percent, r_percent))
         if life_icon and lives > 0:
             start_x = r_percent.left - 24 - lives * (icon_w + gap) + gap
             for i in range(lives):
-                surface.blit(life_icon, (start_x + i * (icon_w + gap), y - icon_w // 2))
+                blits.append((life_icon, (start_x + i * (icon_w + gap), y - icon_w // 2)))
         else:
             text_stocks = font.render(f"{lives}", True, (255, 255, 255))
             r_stocks = text_stocks.get_rect(midright=(r_percent.left - 20, y))
-            surface.blit(text_stocks, r_stocks)
+            blits.append((text_stocks, r_stocks))
+    return blits
+
+
+def draw_percent_hud(surface, player, x: int, y: int, assets, align_left: bool = True):
+    """Dessine le pourcentage et les stocks (icônes vies ou nombre)."""
+    for surf, pos in _percent_hud_blits(player, x, y, assets, align_left):
+        surface.blit(surf, pos)
+
+
+def _portrait_blit(assets, screen_w: int, hud_y: int, player, left_side: bool, x=None):
+    """(surface, position) du portrait d'un joueur (P1 à gauche, P2 à droite, ou calé sur x), ou None."""
+    portrait_bottom = hud_y - 25
+    margin = assets.portrait_side_margin
+    if left_side:
+        char = getattr(player, "character", None) if player else "judy"
+        portrait = assets.nick_portrait if char == "nick" else assets.judy_portrait
+        if portrait:
+            return portrait, portrait.get_rect(bottomleft=(margin if x is None else x, portrait_bottom)).topleft
+    else:
+        char = getattr(player, "character", None) if player else "nick"
+        portrait = assets.judy_portrait if char == "judy" else assets.nick_portrait
+        if portrait:
+            return portrait, portrait.get_rect(bottomright=(screen_w - margin if x is None else x, portrait_bottom)).topleft
+    return None
 
 
 def draw_portraits(surface, assets, screen_w: int, hud_y: int, player1=None, player2=None):
     """Dessine les portraits P1 à gauche, P2 à droite (selon qui est Nick/Judy)."""
-    portrait_bottom = hud_y - 25
+    for player, left_side in ((player1, True), (player2, False)):
+        blit = _portrait_blit(assets, screen_w, hud_y, player, left_side)
+        if blit is not None:
+            surface.blit(*blit)
+
+
+def hud_slot_layout(slot: int, count: int, screen_w: int, screen_h: int, assets):
+    """
+    (x, y du pourcentage, aligné à gauche, avec portrait) du bloc HUD du joueur slot parmi count.
+    Deux joueurs : P1 à gauche, P2 à droite, avec portraits ; au-delà : rangées de HUD_COLUMNS blocs sans portrait.
+    """
+    hud_y = screen_h - assets.hud_bottom_y_offset
     margin = assets.portrait_side_margin
-    char1 = getattr(player1, "character", None) if player1 else "judy"
-    char2 = getattr(player2, "character", None) if player2 else "nick"
-    left_portrait = assets.nick_portrait if char1 == "nick" else assets.judy_portrait
-    right_portrait = assets.judy_portrait if char2 == "judy" else assets.nick_portrait
-    if left_portrait:
-        r = left_portrait.get_rect(bottomleft=(margin, portrait_bottom))
-        surface.blit(left_portrait, r.topleft)
-    if right_portrait:
-        r = right_portrait.get_rect(bottomright=(screen_w - margin, portrait_bottom))
-        surface.blit(right_portrait, r.topleft)
+    if count <= 2:
+        left_side = slot == 0
+        return (margin if left_side else screen_w - margin), hud_y - 28, left_side, True
+    columns = min(count, HUD_COLUMNS)
+    rows = (count + columns - 1) // columns
+    row, column = divmod(slot, columns)
+    x = margin + column * (screen_w - 2 * margin) // columns
+    y = hud_y - 28 - (rows - 1 - row) * HUD_ROW_HEIGHT
+    return x, y, True, False
+
+
+class HudCompositor:
+    """
+    Blits du HUD de chaque joueur (stocks + pourcentage + portrait), refaits uniquement quand pourcentage,
+    stocks, personnage ou taille d'écran changent. Seul le pourcentage est composé à l'avance (colorkey) ;
+    icônes et portraits gardent leur alpha et sont blittés tels quels, comme draw_percent_hud / draw_portraits.
+    """
+
+    def __init__(self):
+        # slot -> (clé d'état, liste (surface, position écran))
+        self._blocks = {}
+
+    def invalidate(self):
+        self._blocks.clear()
+
+    def draw(self, surface, assets, players):
+        screen_w, screen_h = surface.get_size()
+        count = len(players)
+        for slot, player in enumerate(players):
+            key = (
+                int(getattr(getattr(player, "stats", None), "percent", 0)),
+                max(0, getattr(player, "lives", 1)),
+                getattr(player, "character", None),
+                screen_w,
+                screen_h,
+                count,
+                id(assets),
+            )
+            cached = self._blocks.get(slot)
+            if cached is None or cached[0] != key:
+                cached = (key, self._build_blits(assets, screen_w, screen_h, player, slot, count))
+                self._blocks[slot] = cached
+            surface.blits(cached[1], doreturn=False)
+
+    @staticmethod
+    def _build_blits(assets, screen_w: int, screen_h: int, player, slot: int, count: int):
+        """Mêmes surfaces et positions que draw_percent_hud / draw_portraits."""
+        hud_y = screen_h - assets.hud_bottom_y_offset
+        x, percent_y, left_side, with_portrait = hud_slot_layout(slot, count, screen_w, screen_h, assets)
+        blits = _percent_hud_blits(player, x, percent_y, assets, align_left=left_side)
+        portrait = _portrait_blit(assets, screen_w, hud_y, player, left_side, x) if with_portrait else None
+        if portrait is not None:
+            blits.append(portrait)
+        return [(surf, tuple(pos[:2])) for surf, pos in blits]
+
+
+def draw_loading_indicator(surface, font, elapsed_ms: int):
+    """Écran d'attente quand les assets de l'écran suivant ne sont pas encore prêts (points animés)."""
+    surface.fill((18, 20, 28))
+    dots = "." * (1 + (elapsed_ms // 300) % 3)
+    text = font.render(f"Chargement{dots}", True, (235, 235, 235))
+    w, h = surface.get_size()
+    surface.blit(text, text.get_rect(midleft=(w // 2 - text.get_width() // 2, h // 2)))
+    bar_w = 240
+    x0 = w // 2 - bar_w // 2
+    y0 = h // 2 + text.get_height()
+    pygame.draw.rect(surface, (60, 64, 78), (x0, y0, bar_w, 6), border_radius=3)
+    seg = bar_w // 4
+    pos = (elapsed_ms // 4) % (bar_w + seg) - seg
+    seg_rect = pygame.Rect(x0 + pos, y0, seg, 6).clip(pygame.Rect(x0, y0, bar_w, 6))
+    if seg_rect.width > 0:
+        pygame.draw.rect(surface, (255, 215, 100), seg_rect, border_radius=3)
@@ -2,131 +2,63 @@
 import pygame
 from game.config import (
     JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_ATTACK, JOY_BTN_GRAB, JOY_BTN_COUNTER, JOY_BTN_SPECIAL,
-    DEBUG_JOYSTICK, DEBUG_JOYSTICK_VERBOSE, DEBUG_JOYSTICK_VERBOSE_INTERVAL,
+    DEBUG_JOYSTICK_VERBOSE_INTERVAL, TRACE_DUMP_KEY,
 )
+from game.gamepads import get_gamepads
+from game.trace import get_trace, define, JOY, INFO, DEBUG
+from player.player_input import InputFrame
 
-_last_joystick_count = -1
-_joystick_ever_seen = False
-_frames_n_zero = 0
-FULL_RESCAN_AFTER_FRAMES = 2
-_effective_joy_count = 0
-_frames_joy_below_effective = 0
-STICKY_JOY_FRAMES = 90
 _poll_axis_prev = {}
 _poll_button_prev = {}
-_debug_joy_global_frame = 0
+
+_TR_PADS = define(JOY, INFO, "démarrage : {a:.0f} manette(s), effective={b:.0f}")
+_TR_POLL_EMPTY = define(JOY, DEBUG, "polling appelé sans manette connectée")
+_TR_POLL = define(JOY, DEBUG, "polling : {a:.0f} manette(s), {b:.0f} event(s) générés")
+_TR_POLL_PAD = define(JOY, DEBUG, "polling J{a:.0f} : axe0={b:+.2f} axe1={c:+.2f}")
 
 
 def safe_event_get():
-    """Récupère les events pygame. Après un rescan joystick (quit+init), SDL peut être en erreur : on évite le crash."""
+    """
+    Récupère les events pygame (les branchements de manettes passent au GamepadManager, TRACE_DUMP_KEY écrit la
+    trace de debug). Après un rescan joystick (quit+init), SDL peut être en erreur : on évite le crash.
+    """
     try:
-        return list(pygame.event.get())
+        events = list(pygame.event.get())
     except (KeyError, SystemError):
         return []
+    get_gamepads().handle_events(events)
+    for event in events:
+        if event.type == pygame.KEYDOWN and event.key == TRACE_DUMP_KEY:
+            try:
+                print(f"Trace écrite : {get_trace().dump()}")
+            except OSError as e:
+                print(f"Trace non écrite : {e}")
+    return events
 
 
 def get_effective_joy_count():
-    """Nombre de manettes à utiliser (collant à 2 quand on a déjà vu 2, pour éviter les flickers Bluetooth)."""
-    return _effective_joy_count
-
-
-def _update_effective_joy_count():
-    """Met à jour _effective_joy_count à partir de get_count() (à appeler une fois par frame)."""
-    global _effective_joy_count, _frames_joy_below_effective
-    raw = pygame.joystick.get_count()
-    if raw >= 2:
-        _effective_joy_count = 2
-        _frames_joy_below_effective = 0
-    elif raw == 1:
-        if _effective_joy_count == 2:
-            _frames_joy_below_effective += 1
-            if _frames_joy_below_effective >= STICKY_JOY_FRAMES:
-                _effective_joy_count = 1
-                _frames_joy_below_effective = 0
-        else:
-            _effective_joy_count = 1
-    else:
-        _effective_joy_count = 0
-        _frames_joy_below_effective = 0
+    """Nombre de manettes à utiliser (collant quand une manette disparaît un instant, pour éviter les flickers Bluetooth)."""
+    return get_gamepads().effective_count
 
 
-def tick_debug_joy_frame():
-    """À appeler une fois par frame dans la boucle principale (pour logs verbose)."""
-    global _debug_joy_global_frame
-    _debug_joy_global_frame += 1
-    return _debug_joy_global_frame
+def init_joysticks(players):
+    """Ouvre les manettes déjà branchées et assigne joy_id = i au joueur i s'il y a assez de manettes."""
+    gamepads = get_gamepads()
+    gamepads.start()
+    gamepads.assign(players)
+    tr = get_trace()
+    if tr.on[_TR_PADS]:
+        tr.emit(_TR_PADS, gamepads.count, gamepads.effective_count)
 
 
-def init_joysticks(player1, player2, force_log=False):
-    """Initialise les manettes et assigne joy_id aux joueurs (d'après le nombre effectif, collant à 2)."""
-    global _last_joystick_count
-    n_raw = pygame.joystick.get_count()
-    n_effective = get_effective_joy_count()
-    for i in range(n_raw):
-        try:
-            pygame.joystick.Joystick(i).init()
-        except Exception as e:
-            if DEBUG_JOYSTICK:
-                print(f"  [Manettes] Joystick({i}).init() erreur: {e}")
-    player1.joy_id = 0 if n_effective >= 1 else None
-    player2.joy_id = 1 if n_effective >= 2 else None
-    n_now = pygame.joystick.get_count()
-    for pl in (player1, player2):
-        if getattr(pl, "joy_id", None) is None:
-            if hasattr(pl, "joystick"):
-                pl.joystick = None
-        elif pl.joy_id >= n_now:
-            if hasattr(pl, "joystick"):
-                pl.joystick = None
-        else:
-            try:
-                pl.joystick = pygame.joystick.Joystick(pl.joy_id)
-                pl.joystick.init()
-            except Exception:
-                if hasattr(pl, "joystick"):
-                    pl.joystick = None
-    if DEBUG_JOYSTICK and (force_log or n_raw != _last_joystick_count):
-        _last_joystick_count = n_raw
-        print(f"[Manettes] get_count() = {n_raw} effective = {n_effective} -> P1.joy_id={player1.joy_id} P2.joy_id={player2.joy_id}")
-        for i in range(n_raw):
-            try:
-                j = pygame.joystick.Joystick(i)
-                print(f"  Joystick {i}: {j.get_name()!r} (axes={j.get_numaxes()}, buttons={j.get_numbuttons()}, hats={j.get_numhats()})")
-            except Exception as e:
-                print(f"  Joystick {i}: erreur {e}")
-
-
-def _do_full_joystick_rescan():
-    """Force une réénumération des manettes (quit+init). Donne à SDL le temps de voir les périphériques via event.pump()."""
-    try:
-        pygame.joystick.quit()
-        pygame.joystick.init()
-        for _ in range(8):
-            pygame.event.pump()
-    except Exception:
-        pass
-
-
-def tick_joystick_rescan(player1, player2):
-    """Met à jour l'état manettes. Rescan (quit+init) uniquement quand get_count()=0 pour redétecter. Pas de refresh quand connecté : sur macOS ça fait figer."""
-    global _joystick_ever_seen, _frames_n_zero, _poll_axis_prev, _poll_button_prev
-    _update_effective_joy_count()
-    n = pygame.joystick.get_count()
-    if n > 0:
-        _joystick_ever_seen = True
-        _frames_n_zero = 0
-    else:
-        _frames_n_zero += 1
-        if _frames_n_zero >= 2:
-            _poll_axis_prev.clear()
-            _poll_button_prev.clear()
-        if _frames_n_zero >= FULL_RESCAN_AFTER_FRAMES:
-            _do_full_joystick_rescan()
-            n = pygame.joystick.get_count()
-            if DEBUG_JOYSTICK and _frames_n_zero % 30 == FULL_RESCAN_AFTER_FRAMES:
-                print(f"[Manette DBG] Rescan (get_count()=0 depuis {_frames_n_zero} frames) -> get_count()={n}")
-            _update_effective_joy_count()
-    init_joysticks(player1, player2)
+def tick_gamepads(players):
+    """Une fois par frame : branchements / débranchements, puis réassignation des manettes aux joueurs (handles en cache)."""
+    gamepads = get_gamepads()
+    gamepads.update()
+    if gamepads.frames_without_pad >= 2:
+        _poll_axis_prev.clear()
+        _poll_button_prev.clear()
+    gamepads.assign(players)
 
 
 def get_poll_axis(joy_id: int, axis: int) -> float:
@@ -144,19 +76,18 @@ def get_joystick_poll_events(deadzone: float, confirm_buttons: tuple = (0, 9)):
     Fallback macOS : lit les manettes au polling et renvoie des events synthétiques
     (JOYAXISMOTION, JOYBUTTONDOWN) quand les events SDL ne sont pas livrés.
     """
-    global _poll_axis_prev, _poll_button_prev
     out = []
-    n = pygame.joystick.get_count()
-    if DEBUG_JOYSTICK and n == 0:
-        print("[Manette DBG] ATTENTION: get_joystick_poll_events() appelé alors que get_count()=0 -> cache vide, pas d'events.")
-    for joy_id in range(n):
+    joysticks = get_gamepads().joysticks()
+    n = len(joysticks)
+    tr = get_trace()
+    if n == 0 and tr.on[_TR_POLL_EMPTY]:
+        tr.emit(_TR_POLL_EMPTY)
+    for joy_id, j in enumerate(joysticks):
         try:
-            j = pygame.joystick.Joystick(joy_id)
-            j.init()
-        except Exception:
+            naxes = j.get_numaxes()
+            nbuttons = j.get_numbuttons()
+        except pygame.error:
             continue
-        naxes = j.get_numaxes()
-        nbuttons = j.get_numbuttons()
         for axis in range(min(2, naxes)):
             key = (joy_id, axis)
             val = j.get_axis(axis)
@@ -179,58 +110,83 @@ def get_joystick_poll_events(deadzone: float, confirm_buttons: tuple = (0, 9)):
             _poll_button_prev[key] = pressed
             if pressed and not prev:
                 out.append(pygame.event.Event(pygame.JOYBUTTONDOWN, joy=joy_id, button=btn))
-    if DEBUG_JOYSTICK_VERBOSE and _debug_joy_global_frame > 0 and _debug_joy_global_frame % DEBUG_JOYSTICK_VERBOSE_INTERVAL == 0:
-        cache_axes = " ".join(f"J{j}a{a}={_poll_axis_prev.get((j, a), 0):.2f}" for j in range(2) for a in range(2))
-        cache_btn0 = " ".join(f"J{j}B0={_poll_button_prev.get((j, 0), False)}" for j in range(2))
-        print(f"[Manette VERBOSE] frame={_debug_joy_global_frame} poll: get_count()={n} | cache {cache_axes} | {cache_btn0} | events_générés={len(out)}")
+    if tr.on[_TR_POLL] and tr.frame % DEBUG_JOYSTICK_VERBOSE_INTERVAL == 0:
+        tr.emit(_TR_POLL, n, len(out))
+        for joy_id in range(n):
+            tr.emit(_TR_POLL_PAD, joy_id, _poll_axis_prev.get((joy_id, 0), 0.0), _poll_axis_prev.get((joy_id, 1), 0.0))
     return out
 
 
-def get_player_input_state(player):
-    """Retourne (left, right, up, down) depuis clavier ou manette. Si le Player a _get_joy_input (manette directe), l'utiliser."""
-    if callable(getattr(player, "_get_joy_input", None)):
-        joy_in = player._get_joy_input()
-        if joy_in is not None:
-            return (joy_in[0], joy_in[1], joy_in[2], joy_in[3])
-    n_joy = get_effective_joy_count()
-    joy_id = getattr(player, "joy_id", None)
-    if joy_id is not None and joy_id < n_joy and n_joy >= 1:
-        ax0 = _poll_axis_prev.get((joy_id, 0), 0.0)
-        ax1 = _poll_axis_prev.get((joy_id, 1), 0.0)
-        left = ax0 < -JOY_DEADZONE
-        right = ax0 > JOY_DEADZONE
-        up = ax1 < -JOY_DEADZONE
-        down = ax1 > JOY_DEADZONE
-        if DEBUG_JOYSTICK_VERBOSE and _debug_joy_global_frame > 0 and _debug_joy_global_frame % DEBUG_JOYSTICK_VERBOSE_INTERVAL == 0:
-            who = "P1" if joy_id == 0 else "P2"
-            print(f"[Manette VERBOSE] frame={_debug_joy_global_frame} get_player_input_state({who}): joy_id={joy_id} ax0={ax0:.2f} ax1={ax1:.2f} -> L={left} R={right} U={up} D={down}")
-        return (left, right, up, down)
-    if DEBUG_JOYSTICK_VERBOSE and _debug_joy_global_frame > 0 and _debug_joy_global_frame % DEBUG_JOYSTICK_VERBOSE_INTERVAL == 0:
-        who = "P1" if joy_id == 0 else "P2"
-        reason = f"joy_id={joy_id} n_joy={n_joy}" if joy_id is not None else f"joy_id=None n_joy={n_joy}"
-        print(f"[Manette VERBOSE] frame={_debug_joy_global_frame} get_player_input_state({who}): MANETTE IGNORÉE ({reason}) -> clavier")
-    keys = pygame.key.get_pressed()
-    return (
-        keys[player.controls["left"]],
-        keys[player.controls["right"]],
-        keys[player.controls["jump"]],
-        keys[player.controls.get("down", pygame.K_s)],
+def _key_held(keys, player, action, default=None):
+    """Touche de l'action enfoncée ; False pour un joueur sans touche (joueurs 3+, manette uniquement)."""
+    key = player.controls.get(action, default)
+    return bool(keys[key]) if key is not None else False
+
+
+def sample_player_input(player, presses=(), keys=None):
+    """
+    Échantillonne clavier / manette du joueur en un InputFrame pour le tick (seule lecture des périphériques).
+    presses : appuis détectés via les events ("jump", "attack", "special", "counter").
+    keys : pygame.key.get_pressed() du tick, partagé entre joueurs (lu ici si absent).
+    """
+    joy_in = player._get_joy_input() if callable(getattr(player, "_get_joy_input", None)) else None
+    if joy_in is not None:
+        left, right, up, down, jump, stick_x, stick_y = joy_in
+        via_joystick = True
+    else:
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        left = _key_held(keys, player, "left")
+        right = _key_held(keys, player, "right")
+        jump = _key_held(keys, player, "jump")
+        up = jump
+        down = _key_held(keys, player, "down", pygame.K_s)
+        via_joystick = False
+        stick_x = stick_y = 0.0
+        # Fallback polling (manette vue par get_joystick_poll_events mais pas ouverte en direct)
+        n_joy = get_effective_joy_count()
+        joy_id = getattr(player, "joy_id", None)
+        if joy_id is not None and joy_id < n_joy:
+            stick_x = _poll_axis_prev.get((joy_id, 0), 0.0)
+            stick_y = _poll_axis_prev.get((joy_id, 1), 0.0)
+            left = left or stick_x < -JOY_DEADZONE
+            right = right or stick_x > JOY_DEADZONE
+            up = up or stick_y < -JOY_DEADZONE
+            down = down or stick_y > JOY_DEADZONE
+    return InputFrame(
+        left=left,
+        right=right,
+        up=up,
+        down=down,
+        jump=jump,
+        jump_pressed="jump" in presses,
+        attack_pressed="attack" in presses,
+        special_pressed="special" in presses,
+        counter_pressed="counter" in presses,
+        via_joystick=via_joystick,
+        stick_x=stick_x,
+        stick_y=stick_y,
     )
 
 
-def start_attack_from_input(player, hitboxes, jab, ftilt, utilt, dtilt, nair, fair, bair, uair, dair):
-    """Lance l'attaque appropriée selon l'entrée (sol / air)."""
-    left, right, up, down = get_player_input_state(player)
+def sample_inputs(players, presses):
+    """InputFrame de chaque joueur pour le tick (clavier lu une fois pour tous) ; presses : {joueur: appuis}."""
+    keys = pygame.key.get_pressed()
+    return [sample_player_input(pl, presses.get(pl, ()), keys) for pl in players]
+
+
+def select_attack_id(player, left, right, up, down, jab, ftilt, utilt, dtilt, nair, fair, bair, uair, dair):
+    """Choisit l'attaque normale selon la direction tenue (sol / air)."""
     on_ground = getattr(player, "on_ground", True)
     facing_right = getattr(player, "facing_right", True)
     if on_ground:
-        if up: player.start_attack(utilt, hitboxes)
-        elif down: player.start_attack(dtilt, hitboxes)
-        elif left or right: player.start_attack(ftilt, hitboxes)
-        else: player.start_attack(jab, hitboxes)
+        if up: return utilt
+        elif down: return dtilt
+        elif left or right: return ftilt
+        else: return jab
     else:
-        if up: player.start_attack(uair, hitboxes)
-        elif down: player.start_attack(dair, hitboxes)
-        elif (right and facing_right) or (left and not facing_right): player.start_attack(fair, hitboxes)
-        elif (left and facing_right) or (right and not facing_right): player.start_attack(bair, hitboxes)
-        else: player.start_attack(nair, hitboxes)
+        if up: return uair
+        elif down: return dair
+        elif (right and facing_right) or (left and not facing_right): return fair
+        elif (left and facing_right) or (right and not facing_right): return bair
+        else: return nair
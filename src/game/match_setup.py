@@ -0,0 +1,98 @@
+"""
+Création des joueurs et des plateformes d'un match (partagée par main.py et la simulation headless).
+"""
+import pygame
+from game.config import MAX_PLAYERS
+from player.player import Player
+from smash_platform.game_platform import Platform
+
+# Contrôles type Brawlhalla : P1 clavier A/D + F/E/H (ou manette 0), P2 flèches + M/I/J (ou manette 1).
+P1_CONTROLS = {
+    "left": pygame.K_a,
+    "right": pygame.K_d,
+    "jump": pygame.K_SPACE,
+    "down": pygame.K_s,
+    "attacking": pygame.K_f,
+    "special": pygame.K_e,
+    "grab": pygame.K_g,
+    "counter": pygame.K_h
+}
+P2_CONTROLS = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "jump": pygame.K_UP,
+    "down": pygame.K_DOWN,
+    "attacking": pygame.K_m,
+    "special": pygame.K_i,
+    "grab": pygame.K_o,
+    "counter": pygame.K_j
+}
+# Joueurs 3+ : manette uniquement (pas de touches)
+KEYBOARD_CONTROLS = (P1_CONTROLS, P2_CONTROLS)
+PLAYER_COLORS = (
+    (255, 0, 0), (0, 0, 255), (0, 200, 0), (255, 210, 0),
+    (170, 0, 255), (255, 130, 0), (0, 210, 230), (255, 100, 180),
+)
+# Demi-largeur (px) de la zone de spawn à plus de deux joueurs (la plateforme centrale fait 1000 px)
+SPAWN_SPREAD = 420
+
+
+def create_players(world_size, characters=("judy", "nick"), count: int = 2):
+    """
+    Crée count joueurs (MAX_PLAYERS au plus) répartis de part et d'autre du centre du monde :
+    P1 rouge (clavier A/D ou manette 0), P2 bleu (flèches ou manette 1), les suivants à la manette i seulement.
+    Les persos alternent dans characters.
+    """
+    world_w, world_h = world_size
+    count = max(1, min(MAX_PLAYERS, count))
+    players = []
+    for i, offset in enumerate(spawn_offsets(count)):
+        players.append(Player(
+            start_pos=(world_w // 2 + offset, world_h // 2),
+            color=PLAYER_COLORS[i],
+            controls=dict(KEYBOARD_CONTROLS[i]) if i < len(KEYBOARD_CONTROLS) else {},
+            screen_size=(world_w, world_h),
+            character=characters[i % len(characters)],
+            joystick_id=i
+        ))
+    return players
+
+
+def spawn_offsets(count: int):
+    """Décalages x des spawns par rapport au centre : ±200 à deux, sinon répartis sur la plateforme centrale."""
+    if count == 2:
+        return (-200, 200)
+    if count == 1:
+        return (0,)
+    step = 2 * SPAWN_SPREAD // (count - 1)
+    return tuple(-SPAWN_SPREAD + i * step for i in range(count))
+
+
+def create_platforms(world_size, main_size, main_image, small_size, small_image):
+    """Plateformes : une centrale + deux petites en hauteur (one-way)."""
+    world_w, world_h = world_size
+    wc_x, wc_y = world_w // 2, world_h // 2
+    platforms = pygame.sprite.Group()
+    platforms.add(
+        Platform(
+            main_size,
+            (wc_x - main_size[0] // 2, wc_y + 200),
+            image=main_image,
+            surface_offset=int(main_size[1] * 0.42) if main_image else 0
+        ),
+        Platform(
+            small_size,
+            (wc_x - 350 - small_size[0] // 2, wc_y - 150),
+            one_way=True,
+            image=small_image,
+            surface_offset=int(small_size[1] * 0.38)
+        ),
+        Platform(
+            small_size,
+            (wc_x + 350 - small_size[0] // 2, wc_y - 150),
+            one_way=True,
+            image=small_image,
+            surface_offset=int(small_size[1] * 0.38)
+        ),
+    )
+    return platforms
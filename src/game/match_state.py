@@ -0,0 +1,90 @@
+"""
+Sauvegarde / restauration de l'état complet d'un match (rollback réseau, replays) : attributs des joueurs
+(rect, vitesses, hitstun, sauts, stats, file de staleness, timers d'attaque et de rafale...), hitboxes et projectiles
+en vol (frame courante, cibles déjà touchées), numéro de frame de la Simulation.
+Les objets partagés (images, hitboxes compilées, plateformes, propriétaire d'une attaque) sont gardés par
+référence ; seuls les conteneurs modifiables (Rect, list, set, dict) sont recopiés, à la capture comme à la
+restauration (un même état peut être restauré plusieurs fois).
+"""
+import hashlib
+import pygame
+
+# Appartenance aux groupes pygame : gérée par Group.add / empty, jamais recopiée
+_SPRITE_GROUPS_ATTR = "_Sprite__g"
+_COPIED_TYPES = (pygame.Rect, list, set, dict)
+# État physique d'un joueur pris dans l'empreinte (en plus du rect)
+_CHECKSUM_ATTRS = (
+    "prev_x", "prev_y", "speed_x", "speed_y", "hitstun", "tumbling", "jump_count", "coyote_frames",
+    "jump_buffer_frames", "respawn_invuln", "_stomp_cooldown", "lives", "on_ground", "crouching",
+    "_jump_held", "_down_held", "_did_air_jump_this_flight",
+)
+
+
+def _copy_attrs(attrs):
+    return {
+        name: (value.copy() if isinstance(value, _COPIED_TYPES) else value)
+        for name, value in attrs.items()
+        if name != _SPRITE_GROUPS_ATTR
+    }
+
+
+def _restore_attrs(obj, attrs):
+    groups = obj.__dict__.get(_SPRITE_GROUPS_ATTR)
+    obj.__dict__.clear()
+    obj.__dict__.update(_copy_attrs(attrs))
+    if groups is not None:
+        obj.__dict__[_SPRITE_GROUPS_ATTR] = groups
+
+
+class MatchState:
+    """État d'une Simulation au début d'un frame (capture(sim) / restore(sim, state))."""
+
+    __slots__ = ("frame", "players", "stats", "sprites", "last_kos", "prev_topleft")
+
+    def __init__(self, frame, players, stats, sprites, last_kos, prev_topleft):
+        self.frame = frame
+        self.players = players
+        self.stats = stats
+        self.sprites = sprites
+        self.last_kos = last_kos
+        self.prev_topleft = prev_topleft
+
+
+def capture(sim) -> MatchState:
+    return MatchState(
+        frame=sim.frame,
+        players=[_copy_attrs(p.__dict__) for p in sim.players],
+        stats=[dict(p.stats.__dict__) for p in sim.players],
+        sprites=[(sprite, _copy_attrs(sprite.__dict__)) for sprite in sim.hitboxes.sprites()],
+        last_kos=list(sim.last_kos),
+        prev_topleft=dict(sim._prev_topleft),
+    )
+
+
+def restore(sim, state: MatchState):
+    for player, attrs, stats in zip(sim.players, state.players, state.stats):
+        _restore_attrs(player, attrs)
+        player.stats.__dict__.update(stats)
+    # Les sprites créés après la capture disparaissent, ceux détruits depuis reviennent (même ordre)
+    sim.hitboxes.empty()
+    for sprite, attrs in state.sprites:
+        _restore_attrs(sprite, attrs)
+        sim.hitboxes.add(sprite)
+    sim.frame = state.frame
+    sim.last_kos = list(state.last_kos)
+    sim._prev_topleft = dict(state.prev_topleft)
+
+
+def checksum(sim) -> str:
+    """Empreinte de l'état de jeu (positions, vitesses, timers, stocks, pourcentages, hitboxes) : détection de désync."""
+    h = hashlib.blake2b(digest_size=8)
+    for player in sim.players:
+        h.update(repr((tuple(player.rect), *(getattr(player, name) for name in _CHECKSUM_ATTRS))).encode())
+        h.update(repr((player.stats.percent, player.state, player.facing_right, player.stale_queue)).encode())
+    for sprite in sim.hitboxes:
+        h.update(repr((
+            type(sprite).__name__, tuple(sprite.rect), getattr(sprite, "attack_id", None),
+            getattr(sprite, "current_frame", None), getattr(sprite, "lifetime", None),
+        )).encode())
+    h.update(sim.frame.to_bytes(8, "little"))
+    return h.hexdigest()
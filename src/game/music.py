@@ -0,0 +1,46 @@
+"""
+Musique de fond (pygame.mixer.music : une seule piste à la fois). Chaque écran déclare sa piste (Screen.music) ;
+le registre des écrans la lance à l'entrée si elle ne joue pas déjà, elle continue sinon d'un écran à l'autre.
+"""
+import pygame
+
+# Piste -> (attribut chemin dans les assets, attribut fichier présent, volume, boucles : -1 = sans fin, 0 = une fois)
+MUSIC_TRACKS = {
+    "menu": ("menu_music_path", "menu_music_loaded", 0.15, -1),
+    "combat": ("combat_music_path", "combat_music_loaded", 0.10, -1),
+    "win": ("win_music_path", "win_music_loaded", 0.15, 0),
+}
+# Piste "silence" : coupe la musique en cours
+MUSIC_OFF = "off"
+
+
+class MusicPlayer:
+    def __init__(self):
+        self.current = None  # piste en cours (clé de MUSIC_TRACKS) ou None
+
+    def play(self, assets, track: str):
+        """Lance la piste (sans effet si elle joue déjà) ; absente ou MUSIC_OFF : silence."""
+        if track == self.current:
+            return
+        self.stop()
+        if track == MUSIC_OFF:
+            return
+        path_attr, loaded_attr, volume, loops = MUSIC_TRACKS[track]
+        if not getattr(assets, loaded_attr, False):
+            return
+        try:
+            pygame.mixer.music.load(getattr(assets, path_attr))
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(loops)
+            self.current = track
+        except Exception:
+            pass
+
+    def stop(self):
+        if self.current is None:
+            return
+        self.current = None
+        try:
+            pygame.mixer.music.stop()
+        except Exception:
+            pass
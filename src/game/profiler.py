@@ -0,0 +1,131 @@
+"""
+Profileur de frame en jeu (F3 pendant le combat) : temps par phase (events, rollback réseau, handle_input,
+Player.update, hitboxes, caméra, monde, HUD, flip), moyennes glissantes et sparkline du temps de frame
+vs budget 16,6 ms.
+Désactivé, chaque appel se résume à un test de booléen.
+"""
+import collections
+import time
+import pygame
+
+# Ordre d'affichage des phases (les ticks multiples d'un même frame s'additionnent)
+PHASES = ("events", "rollback", "handle_input", "player_update", "hitboxes", "camera", "world", "hud", "flip")
+PHASE_COLORS = {
+    "events": (120, 200, 255),
+    "rollback": (255, 90, 90),
+    "handle_input": (140, 255, 160),
+    "player_update": (255, 220, 100),
+    "hitboxes": (255, 150, 90),
+    "camera": (200, 160, 255),
+    "world": (90, 220, 220),
+    "hud": (255, 120, 200),
+    "flip": (200, 200, 200),
+}
+FRAME_BUDGET_MS = 1000.0 / 60
+HISTORY_FRAMES = 120
+PANEL_WIDTH = 300
+SPARKLINE_HEIGHT = 48
+
+
+class FrameProfiler:
+    """Chronomètre par phase : begin_frame(), lap(phase) après chaque phase, end_frame() après le flip."""
+
+    def __init__(self, history: int = HISTORY_FRAMES):
+        self.enabled = False
+        self._clock = time.perf_counter
+        self._mark = 0.0
+        self._frame_start = 0.0
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._history = {name: collections.deque(maxlen=history) for name in PHASES}
+        self._frame_ms = collections.deque(maxlen=history)
+        self._font = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if not self.enabled:
+            for samples in self._history.values():
+                samples.clear()
+            self._frame_ms.clear()
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = self._mark = self._clock()
+        for name in self._current:
+            self._current[name] = 0.0
+
+    def lap(self, phase: str):
+        """Attribue à phase le temps écoulé depuis le dernier lap (ou begin_frame)."""
+        if not self.enabled:
+            return
+        now = self._clock()
+        self._current[phase] += (now - self._mark) * 1000.0
+        self._mark = now
+
+    def skip(self):
+        """Repart de maintenant sans rien attribuer (travail hors phases, ex. dessin de l'overlay lui-même)."""
+        if self.enabled:
+            self._mark = self._clock()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        for name, value in self._current.items():
+            self._history[name].append(value)
+        self._frame_ms.append((self._clock() - self._frame_start) * 1000.0)
+
+    def average(self, phase: str) -> float:
+        samples = self._history[phase]
+        return sum(samples) / len(samples) if samples else 0.0
+
+    def frame_average(self) -> float:
+        return sum(self._frame_ms) / len(self._frame_ms) if self._frame_ms else 0.0
+
+    def _get_font(self):
+        if self._font is None:
+            try:
+                self._font = pygame.font.SysFont("consolas", 16)
+            except Exception:
+                self._font = pygame.font.Font(None, 20)
+        return self._font
+
+    def draw(self, surface, x: int = 10, y: int = 10):
+        """Panneau semi-transparent : moyenne par phase (ms), frame moyen / pire, sparkline des derniers frames."""
+        if not self.enabled:
+            return
+        font = self._get_font()
+        line_h = font.get_linesize()
+        panel_h = (len(PHASES) + 2) * line_h + SPARKLINE_HEIGHT + 16
+        panel = pygame.Surface((PANEL_WIDTH, panel_h))
+        panel.set_alpha(190)
+        panel.fill((15, 18, 24))
+        surface.blit(panel, (x, y))
+
+        worst = max(self._frame_ms) if self._frame_ms else 0.0
+        frame_avg = self.frame_average()
+        color = (255, 90, 90) if frame_avg > FRAME_BUDGET_MS else (255, 255, 255)
+        title = font.render(f"frame {frame_avg:5.2f} ms  max {worst:5.2f}", True, color)
+        surface.blit(title, (x + 8, y + 4))
+        row_y = y + 4 + line_h
+        for name in PHASES:
+            avg = self.average(name)
+            surface.blit(font.render(name, True, PHASE_COLORS[name]), (x + 8, row_y))
+            value = font.render(f"{avg:.2f} ms", True, PHASE_COLORS[name])
+            surface.blit(value, value.get_rect(topright=(x + PANEL_WIDTH - 90, row_y)))
+            bar_w = int(min(1.0, avg / FRAME_BUDGET_MS) * 70)
+            if bar_w > 0:
+                pygame.draw.rect(surface, PHASE_COLORS[name], (x + PANEL_WIDTH - 80, row_y + 3, bar_w, line_h - 6))
+            row_y += line_h
+
+        spark = pygame.Rect(x + 8, row_y + 6, PANEL_WIDTH - 16, SPARKLINE_HEIGHT)
+        pygame.draw.rect(surface, (40, 44, 54), spark)
+        scale_ms = max(FRAME_BUDGET_MS * 2, worst)
+        budget_y = spark.bottom - int(FRAME_BUDGET_MS / scale_ms * spark.height)
+        pygame.draw.line(surface, (255, 90, 90), (spark.left, budget_y), (spark.right, budget_y))
+        if len(self._frame_ms) >= 2:
+            step = spark.width / (self._frame_ms.maxlen - 1)
+            points = [
+                (spark.left + int(i * step), spark.bottom - int(min(ms, scale_ms) / scale_ms * spark.height))
+                for i, ms in enumerate(self._frame_ms)
+            ]
+            pygame.draw.lines(surface, (140, 255, 160), False, points)
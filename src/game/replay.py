@@ -0,0 +1,191 @@
+"""
+Replays : un match enregistré sous forme d'entrées (bitmask InputFrame.to_bits par joueur et par frame) +
+graine du module random, carte, persos, stocks et taille du monde. La simulation étant déterministe, rejouer
+ces entrées depuis reset_match redonne exactement le même état (Player, hitboxes, stocks) ; l'empreinte
+(game/match_state.checksum) de fin de match est gardée pour le vérifier.
+Lecture à 1x dans le jeu (main.py --replay), ou headless à pleine vitesse (tools/replay.py : aller à un
+frame, revérifier un résultat, mesurer le coût d'un tick sur une partie réelle).
+
+Fichier : magic + version, puis zlib(en-tête JSON + "\\n" + entrées en uint16 big-endian, joueur par joueur).
+Les directions restent tenues des dizaines de frames : quelques Ko pour un match de plusieurs minutes.
+"""
+import json
+import os
+import random
+import struct
+import time
+import zlib
+from array import array
+from game.match_state import checksum
+from player.player_input import InputFrame
+
+REPLAY_VERSION = 2
+# Versions encore lisibles : entrées identiques, mais l'empreinte v1 (tableaux de l'ancien état physique) n'est plus
+# comparable à game/match_state.checksum et n'est pas reprise
+_COMPATIBLE_VERSIONS = (1, REPLAY_VERSION)
+REPLAY_EXTENSION = ".smr"
+_HEADER = struct.Struct("!4sB")
+_MAGIC = b"SMR1"
+_DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "replays")
+
+
+class Replay:
+    """
+    Match enregistré. inputs[f] : tuple des bits de chaque joueur au frame f ; events : (frame, joueur,
+    attribut, valeur) posés sur un joueur juste avant ce frame (triches), hors des entrées.
+    """
+
+    def __init__(self, seed, map_index, characters, lives, world_size, inputs, events=(), final_checksum=None):
+        self.seed = seed
+        self.map_index = map_index
+        self.characters = tuple(characters)
+        self.lives = lives
+        self.world_size = tuple(world_size)
+        self.inputs = inputs
+        self.events = [tuple(e) for e in events]
+        self.final_checksum = final_checksum
+        self._events_by_frame = {}
+        for event in self.events:
+            self._events_by_frame.setdefault(event[0], []).append(event)
+
+    @property
+    def frames(self) -> int:
+        return len(self.inputs)
+
+    def inputs_for(self, sim):
+        """Entrées du frame courant de sim (événements du frame appliqués), ou None après le dernier frame."""
+        frame = sim.frame
+        if frame >= len(self.inputs):
+            return None
+        for _, index, name, value in self._events_by_frame.get(frame, ()):
+            setattr(sim.players[index], name, value)
+        return [InputFrame.from_bits(bits) for bits in self.inputs[frame]]
+
+    def start(self, sim):
+        """Remet sim dans l'état de début du match enregistré (persos, graine, stocks) ; sim.frame = 0."""
+        random.seed(self.seed)
+        sim.recorder = None
+        # Même ordre que dans le jeu : reset au menu VERSUS, persos choisis ensuite
+        sim.reset_match(lives=self.lives)
+        for player, character in zip(sim.players, self.characters):
+            player.set_character(character)
+
+    def play(self, sim, until_frame=None) -> int:
+        """Avance sim sans rendu jusqu'à until_frame (par défaut la fin) ; renvoie le frame atteint."""
+        end = self.frames if until_frame is None else min(until_frame, self.frames)
+        while sim.frame < end:
+            sim.step(self.inputs_for(sim))
+        return sim.frame
+
+    def to_bytes(self) -> bytes:
+        header = {
+            "seed": self.seed,
+            "map": self.map_index,
+            "characters": self.characters,
+            "lives": self.lives,
+            "world_size": self.world_size,
+            "players": len(self.characters),
+            "frames": self.frames,
+            "events": self.events,
+            "checksum": self.final_checksum,
+        }
+        # Joueur par joueur : chaque flux est fait de longues répétitions, que zlib compresse très bien
+        streams = array("H", (frame[i] for i in range(len(self.characters)) for frame in self.inputs))
+        streams.byteswap()
+        payload = json.dumps(header, separators=(",", ":")).encode() + b"\n" + streams.tobytes()
+        return _HEADER.pack(_MAGIC, REPLAY_VERSION) + zlib.compress(payload, 9)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """Replay lu depuis to_bytes ; ValueError si le fichier n'est pas un replay de cette version."""
+        if len(data) < _HEADER.size:
+            raise ValueError("replay tronqué")
+        magic, version = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version not in _COMPATIBLE_VERSIONS:
+            raise ValueError(f"pas un replay Smashtopia v{REPLAY_VERSION}")
+        header_json, _, raw = zlib.decompress(data[_HEADER.size:]).partition(b"\n")
+        header = json.loads(header_json)
+        count, frames = header["players"], header["frames"]
+        streams = array("H")
+        streams.frombytes(raw)
+        streams.byteswap()
+        if len(streams) != count * frames:
+            raise ValueError("replay tronqué")
+        inputs = list(zip(*(streams[i * frames:(i + 1) * frames] for i in range(count))))
+        return cls(
+            header["seed"], header["map"], header["characters"], header["lives"], header["world_size"],
+            inputs, header["events"], header["checksum"] if version == REPLAY_VERSION else None,
+        )
+
+
+class ReplayRecorder:
+    """
+    Enregistre le match de sim : Simulation.step appelle record(sim) à chaque tick (sim.recorder), entrées
+    des joueurs posées. Un frame rejoué (rollback en ligne) écrase les entrées enregistrées depuis ce frame.
+    """
+
+    def __init__(self, seed, lives):
+        self.seed = seed
+        self.lives = lives
+        self._inputs = []
+        self._events = []
+
+    def record(self, sim):
+        frame = sim.frame
+        del self._inputs[frame:]
+        self._inputs.append(tuple(p.input.to_bits() for p in sim.players))
+
+    def note(self, sim, player, name: str, value):
+        """Pose player.name = value avant le prochain tick et l'enregistre (état hors entrées : triches)."""
+        setattr(player, name, value)
+        self._events.append((sim.frame, sim.players.index(player), name, value))
+
+    def finish(self, sim, map_index: int) -> Replay:
+        """Replay du match jusqu'au frame courant de sim, avec l'empreinte de l'état atteint."""
+        first = sim.players[0]
+        return Replay(
+            self.seed,
+            map_index,
+            [p.character for p in sim.players],
+            self.lives,
+            (first.screen_width, first.screen_height),
+            list(self._inputs[:sim.frame]),
+            [e for e in self._events if e[0] < sim.frame],
+            checksum(sim),
+        )
+
+
+def save_replay(replay: Replay, directory: str = _DEFAULT_DIR, keep: int = None) -> str:
+    """Écrit replay dans directory (nom horodaté) ; au-delà de keep fichiers, les plus anciens sont supprimés."""
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"{stamp}{REPLAY_EXTENSION}")
+    n = 1
+    while os.path.exists(path):
+        n += 1
+        path = os.path.join(directory, f"{stamp}-{n}{REPLAY_EXTENSION}")
+    with open(path, "wb") as f:
+        f.write(replay.to_bytes())
+    if keep is not None:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(REPLAY_EXTENSION))
+        for name in names[:max(0, len(names) - keep)]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+    return path
+
+
+def load_replay(path: str) -> Replay:
+    with open(path, "rb") as f:
+        return Replay.from_bytes(f.read())
+
+
+def replay_simulation(replay: Replay):
+    """Simulation headless prête à rejouer replay (même taille de monde, persos et graine) ; frame 0."""
+    from game.simulation import create_headless_simulation
+
+    # Joueurs créés avec les persos par défaut comme dans main.py, puis set_character (start)
+    sim = create_headless_simulation(world_size=replay.world_size, count=len(replay.characters))
+    replay.start(sim)
+    return sim
@@ -1,3 +1,5 @@
+from game.screens.base import Screen, ScreenRegistry
+from game.screens.menus import MainMenuScreen, SettingsScreen, ControlsScreen, TitleScreen
 from game.screens.map_select import MapSelectScreen
 from game.screens.character_select import CharacterSelectScreen
 from game.screens.judy_nick_intro_video import JudyNickIntroVideoScreen
@@ -13,6 +15,12 @@ from game.screens.win_screens import NickWinScreen, JudyWinScreen
 from game.screens.playing import PlayingScreen
 
 __all__ = [
+    "Screen",
+    "ScreenRegistry",
+    "MainMenuScreen",
+    "SettingsScreen",
+    "ControlsScreen",
+    "TitleScreen",
     "MapSelectScreen",
     "CharacterSelectScreen",
     "JudyNickIntroVideoScreen",
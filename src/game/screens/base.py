@@ -0,0 +1,76 @@
+"""
+Registre des écrans : chaque état de jeu (ctx.game_state) est servi par un écran qui déclare ce qu'il utilise
+(groupes d'assets, GIFs affichés, musique, images/s) et remet son propre état à zéro dans enter().
+Un écran demande une transition en changeant ctx.game_state ; au frame suivant le registre appelle exit()
+de l'ancien écran, libère les GIFs qu'il était seul à afficher, lance la musique du nouveau puis son enter().
+La mémoire occupée suit donc l'écran courant, pas tous les écrans visités depuis le lancement.
+"""
+from game.config import MENU_FPS
+
+
+class Screen:
+    # Groupes d'assets nécessaires (ASSET_GROUPS, game/assets.py) : écran d'attente tant qu'ils ne sont pas prêts
+    asset_groups = ()
+    # Groupes préchargés en arrière-plan dès l'entrée, pour les écrans qui peuvent suivre
+    preload_ahead = ()
+    # Attributs GifStream des assets affichés par l'écran : frames libérées à la sortie
+    gif_streams = ()
+    # Piste (game/music.py) lancée à l'entrée ; None : la musique en cours continue
+    music = None
+    frame_rate = MENU_FPS
+
+    def enter(self, ctx):
+        """L'écran devient courant : état de la visite remis à zéro, ressources propres acquises."""
+
+    def exit(self, ctx):
+        """L'écran est quitté (ou la boucle se termine) : ressources propres libérées."""
+
+    def run(self, ctx):
+        """Un frame : events, mise à jour, dessin, flip."""
+        raise NotImplementedError
+
+
+class ScreenRegistry:
+    """game_state -> écran ; suit l'écran courant et fait les transitions."""
+
+    def __init__(self):
+        self._screens = {}
+        self.state = None
+        self.current = None
+
+    def register(self, state: str, screen: Screen):
+        self._screens[state] = screen
+        return screen
+
+    def __getitem__(self, state: str) -> Screen:
+        return self._screens[state]
+
+    def __contains__(self, state: str) -> bool:
+        return state in self._screens
+
+    def sync(self, ctx) -> Screen:
+        """Écran de ctx.game_state ; s'il a changé depuis le dernier appel : exit() de l'ancien, enter() du nouveau."""
+        if ctx.game_state != self.state:
+            self._switch(ctx, ctx.game_state)
+        return self.current
+
+    def _switch(self, ctx, state: str):
+        previous = self.current
+        screen = self._screens[state]
+        if previous is not None:
+            previous.exit(ctx)
+            ctx.assets.release_gif_streams(*(a for a in previous.gif_streams if a not in screen.gif_streams))
+        self.state = state
+        self.current = screen
+        ctx.assets.preload(*screen.preload_ahead)
+        if screen.music is not None:
+            ctx.music.play(ctx.assets, screen.music)
+        screen.enter(ctx)
+
+    def close(self, ctx):
+        """Fin de la boucle : l'écran courant libère ses ressources."""
+        if self.current is not None:
+            self.current.exit(ctx)
+            ctx.assets.release_gif_streams(*self.current.gif_streams)
+            self.current = None
+            self.state = None
@@ -4,19 +4,31 @@ P2 ne peut pas prendre le même perso que P1.
 """
 import pygame
 from game.config import JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_START
+from game.gamepads import get_gamepads
 from game.input_handling import get_joystick_poll_events, safe_event_get
+from game.screens.base import Screen
 
 
-class CharacterSelectScreen:
+class CharacterSelectScreen(Screen):
+    asset_groups = ("select_screens",)
+    preload_ahead = ("versus_gifs", "combat")
+
+    def __init__(self):
+        self._phase = "p1"
+        self._cursor = 0
+        self._p1_choice = None
+        self._p2_choice = None
+
+    def enter(self, ctx):
+        self._phase = "p1"
+        self._cursor = 0
+        self._p1_choice = None
+        self._p2_choice = None
+
     def run(self, ctx):
         # Récupère les events + ceux des manettes (poll) pour que les gamepads répondent bien
         events = safe_event_get()
-        n_joy = pygame.joystick.get_count()
-        for jid in range(min(2, n_joy)):
-            try:
-                pygame.joystick.Joystick(jid).init()
-            except Exception:
-                pass
+        n_joy = get_gamepads().count
         if n_joy > 0:
             events.extend(get_joystick_poll_events(JOY_DEADZONE, (JOY_BTN_JUMP, JOY_BTN_START)))
 
@@ -38,12 +50,12 @@ class CharacterSelectScreen:
             p2_confirm = (ctx.player2.controls.get("jump", pygame.K_UP), pygame.K_UP) + confirm_keys
 
             # ——— Phase Joueur 1 : il bouge le curseur et valide
-            if ctx.char_select_phase == "p1":
+            if self._phase == "p1":
                 if event.type == pygame.KEYDOWN:
                     if event.key in p1_left:
-                        ctx.char_select_cursor = (ctx.char_select_cursor - 1) % len(ctx.characters)
+                        self._cursor = (self._cursor - 1) % len(ctx.characters)
                     elif event.key in p1_right:
-                        ctx.char_select_cursor = (ctx.char_select_cursor + 1) % len(ctx.characters)
+                        self._cursor = (self._cursor + 1) % len(ctx.characters)
                     elif event.key in confirm_keys:
                         self._confirm(ctx)
                         return
@@ -51,9 +63,9 @@ class CharacterSelectScreen:
                 if event.type == pygame.JOYAXISMOTION and joy_ok_p1 and event.axis == 0:
                     ax = event.value
                     if ax < -JOY_DEADZONE:
-                        ctx.char_select_cursor = (ctx.char_select_cursor - 1) % len(ctx.characters)
+                        self._cursor = (self._cursor - 1) % len(ctx.characters)
                     elif ax > JOY_DEADZONE:
-                        ctx.char_select_cursor = (ctx.char_select_cursor + 1) % len(ctx.characters)
+                        self._cursor = (self._cursor + 1) % len(ctx.characters)
                 if event.type == pygame.JOYBUTTONDOWN and joy_ok_p1 and event.button in (JOY_BTN_JUMP, JOY_BTN_START):
                     self._confirm(ctx)
                     return
@@ -62,27 +74,27 @@ class CharacterSelectScreen:
             else:
                 if event.type == pygame.KEYDOWN:
                     if event.key in p2_left:
-                        ctx.char_select_cursor = (ctx.char_select_cursor - 1) % len(ctx.characters)
+                        self._cursor = (self._cursor - 1) % len(ctx.characters)
                         # Si on tombe sur le perso de P1, on recule encore d’un cran
-                        if ctx.characters[ctx.char_select_cursor] == ctx.p1_character_choice:
-                            ctx.char_select_cursor = (ctx.char_select_cursor - 1) % len(ctx.characters)
+                        if ctx.characters[self._cursor] == self._p1_choice:
+                            self._cursor = (self._cursor - 1) % len(ctx.characters)
                     elif event.key in p2_right:
-                        ctx.char_select_cursor = (ctx.char_select_cursor + 1) % len(ctx.characters)
-                        if ctx.characters[ctx.char_select_cursor] == ctx.p1_character_choice:
-                            ctx.char_select_cursor = (ctx.char_select_cursor + 1) % len(ctx.characters)
+                        self._cursor = (self._cursor + 1) % len(ctx.characters)
+                        if ctx.characters[self._cursor] == self._p1_choice:
+                            self._cursor = (self._cursor + 1) % len(ctx.characters)
                     elif event.key in p2_confirm:
                         self._confirm(ctx)
                         return
                 if event.type == pygame.JOYAXISMOTION and joy_ok_p2 and event.axis == 0:
                     ax = event.value
                     if ax < -JOY_DEADZONE:
-                        ctx.char_select_cursor = (ctx.char_select_cursor - 1) % len(ctx.characters)
-                        if ctx.characters[ctx.char_select_cursor] == ctx.p1_character_choice:
-                            ctx.char_select_cursor = (ctx.char_select_cursor - 1) % len(ctx.characters)
+                        self._cursor = (self._cursor - 1) % len(ctx.characters)
+                        if ctx.characters[self._cursor] == self._p1_choice:
+                            self._cursor = (self._cursor - 1) % len(ctx.characters)
                     elif ax > JOY_DEADZONE:
-                        ctx.char_select_cursor = (ctx.char_select_cursor + 1) % len(ctx.characters)
-                        if ctx.characters[ctx.char_select_cursor] == ctx.p1_character_choice:
-                            ctx.char_select_cursor = (ctx.char_select_cursor + 1) % len(ctx.characters)
+                        self._cursor = (self._cursor + 1) % len(ctx.characters)
+                        if ctx.characters[self._cursor] == self._p1_choice:
+                            self._cursor = (self._cursor + 1) % len(ctx.characters)
                 if event.type == pygame.JOYBUTTONDOWN and joy_ok_p2 and event.button in (JOY_BTN_JUMP, JOY_BTN_START):
                     self._confirm(ctx)
                     return
@@ -91,35 +103,33 @@ class CharacterSelectScreen:
             return
         self._draw(ctx)
         pygame.display.flip()
-        ctx.clock.tick(60)
 
     def _confirm(self, ctx):
         """Quand un joueur valide : soit on passe à P2, soit on lance la partie (vidéo ou versus)."""
-        if ctx.char_select_phase == "p1":
+        if self._phase == "p1":
             # P1 a choisi → on enregistre et on passe au tour de P2
-            ctx.p1_character_choice = ctx.characters[ctx.char_select_cursor]
-            ctx.char_select_phase = "p2"
+            self._p1_choice = ctx.characters[self._cursor]
+            self._phase = "p2"
             # Curseur P2 : on met sur l’autre perso par défaut pour éviter de rester sur celui de P1
-            ctx.char_select_cursor = 1 if ctx.p1_character_choice == "judy" else 0
+            self._cursor = 1 if self._p1_choice == "judy" else 0
         else:
             # P2 a choisi → on assigne les persos aux joueurs et on enchaîne
-            ctx.p2_character_choice = ctx.characters[ctx.char_select_cursor]
-            ctx.assets.background = ctx.assets.map_surfaces[ctx.selected_map_index].copy()
-            ctx.player1.set_character(ctx.p1_character_choice)
-            ctx.player2.set_character(ctx.p2_character_choice)
+            self._p2_choice = ctx.characters[self._cursor]
+            ctx.assets.background = ctx.assets.map_surfaces[ctx.selected_map_index]
+            ctx.stage_layer.surface_for(ctx)
+            # Joueurs 3+ (free-for-all) : alternent les persos de P1 et P2
+            choices = (self._p1_choice, self._p2_choice)
+            for i, pl in enumerate(ctx.simulation.players):
+                pl.set_character(choices[i % 2])
             # Selon les combos Judy/Nick on part sur la bonne intro vidéo ou direct versus
-            if ctx.p1_character_choice == "judy" and ctx.p2_character_choice == "nick":
+            if self._p1_choice == "judy" and self._p2_choice == "nick":
                 ctx.intro_video_filename = "1.mp4"
                 ctx.game_state = "intro_video"
-            elif ctx.p1_character_choice == "nick" and ctx.p2_character_choice == "judy":
+            elif self._p1_choice == "nick" and self._p2_choice == "judy":
                 ctx.intro_video_filename = "1_2.mp4"
                 ctx.game_state = "intro_video"
             else:
                 ctx.game_state = "versus_gif"
-                ctx.versus_gif_frame_index = 0
-                ctx.versus_gif_timer_ms = 0
-                ctx.versus_gif_phase = "playing"
-                ctx.wait_after_gif_timer_ms = 0
 
     def _draw(self, ctx):
         """Dessine l’écran : fond, titre (J1 ou J2), slots des persos, curseur, hint en bas."""
@@ -131,7 +141,7 @@ class CharacterSelectScreen:
         else:
             ctx.screen.fill((30, 30, 50))
 
-        title_text = "Joueur 1 - Choisis ton personnage" if ctx.char_select_phase == "p1" else "Joueur 2 - Choisis ton personnage"
+        title_text = "Joueur 1 - Choisis ton personnage" if self._phase == "p1" else "Joueur 2 - Choisis ton personnage"
         try:
             font_cs = pygame.font.SysFont("arial", 52, bold=True)
             font_opt = pygame.font.SysFont("arial", 42, bold=True)
@@ -146,7 +156,7 @@ class CharacterSelectScreen:
         opt_y = ctx.screen_h // 2
         slot_w, slot_h = 280, 80
         for i, label in enumerate(ctx.character_labels):
-            taken = ctx.char_select_phase == "p2" and ctx.p1_character_choice is not None and ctx.characters[i] == ctx.p1_character_choice
+            taken = self._phase == "p2" and self._p1_choice is not None and ctx.characters[i] == self._p1_choice
             x_center = ctx.screen_w // 2 + (i * 2 - 1) * 320
             slot_rect = pygame.Rect(x_center - slot_w // 2, opt_y - slot_h // 2, slot_w, slot_h)
 
@@ -159,10 +169,10 @@ class CharacterSelectScreen:
                 ctx.screen.blit(lbl, lbl.get_rect(center=(x_center, slot_rect.bottom - 18)))
             else:
                 # Case sélectionnable : surlignée en jaune si c’est le curseur
-                color = (255, 220, 100) if i == ctx.char_select_cursor else (200, 200, 200)
+                color = (255, 220, 100) if i == self._cursor else (200, 200, 200)
                 opt = font_opt.render(label, True, color)
                 opt_rect = opt.get_rect(center=(x_center, opt_y))
-                if i == ctx.char_select_cursor:
+                if i == self._cursor:
                     pygame.draw.rect(ctx.screen, (255, 220, 100), slot_rect, 2)
                     cur = font_opt.render(">", True, (255, 220, 100))
                     ctx.screen.blit(cur, (opt_rect.left - 40, opt_rect.centery - cur.get_height() // 2))
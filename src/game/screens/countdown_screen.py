@@ -2,12 +2,25 @@
 Countdown 3-2-1-Go avant le combat : fond = carte choisie, joueurs et plateformes affichés.
 """
 import pygame
-from game.config import COUNTDOWN_DURATION_MS
-from game.hud import draw_player_ping
+from game.config import COUNTDOWN_DURATION_MS, RENDER_FPS_CAP
+from game.hud import draw_player_ping, player_ping_surface
+from game.world_view import WorldView
 from game.input_handling import safe_event_get
+from game.screens.base import Screen
 
 
-class CountdownScreen:
+class CountdownScreen(Screen):
+    asset_groups = ("maps", "combat", "characters", "sounds")
+    frame_rate = RENDER_FPS_CAP
+
+    def __init__(self):
+        self._step = 0
+        self._timer_ms = 0
+
+    def enter(self, ctx):
+        self._step = 0
+        self._timer_ms = 0
+
     def run(self, ctx):
         dt_ms = ctx.clock.get_time()
         for event in safe_event_get():
@@ -17,27 +30,25 @@ class CountdownScreen:
         if not ctx.running:
             return
         # Au premier step, on fixe le fond sur la carte sélectionnée
-        if ctx.countdown_step == 0 and ctx.countdown_timer_ms == 0 and 0 <= ctx.selected_map_index < len(ctx.assets.map_surfaces):
-            ctx.assets.background = ctx.assets.map_surfaces[ctx.selected_map_index].copy()
-        ctx.countdown_timer_ms += dt_ms
-        if ctx.countdown_timer_ms >= COUNTDOWN_DURATION_MS:
-            ctx.countdown_timer_ms = 0
-            ctx.countdown_step += 1
-            if ctx.countdown_step >= 4:
+        if self._step == 0 and self._timer_ms == 0 and 0 <= ctx.selected_map_index < len(ctx.assets.map_surfaces):
+            ctx.assets.background = ctx.assets.map_surfaces[ctx.selected_map_index]
+        self._timer_ms += dt_ms
+        if self._timer_ms >= COUNTDOWN_DURATION_MS:
+            self._timer_ms = 0
+            self._step += 1
+            if self._step >= 4:
                 ctx.game_state = "playing"
                 pygame.display.flip()
-                ctx.clock.tick(60)
                 return
-        ctx.world_surface.blit(ctx.assets.background, (0, 0))
-        ctx.platforms.draw(ctx.world_surface)
-        ctx.players.draw(ctx.world_surface)
-        draw_player_ping(ctx.world_surface, ctx.player1, ctx.assets.ping_p1, ctx.assets.ping_offset_above)
-        draw_player_ping(ctx.world_surface, ctx.player2, ctx.assets.ping_p2, ctx.assets.ping_offset_above)
-        ctx.screen.blit(ctx.world_surface, (0, 0), (int(ctx.camera_x), int(ctx.camera_y), ctx.screen_w, ctx.screen_h))
-        if ctx.countdown_step < 4 and ctx.assets.counter_surfaces and ctx.assets.counter_surfaces[ctx.countdown_step]:
-            surf = ctx.assets.counter_surfaces[ctx.countdown_step]
+        view = WorldView(ctx.screen, ctx.camera_x, ctx.camera_y)
+        view.draw_background(ctx.stage_layer.surface_for(ctx))
+        view.draw_group(ctx.players)
+        for i, pl in enumerate(ctx.simulation.players):
+            ping = player_ping_surface(ctx.assets, i)
+            draw_player_ping(ctx.screen, pl, ping, ctx.assets.ping_offset_above, view.to_screen(pl.rect))
+        if self._step < 4 and ctx.assets.counter_surfaces and ctx.assets.counter_surfaces[self._step]:
+            surf = ctx.assets.counter_surfaces[self._step]
             x = (ctx.screen_w - surf.get_width()) // 2
             y = (ctx.screen_h - surf.get_height()) // 2
             ctx.screen.blit(surf, (x, y))
         pygame.display.flip()
-        ctx.clock.tick(60)
@@ -1,10 +1,17 @@
 """Écran de lecture des vidéos d'intro (1.mp4 Judy P1 / Nick P2, 1_2.mp4 Nick P1 / Judy P2).
 Utilise OpenCV (cv2) pour lire les MP4. Import différé pour éviter conflit SDL2 avec pygame.
+Le décodage (saut de frames, conversion RGB, redimensionnement) tourne dans un thread qui remplit
+une file bornée de surfaces prêtes ; l'écran ne fait que les afficher.
 """
 import os
+import queue
+import threading
 import pygame
 from game.config import JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_START
+from game.gamepads import get_gamepads
 from game.input_handling import get_joystick_poll_events, safe_event_get
+from game.sound_bank import get_sound_bank
+from game.screens.base import Screen
 
 
 def _import_cv2():
@@ -16,6 +23,81 @@ def _import_cv2():
         return None
 
 
+# Frames décodées d'avance au maximum (file producteur -> écran)
+VIDEO_QUEUE_FRAMES = 4
+# Frames sources sautées avant chaque frame affichée (alternance 2 / 3 : vidéo accélérée x2,5 environ)
+SKIP_PATTERN = (2, 3)
+
+
+class _VideoDecoder:
+    """
+    Thread producteur : grab() pour les frames sautées, read() + RGB + resize à la taille écran pour les autres,
+    surfaces prêtes à blitter dans une file bornée ; None en fin de vidéo (ou erreur). stop() est immédiat
+    côté écran : le thread s'arrête au plus tard après la frame en cours et libère la capture.
+    """
+
+    def __init__(self, cv2, cap, size):
+        self._cv2 = cv2
+        self._cap = cap
+        self._size = size
+        self.frames = queue.Queue(maxsize=VIDEO_QUEUE_FRAMES)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="intro-video", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        # Libère un put() en attente ; le thread relâche lui-même la capture
+        try:
+            while True:
+                self.frames.get_nowait()
+        except queue.Empty:
+            pass
+
+    def next_frame(self):
+        """Frame suivante si prête, sinon False (pas bloquant) ; None = fin de vidéo."""
+        try:
+            return self.frames.get_nowait()
+        except queue.Empty:
+            return False
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self.frames.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        cv2 = self._cv2
+        cap = self._cap
+        phase = 0
+        try:
+            while not self._stop.is_set():
+                skip = SKIP_PATTERN[phase]
+                phase = 1 - phase
+                if not all(cap.grab() for _ in range(skip)):
+                    break
+                ret, frame = cap.read()
+                if not ret or frame is None or self._stop.is_set():
+                    break
+                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                frame_rgb = cv2.resize(frame_rgb, self._size, interpolation=cv2.INTER_AREA)
+                surf = pygame.image.frombuffer(frame_rgb.tobytes(), self._size, "RGB")
+                if not self._put(surf):
+                    return
+            self._put(None)
+        except Exception:
+            self._put(None)
+        finally:
+            try:
+                cap.release()
+            except Exception:
+                pass
+
+
 def _video_path_for(ctx, filename):
     """Chemin absolu vers la vidéo dans assets/BG_perso."""
     base = getattr(ctx.assets, "base_dir", None)
@@ -25,132 +107,102 @@ def _video_path_for(ctx, filename):
     return os.path.abspath(path)
 
 
-class JudyNickIntroVideoScreen:
+class JudyNickIntroVideoScreen(Screen):
     """Joue la vidéo d'intro avec OpenCV (1.mp4 si Judy P1, 1_2.mp4 si Nick P1), puis enchaîne sur le jeu."""
     VIDEO_SPEED = 2.5
+    preload_ahead = ("versus_gifs", "combat")
+    frame_rate = 30
 
     def __init__(self):
-        self._cap = None
+        self._decoder = None
+        self._frame = None
         self._video_path = None
         self._cv2 = None
-        self._speed_phase = 0
         self._video_start_ticks = None
         self._sfx_played = False
-        self._sfx_sound = None
 
-    def run(self, ctx):
+    def enter(self, ctx):
+        """Ouvre la vidéo choisie par la sélection de perso et lance son décodage ; sans vidéo, run() passe au versus."""
+        self._sfx_played = False
+        self._video_start_ticks = None
         filename = getattr(ctx, "intro_video_filename", None)
         if not filename:
-            self._go_versus(ctx)
             return
-
         if self._cv2 is None:
             self._cv2 = _import_cv2()
         if self._cv2 is None:
-            self._go_versus(ctx)
             return
-
-        if self._cap is None:
-            self._video_path = _video_path_for(ctx, filename)
-            if not os.path.isfile(self._video_path):
-                self._go_versus(ctx)
-                return
-            try:
-                cap_ffmpeg = getattr(self._cv2, "CAP_FFMPEG", 1900)
-                self._cap = self._cv2.VideoCapture(self._video_path, cap_ffmpeg)
-                if not self._cap.isOpened():
-                    try:
-                        self._cap.release()
-                    except Exception:
-                        pass
-                    self._cap = self._cv2.VideoCapture(self._video_path)
-                if not self._cap.isOpened():
-                    try:
-                        self._cap.release()
-                    except Exception:
-                        pass
-                    self._cap = None
-                    self._go_versus(ctx)
-                    return
-            except Exception:
-                self._cap = None
-                self._go_versus(ctx)
+        self._video_path = _video_path_for(ctx, filename)
+        if not os.path.isfile(self._video_path):
+            return
+        try:
+            cap_ffmpeg = getattr(self._cv2, "CAP_FFMPEG", 1900)
+            cap = self._cv2.VideoCapture(self._video_path, cap_ffmpeg)
+            if not cap.isOpened():
+                try:
+                    cap.release()
+                except Exception:
+                    pass
+                cap = self._cv2.VideoCapture(self._video_path)
+            if not cap.isOpened():
+                try:
+                    cap.release()
+                except Exception:
+                    pass
                 return
-            self._video_start_ticks = pygame.time.get_ticks()
+        except Exception:
+            return
+        self._decoder = _VideoDecoder(self._cv2, cap, (ctx.screen_w, ctx.screen_h))
+        self._frame = None
+        self._video_start_ticks = pygame.time.get_ticks()
+
+    def exit(self, ctx):
+        """Capture et frames décodées libérées ; la musique du menu s'arrête avec la vidéo."""
+        self._release()
+        ctx.music.stop()
+
+    def run(self, ctx):
+        if self._decoder is None:
+            self._go_versus(ctx)
+            return
 
         if not self._sfx_played and self._video_start_ticks is not None:
             elapsed_ms = pygame.time.get_ticks() - self._video_start_ticks
             if elapsed_ms >= 1500:
                 self._sfx_played = True
-                base = getattr(ctx.assets, "base_dir", None) or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                sfx_path = os.path.join(base, "assets", "song", "menu", "sfx versus", "special-attack_1.wav")
-                if os.path.isfile(sfx_path):
-                    try:
-                        self._sfx_sound = pygame.mixer.Sound(sfx_path)
-                        self._sfx_sound.set_volume(0.4)
-                        self._sfx_sound.play()
-                    except Exception:
-                        pass
+                get_sound_bank().play("versus_sfx")
 
         events = safe_event_get()
-        n_joy = pygame.joystick.get_count()
+        n_joy = get_gamepads().count
         if n_joy > 0:
             events.extend(get_joystick_poll_events(JOY_DEADZONE, (JOY_BTN_JUMP, JOY_BTN_START)))
         for event in events:
             if event.type == pygame.QUIT:
                 ctx.running = False
-                self._release()
                 return
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_ESCAPE):
-                self._release()
                 self._go_versus(ctx)
                 return
             if event.type == pygame.JOYBUTTONDOWN and event.joy in (0, 1) and event.button in (JOY_BTN_JUMP, JOY_BTN_START):
-                self._release()
                 self._go_versus(ctx)
                 return
 
-        skip = 2 if self._speed_phase == 0 else 3
-        self._speed_phase = 1 - self._speed_phase
-        for _ in range(skip):
-            ret, _ = self._cap.read()
-            if not ret:
-                self._release()
-                self._go_versus(ctx)
-                return
-        ret, frame = self._cap.read()
-        if not ret or frame is None:
-            self._release()
+        # Une frame par affichage ; si le décodeur a pris du retard, la précédente reste à l'écran
+        frame = self._decoder.next_frame()
+        if frame is None:
             self._go_versus(ctx)
             return
-
-        cv2 = self._cv2
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w = frame_rgb.shape[:2]
-        surf = pygame.image.frombuffer(frame_rgb.tobytes(), (w, h), "RGB")
-        surf = surf.copy()
-        surf = pygame.transform.smoothscale(surf, (ctx.screen_w, ctx.screen_h))
-        ctx.screen.blit(surf, (0, 0))
+        if frame is not False:
+            self._frame = frame
+        if self._frame is not None:
+            ctx.screen.blit(self._frame, (0, 0))
         pygame.display.flip()
-        ctx.clock.tick(30)
 
     def _release(self):
-        if self._cap is not None:
-            try:
-                self._cap.release()
-            except Exception:
-                pass
-            self._cap = None
+        if self._decoder is not None:
+            self._decoder.stop()
+            self._decoder = None
+        self._frame = None
 
     def _go_versus(self, ctx):
-        if getattr(ctx, "menu_music_playing", False):
-            try:
-                pygame.mixer.music.stop()
-                ctx.menu_music_playing = False
-            except Exception:
-                pass
         ctx.game_state = "versus_gif_p1_confirm"
-        ctx.p1_confirm_frame_index = 0
-        ctx.p1_confirm_timer_ms = 0
-        ctx.p1_confirm_phase = "playing"
-        ctx.wait_after_p1_confirm_timer_ms = 0
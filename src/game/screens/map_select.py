@@ -5,26 +5,39 @@ Si même carte → elle est prise ; sinon tirage aléatoire entre les deux.
 import random
 import pygame
 from game.config import JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_START
+from game.gamepads import get_gamepads
 from game.input_handling import get_joystick_poll_events, safe_event_get
+from game.screens.base import Screen
 
 
-class MapSelectScreen:
+class MapSelectScreen(Screen):
+    asset_groups = ("maps",)
+    preload_ahead = ("select_screens", "characters")
+
     def __init__(self):
         self._prev_axis0 = {}
+        self._cursor_p1 = 0
+        self._cursor_p2 = 0
+        self._p1_confirmed = False
+        self._p2_confirmed = False
+        self._ignore_confirm_frame = False
+
+    def enter(self, ctx):
+        self._cursor_p1 = 0
+        self._cursor_p2 = 0
+        self._p1_confirmed = False
+        self._p2_confirmed = False
+        # La validation du menu (Entrée / A) ne doit pas valider aussi la carte
+        self._ignore_confirm_frame = True
 
     def run(self, ctx):
         events = safe_event_get()
-        n_joy = pygame.joystick.get_count()
-        for jid in range(min(2, n_joy)):
-            try:
-                pygame.joystick.Joystick(jid).init()
-            except Exception:
-                pass
+        n_joy = get_gamepads().count
         if n_joy > 0:
             events.extend(get_joystick_poll_events(JOY_DEADZONE, (JOY_BTN_JUMP, JOY_BTN_START)))
         n_maps = max(1, len(getattr(ctx.assets, "map_surfaces", [])))
-        ctx.map_select_cursor_p1 = min(max(0, getattr(ctx, "map_select_cursor_p1", 0)), n_maps - 1)
-        ctx.map_select_cursor_p2 = min(max(0, getattr(ctx, "map_select_cursor_p2", 0)), n_maps - 1)
+        self._cursor_p1 = min(max(0, self._cursor_p1), n_maps - 1)
+        self._cursor_p2 = min(max(0, self._cursor_p2), n_maps - 1)
         # P1 : clavier (Q/D + Entrée/Espace) ou joy 0 ; P2 : clavier (flèches + Haut) ou joy 1.
         p1_left = ctx.player1.controls.get("left", pygame.K_LEFT)
         p1_right = ctx.player1.controls.get("right", pygame.K_d)
@@ -37,25 +50,25 @@ class MapSelectScreen:
                 return
             if event.type == pygame.KEYDOWN:
                 if event.key == p1_left:
-                    ctx.map_select_cursor_p1 = (ctx.map_select_cursor_p1 - 1) % n_maps
+                    self._cursor_p1 = (self._cursor_p1 - 1) % n_maps
                 elif event.key == p1_right:
-                    ctx.map_select_cursor_p1 = (ctx.map_select_cursor_p1 + 1) % n_maps
+                    self._cursor_p1 = (self._cursor_p1 + 1) % n_maps
                 elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    if getattr(ctx, "map_select_ignore_confirm_frame", False):
+                    if self._ignore_confirm_frame:
                         continue
-                    ctx.map_select_p1_confirmed = True
-                    if n_joy < 2 or ctx.map_select_p2_confirmed:
+                    self._p1_confirmed = True
+                    if n_joy < 2 or self._p2_confirmed:
                         self._apply_choice(ctx)
                         return
                 elif event.key == p2_left:
-                    ctx.map_select_cursor_p2 = (ctx.map_select_cursor_p2 - 1) % n_maps
+                    self._cursor_p2 = (self._cursor_p2 - 1) % n_maps
                 elif event.key == p2_right:
-                    ctx.map_select_cursor_p2 = (ctx.map_select_cursor_p2 + 1) % n_maps
+                    self._cursor_p2 = (self._cursor_p2 + 1) % n_maps
                 elif event.key == p2_confirm:
-                    if getattr(ctx, "map_select_ignore_confirm_frame", False):
+                    if self._ignore_confirm_frame:
                         continue
-                    ctx.map_select_p2_confirmed = True
-                    if ctx.map_select_p1_confirmed:
+                    self._p2_confirmed = True
+                    if self._p1_confirmed:
                         self._apply_choice(ctx)
                         return
             if event.type == pygame.JOYAXISMOTION and n_joy > 0 and event.axis == 0:
@@ -63,46 +76,46 @@ class MapSelectScreen:
                 prev = self._prev_axis0.get(event.joy, 0.0)
                 if event.joy == 0:
                     if prev >= -JOY_DEADZONE and ax < -JOY_DEADZONE:
-                        ctx.map_select_cursor_p1 = (ctx.map_select_cursor_p1 - 1) % n_maps
+                        self._cursor_p1 = (self._cursor_p1 - 1) % n_maps
                     elif prev <= JOY_DEADZONE and ax > JOY_DEADZONE:
-                        ctx.map_select_cursor_p1 = (ctx.map_select_cursor_p1 + 1) % n_maps
+                        self._cursor_p1 = (self._cursor_p1 + 1) % n_maps
                 elif event.joy == 1:
                     if prev >= -JOY_DEADZONE and ax < -JOY_DEADZONE:
-                        ctx.map_select_cursor_p2 = (ctx.map_select_cursor_p2 - 1) % n_maps
+                        self._cursor_p2 = (self._cursor_p2 - 1) % n_maps
                     elif prev <= JOY_DEADZONE and ax > JOY_DEADZONE:
-                        ctx.map_select_cursor_p2 = (ctx.map_select_cursor_p2 + 1) % n_maps
+                        self._cursor_p2 = (self._cursor_p2 + 1) % n_maps
                 self._prev_axis0[event.joy] = ax
             if event.type == pygame.JOYBUTTONDOWN and n_joy > 0 and event.button in (JOY_BTN_JUMP, JOY_BTN_START):
-                if getattr(ctx, "map_select_ignore_confirm_frame", False):
+                if self._ignore_confirm_frame:
                     continue
                 if event.joy == 0:
-                    ctx.map_select_p1_confirmed = True
-                    if n_joy < 2 or ctx.map_select_p2_confirmed:
+                    self._p1_confirmed = True
+                    if n_joy < 2 or self._p2_confirmed:
                         self._apply_choice(ctx)
                         return
                 elif event.joy == 1:
-                    ctx.map_select_p2_confirmed = True
-                    if ctx.map_select_p1_confirmed:
+                    self._p2_confirmed = True
+                    if self._p1_confirmed:
                         self._apply_choice(ctx)
                         return
         if not ctx.running:
             return
-        ctx.map_select_ignore_confirm_frame = False
+        self._ignore_confirm_frame = False
         self._draw(ctx)
         pygame.display.flip()
-        ctx.clock.tick(60)
 
     def _apply_choice(self, ctx):
         """Détermine la carte finale : même choix → celle-là ; sinon random entre les deux."""
         n_maps = max(1, len(getattr(ctx.assets, "map_surfaces", [])))
-        c1 = min(ctx.map_select_cursor_p1, n_maps - 1)
-        c2 = min(ctx.map_select_cursor_p2, n_maps - 1)
-        if not ctx.map_select_p2_confirmed:
+        c1 = min(self._cursor_p1, n_maps - 1)
+        c2 = min(self._cursor_p2, n_maps - 1)
+        if not self._p2_confirmed:
             ctx.selected_map_index = c1
         elif c1 == c2:
             ctx.selected_map_index = c1
         else:
             ctx.selected_map_index = random.choice([c1, c2])
+        ctx.stage_layer.surface_for(ctx)
         ctx.game_state = "character_select"
 
     def _draw(self, ctx):
@@ -137,13 +150,13 @@ class MapSelectScreen:
             y = ctx.screen_h // 2 - thumb_h // 2
             ctx.screen.blit(thumb, (x, y))
             rect = (x - contour_offset, y - contour_offset, thumb_w + 2 * contour_offset, thumb_h + 2 * contour_offset)
-            if i == ctx.map_select_cursor_p1:
+            if i == self._cursor_p1:
                 pygame.draw.rect(ctx.screen, (255, 60, 60), rect, 4)
-            if i == ctx.map_select_cursor_p2:
+            if i == self._cursor_p2:
                 pygame.draw.rect(ctx.screen, (60, 100, 255), rect, 4)
             label = map_labels[i] if i < len(map_labels) else f"Carte {i + 1}"
-            is_p1 = i == ctx.map_select_cursor_p1
-            is_p2 = i == ctx.map_select_cursor_p2
+            is_p1 = i == self._cursor_p1
+            is_p2 = i == self._cursor_p2
             if is_p1 and is_p2:
                 color = (255, 180, 200)
             elif is_p1:
@@ -0,0 +1,114 @@
+"""
+Écrans des menus (principal, paramètres, contrôles) autour des widgets de menu/, et écran titre.
+Seule la manette P1 pilote les menus.
+"""
+import pygame
+from game.config import WIDTH, HEIGHT, JOY_BTN_JUMP, JOY_BTN_START
+from game.gamepads import get_gamepads
+from game.input_handling import safe_event_get
+from game.screens.base import Screen
+
+
+class MainMenuScreen(Screen):
+    """VERSUS → sélection de carte (on_versus(ctx) prépare le match), PARAMETRES, QUITTER."""
+    preload_ahead = ("maps", "sounds")
+    music = "menu"
+
+    def __init__(self, menu, on_versus=None):
+        self.menu = menu
+        self.on_versus = on_versus
+
+    def run(self, ctx):
+        n_joy = get_gamepads().count
+        for event in safe_event_get():
+            if event.type == pygame.QUIT:
+                ctx.running = False
+                return
+            selected = self.menu.handle_event(event, n_joy)
+            if selected == "QUITTER":
+                ctx.running = False
+                return
+            if selected == "VERSUS":
+                ctx.game_state = "map_select"
+                if self.on_versus is not None:
+                    self.on_versus(ctx)
+                return
+            if selected == "PARAMETRES":
+                ctx.game_state = "settings"
+                return
+        self.menu.update(n_joy)
+        self.menu.draw(ctx.screen)
+        pygame.display.flip()
+
+
+class SettingsScreen(Screen):
+    def __init__(self, menu):
+        self.menu = menu
+
+    def run(self, ctx):
+        n_joy = get_gamepads().count
+        for event in safe_event_get():
+            if event.type == pygame.QUIT:
+                ctx.running = False
+                return
+            action = self.menu.handle_event(event, n_joy)
+            if action == "back":
+                ctx.game_state = "main_menu"
+                return
+            if action == "controls":
+                ctx.game_state = "controls"
+                return
+            if action == "toggle_fullscreen":
+                ctx.fullscreen_mode = not ctx.fullscreen_mode
+                ctx.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN if ctx.fullscreen_mode else 0)
+                ctx.stage_layer.invalidate()
+                break
+        self.menu.update(n_joy)
+        self.menu.draw(ctx.screen)
+        pygame.display.flip()
+
+
+class ControlsScreen(Screen):
+    def __init__(self, menu):
+        self.menu = menu
+
+    def run(self, ctx):
+        n_joy = get_gamepads().count
+        for event in safe_event_get():
+            if event.type == pygame.QUIT:
+                ctx.running = False
+                return
+            if self.menu.handle_event(event, n_joy) == "back":
+                ctx.game_state = "settings"
+                return
+        self.menu.update(n_joy)
+        self.menu.draw(ctx.screen)
+        pygame.display.flip()
+
+
+class TitleScreen(Screen):
+    """Écran titre : A → GIF versus, Entrée → GIF enter."""
+    asset_groups = ("select_screens",)
+    preload_ahead = ("versus_gifs",)
+
+    def run(self, ctx):
+        for event in safe_event_get():
+            if event.type == pygame.QUIT:
+                ctx.running = False
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+                ctx.game_state = "versus_gif"
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                ctx.game_state = "versus_gif_enter"
+                return
+            if event.type == pygame.JOYBUTTONDOWN:
+                if event.button == JOY_BTN_JUMP:
+                    ctx.game_state = "versus_gif"
+                    return
+                if event.button == JOY_BTN_START:
+                    ctx.game_state = "versus_gif_enter"
+                    return
+        if ctx.assets.title_screen:
+            ctx.screen.blit(ctx.assets.title_screen, (0, 0))
+        pygame.display.flip()
@@ -1,142 +1,107 @@
 """
-Écran de combat : musique, conditions de victoire (Nick/Judy), événements clavier/manette,
+Écran de combat (2 à MAX_PLAYERS joueurs) : conditions de victoire (Nick/Judy), événements clavier/manette,
 rafale distance, pause, mise à jour joueurs / caméra, dessin monde + HUD.
+Découpé en handle_events / step (tick fixe de simulation) / draw (interpolé) pour la boucle à pas fixe de main.py.
 """
 import random
 import pygame
 from game.config import (
-    CAMERA_LERP, JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_ATTACK, JOY_BTN_GRAB, JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT, JOY_BTN_SPECIAL, JOY_BTN_START,
-    DEBUG_JOYSTICK, DEBUG_JOYSTICK_VERBOSE, DEBUG_JOYSTICK_VERBOSE_INTERVAL,
-)
-from game.hud import draw_player_ping, draw_portraits, draw_percent_hud
-from game.input_handling import get_player_input_state, start_attack_from_input, get_joystick_poll_events, get_effective_joy_count, _debug_joy_global_frame, safe_event_get
-from combat.projectile_sprite import ProjectileSprite
-from player.player import (
-    DISTANCE_ATTACK_COOLDOWN_FRAMES,
-    DISTANCE_ATTACK_BURST_DELAY,
-    DISTANCE_ATTACK_BURST_SIZE,
-    DISTANCE_ATTACK_NUM_BURSTS,
+    CAMERA_LERP, SIM_STEP_MS, MAX_FRAME_MS, RENDER_FPS_CAP, JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_ATTACK, JOY_BTN_GRAB, JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT, JOY_BTN_SPECIAL, JOY_BTN_START,
+    DEBUG_JOYSTICK_VERBOSE_INTERVAL, REPLAY_KEEP,
 )
+from game.replay import save_replay
+from game.hud import draw_player_ping, player_ping_surface, HudCompositor
+from game.sound_bank import JUDY_WIN_SOUNDS
+from game.world_view import WorldView
+from game.gamepads import get_gamepads
+from game.input_handling import sample_player_input, sample_inputs, get_joystick_poll_events, get_effective_joy_count, safe_event_get
+from game.trace import get_trace, define, JOY, INFO, DEBUG
+from game.screens.base import Screen
 
+_TR_STATE = define(JOY, DEBUG, "combat : effective={a:.0f} joueurs à la manette={b:.0f} events manette={c:.0f}")
+_TR_AXIS = define(JOY, DEBUG, "axe joy={a:.0f} axis={b:.0f} value={c:+.2f}")
+_TR_BUTTON = define(JOY, INFO, "bouton joy={a:.0f} button={b:.0f}")
 
-class PlayingScreen:
-    def run(self, ctx):
-        # Démarrage musique de combat au premier frame
-        if getattr(ctx.assets, "combat_music_loaded", False) and not getattr(ctx, "combat_music_playing", False):
-            try:
-                if getattr(ctx, "menu_music_playing", False):
-                    pygame.mixer.music.stop()
-                    ctx.menu_music_playing = False
-                pygame.mixer.music.load(ctx.assets.combat_music_path)
-                pygame.mixer.music.set_volume(0.10)
-                pygame.mixer.music.play(-1)
-                ctx.combat_music_playing = True
-            except Exception:
-                pass
-        def _start_win_music():
-            try:
-                pygame.mixer.music.stop()
-                if getattr(ctx.assets, "win_music_loaded", False):
-                    pygame.mixer.music.load(ctx.assets.win_music_path)
-                    pygame.mixer.music.set_volume(0.15)
-                    pygame.mixer.music.play(0)
-            except Exception:
-                pass
 
-        # Victoire P2 : on regarde son perso pour choisir l’écran Nick ou Judy + sons
-        if ctx.player1.lives <= 0 and ctx.player2.lives > 0:
-            winner_nick = getattr(ctx.player2, "character", None) == "nick"
-            ctx.game_state = "nick_wins" if winner_nick else "judy_wins"
-            ctx.nick_win_frame_index = 0
-            ctx.nick_win_frame_timer_ms = 0
-            ctx.judy_win_frame_index = 0
-            ctx.judy_win_frame_timer_ms = 0
-            _start_win_music()
-            if winner_nick:
-                if getattr(ctx.assets, "nick_win_sound_loaded", False):
-                    try:
-                        snd = pygame.mixer.Sound(ctx.assets.nick_win_sound_path)
-                        snd.set_volume(1.0)
-                        snd.play()
-                    except Exception:
-                        pass
-            else:
-                paths = getattr(ctx.assets, "judy_win_sound_paths", [])
-                loaded = getattr(ctx.assets, "judy_win_sounds_loaded", [])
-                if paths and loaded:
-                    idx = random.randrange(len(paths))
-                    if loaded[idx]:
-                        try:
-                            snd = pygame.mixer.Sound(paths[idx])
-                            snd.set_volume(1.0)
-                            snd.play()
-                        except Exception:
-                            pass
-            ctx.combat_music_playing = False
+class PlayingScreen(Screen):
+    asset_groups = ("maps", "combat", "characters", "sounds")
+    music = "combat"
+    frame_rate = RENDER_FPS_CAP
+
+    def __init__(self):
+        # Appuis reçus depuis le dernier tick (un frame rendu peut ne contenir aucun tick de simulation)
+        self._pending_presses = {}
+        # Blocs HUD (stocks, pourcentage, portrait) en cache, refaits seulement quand ils changent
+        self.hud = HudCompositor()
+
+    def enter(self, ctx):
+        # Pas de rattrapage du temps passé sur les autres écrans, pas d'interpolation depuis leur caméra
+        ctx.sim_accumulator_ms = 0.0
+        ctx.camera_prev_x, ctx.camera_prev_y = ctx.camera_x, ctx.camera_y
+
+    def run(self, ctx):
+        """Un frame complet : events, ticks dus d'après le temps écoulé (ctx.frame_dt_ms), puis dessin interpolé."""
+        if ctx.simulation.match_point():
+            # Dernier stock : l'écran de victoire peut arriver à tout moment
+            ctx.assets.preload("win_gifs")
+        ctx.sim_accumulator_ms += min(ctx.frame_dt_ms, MAX_FRAME_MS)
+        if not self.handle_events(ctx):
             return
-        # Victoire P1 : idem selon le perso du gagnant
-        if ctx.player2.lives <= 0 and ctx.player1.lives > 0:
-            winner_nick = getattr(ctx.player1, "character", None) == "nick"
+        while ctx.sim_accumulator_ms >= SIM_STEP_MS:
+            self.step(ctx)
+            ctx.sim_accumulator_ms -= SIM_STEP_MS
+        self.draw(ctx, ctx.sim_accumulator_ms / SIM_STEP_MS)
+
+    def handle_events(self, ctx):
+        """Victoire, events clavier/manette (pause, triches, appuis). False si on quitte l'écran."""
+        ctx.profiler.begin_frame()
+        # Victoire : dernier joueur en vie, on regarde son perso pour choisir l’écran Nick ou Judy + sons
+        winner = ctx.simulation.winner
+        if winner is not None:
+            self._finish_recording(ctx)
+            ctx.replay = None
+            winner_nick = getattr(winner, "character", None) == "nick"
             ctx.game_state = "nick_wins" if winner_nick else "judy_wins"
-            ctx.nick_win_frame_index = 0
-            ctx.nick_win_frame_timer_ms = 0
-            ctx.judy_win_frame_index = 0
-            ctx.judy_win_frame_timer_ms = 0
-            _start_win_music()
+            # Voix préchargées (groupe "sounds") : pas de lecture disque au moment de la victoire
             if winner_nick:
-                if getattr(ctx.assets, "nick_win_sound_loaded", False):
-                    try:
-                        snd = pygame.mixer.Sound(ctx.assets.nick_win_sound_path)
-                        snd.set_volume(1.0)
-                        snd.play()
-                    except Exception:
-                        pass
+                ctx.assets.sound_bank.play("nick_win")
             else:
-                paths = getattr(ctx.assets, "judy_win_sound_paths", [])
-                loaded = getattr(ctx.assets, "judy_win_sounds_loaded", [])
-                if paths and loaded:
-                    idx = random.randrange(len(paths))
-                    if loaded[idx]:
-                        try:
-                            snd = pygame.mixer.Sound(paths[idx])
-                            snd.set_volume(1.0)
-                            snd.play()
-                        except Exception:
-                            pass
-            ctx.combat_music_playing = False
-            return
+                ctx.assets.sound_bank.play_random(JUDY_WIN_SOUNDS)
+            return False
+        if ctx.replay is not None and ctx.simulation.frame >= ctx.replay.frames:
+            # Replay sans vainqueur (partie quittée) : fin de la lecture
+            ctx.replay = None
+            ctx.game_state = "main_menu"
+            return False
 
         events = safe_event_get()
-        n_joy_raw = pygame.joystick.get_count()
         n_joy = get_effective_joy_count()
-        # Réattache manettes P1/P2 si besoin
-        ctx.player1.joy_id = 0 if n_joy >= 1 else None
-        ctx.player2.joy_id = 1 if n_joy >= 2 else None
-        for pl in (ctx.player1, ctx.player2):
-            if getattr(pl, "joy_id", None) is None or pl.joy_id >= n_joy_raw:
-                pl.joystick = None
-            elif getattr(pl, "joystick", None) is None:
-                try:
-                    pl.joystick = pygame.joystick.Joystick(pl.joy_id)
-                    pl.joystick.init()
-                except Exception:
-                    pl.joystick = None
-        for jid in range(min(2, n_joy_raw)):
-            try:
-                pygame.joystick.Joystick(jid).init()
-            except Exception:
-                pass
-        if n_joy_raw > 0:
+        players = ctx.simulation.players
+        if get_gamepads().count > 0:
             events.extend(get_joystick_poll_events(
                 JOY_DEADZONE,
                 (JOY_BTN_JUMP, JOY_BTN_ATTACK, JOY_BTN_SPECIAL, JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT, JOY_BTN_GRAB),
             ))
-        if DEBUG_JOYSTICK_VERBOSE and _debug_joy_global_frame > 0 and _debug_joy_global_frame % DEBUG_JOYSTICK_VERBOSE_INTERVAL == 0:
-            print(f"[Manette VERBOSE] frame={_debug_joy_global_frame} Playing: get_count()={n_joy} P1.joy_id={ctx.player1.joy_id} P2.joy_id={ctx.player2.joy_id} nb_events_manette={sum(1 for e in events if e.type in (pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN))}")
+        tr = get_trace()
+        if tr.on[_TR_STATE] and tr.frame % DEBUG_JOYSTICK_VERBOSE_INTERVAL == 0:
+            tr.emit(
+                _TR_STATE, n_joy, sum(1 for pl in players if pl.joy_id is not None),
+                sum(1 for e in events if e.type in (pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN)),
+            )
+        # Appuis par joueur ("jump", "attack", "special", "counter"), consommés au prochain tick
+        presses = self._pending_presses
+        for pl in players:
+            presses.setdefault(pl, set())
+        joy_players = {pl.joy_id: pl for pl in players if pl.joy_id is not None}
         for event in events:
             if event.type == pygame.QUIT:
+                self._finish_recording(ctx)
                 ctx.running = False
-                return
+                return False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                ctx.profiler.toggle()
+                ctx.profiler.begin_frame()
+                continue
             # Menu pause : Échap/Start pour ouvrir ; Reprendre ou Quitter la partie
             if ctx.paused:
                 if event.type == pygame.KEYDOWN:
@@ -151,9 +116,11 @@ class PlayingScreen:
                             ctx.paused = False
                         else:
                             ctx.paused = False
+                            self._finish_recording(ctx)
+                            ctx.replay = None
                             ctx.game_state = "main_menu"
-                            return
-                if event.type == pygame.JOYAXISMOTION and event.joy in (0, 1) and event.axis == 1:
+                            return False
+                if event.type == pygame.JOYAXISMOTION and event.joy in joy_players and event.axis == 1:
                     ax = event.value
                     prev = getattr(ctx, "_pause_axis1_prev", {}).get(event.joy, 0.0)
                     if prev >= -JOY_DEADZONE and ax < -JOY_DEADZONE:
@@ -163,7 +130,7 @@ class PlayingScreen:
                     if not hasattr(ctx, "_pause_axis1_prev"):
                         ctx._pause_axis1_prev = {}
                     ctx._pause_axis1_prev[event.joy] = ax
-                if event.type == pygame.JOYBUTTONDOWN and event.joy in (0, 1):
+                if event.type == pygame.JOYBUTTONDOWN and event.joy in joy_players:
                     if event.button == JOY_BTN_START:
                         ctx.paused = False
                     elif event.button == JOY_BTN_JUMP:
@@ -171,23 +138,26 @@ class PlayingScreen:
                             ctx.paused = False
                         else:
                             ctx.paused = False
+                            self._finish_recording(ctx)
+                            ctx.replay = None
                             ctx.game_state = "main_menu"
-                            return
+                            return False
                 continue
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 ctx.paused = True
                 ctx.pause_menu_cursor = 0
                 continue
-            if event.type == pygame.JOYBUTTONDOWN and event.joy in (0, 1) and event.button == JOY_BTN_START:
+            if event.type == pygame.JOYBUTTONDOWN and event.joy in joy_players and event.button == JOY_BTN_START:
                 ctx.paused = True
                 ctx.pause_menu_cursor = 0
                 continue
             if event.type == pygame.KEYDOWN:
                 # Codes triche clavier : I-N-V = invincibilité 10 s, D-M-G = dégâts x5 10 s
                 cheat_keys = (pygame.K_i, pygame.K_n, pygame.K_v, pygame.K_d, pygame.K_m, pygame.K_g)
-                if event.key in cheat_keys:
+                # (pas en ligne : l'autre machine ne verrait pas la triche, les états divergeraient ; pas en replay)
+                if event.key in cheat_keys and ctx.netplay is None and ctx.replay is None:
                     buf = getattr(ctx, "_cheat_keys", [])
-                    t = pygame.time.get_ticks()
+                    t = ctx.simulation.time_ms
                     if t - getattr(ctx, "_cheat_last_time", 0) > 2000:
                         buf = []
                     ctx._cheat_last_time = t
@@ -196,56 +166,29 @@ class PlayingScreen:
                         buf.pop(0)
                     ctx._cheat_keys = buf
                     if tuple(buf) == (pygame.K_i, pygame.K_n, pygame.K_v):
-                        ctx.player1.cheat_invincible_until = t + 10000
+                        self._activate_cheat(ctx, "cheat_invincible_until", t + 10000)
                         ctx._cheat_keys = []
                     elif tuple(buf) == (pygame.K_d, pygame.K_m, pygame.K_g):
-                        ctx.player1.cheat_super_damage_until = t + 10000
+                        self._activate_cheat(ctx, "cheat_super_damage_until", t + 10000)
                         ctx._cheat_keys = []
                     continue
-                if event.key == ctx.player1.controls["jump"]:
-                    ctx.player1.jump()
-                if event.key == ctx.player2.controls["jump"]:
-                    ctx.player2.jump()
-                if event.key == ctx.player1.controls["attacking"] and ctx.player1.lives > 0:
-                    start_attack_from_input(ctx.player1, ctx.hitboxes, "jab", "ftilt", "utilt", "dtilt", "nair", "fair", "bair", "uair", "dair")
-                if event.key == ctx.player2.controls["attacking"] and ctx.player2.lives > 0:
-                    start_attack_from_input(ctx.player2, ctx.hitboxes, "jab", "ftilt", "utilt", "dtilt", "nair", "fair", "bair", "uair", "dair")
-                if event.key == ctx.player1.controls.get("counter") and ctx.player1.lives > 0:
-                    ctx.player1.start_counter()
-                if event.key == ctx.player2.controls.get("counter") and ctx.player2.lives > 0:
-                    ctx.player2.start_counter()
-                if event.key == ctx.player1.controls.get("special") and ctx.player1.lives > 0:
-                    pl, pr, pu, pd = get_player_input_state(ctx.player1)
-                    if pl or pr: ctx.player1.start_attack("side_special", ctx.hitboxes)
-                    elif pu: ctx.player1.start_attack("up_special", ctx.hitboxes)
-                    elif pd: ctx.player1.start_attack("down_special", ctx.hitboxes)
-                    else:
-                        if getattr(ctx.player1, "_distance_attack_cooldown_remaining", 0) <= 0:
-                            ProjectileSprite(ctx.player1, ctx.hitboxes)
-                            ctx.player1.start_distance_attack_animation()
-                            ctx.player1._distance_attack_cooldown_remaining = DISTANCE_ATTACK_COOLDOWN_FRAMES
-                            ctx.player1._distance_burst_remaining = DISTANCE_ATTACK_BURST_SIZE * DISTANCE_ATTACK_NUM_BURSTS - 1
-                            ctx.player1._distance_burst_timer = DISTANCE_ATTACK_BURST_DELAY
-                if event.key == ctx.player2.controls.get("special") and ctx.player2.lives > 0:
-                    pl, pr, pu, pd = get_player_input_state(ctx.player2)
-                    if pl or pr: ctx.player2.start_attack("side_special", ctx.hitboxes)
-                    elif pu: ctx.player2.start_attack("up_special", ctx.hitboxes)
-                    elif pd: ctx.player2.start_attack("down_special", ctx.hitboxes)
-                    else:
-                        if getattr(ctx.player2, "_distance_attack_cooldown_remaining", 0) <= 0:
-                            ProjectileSprite(ctx.player2, ctx.hitboxes)
-                            ctx.player2.start_distance_attack_animation()
-                            ctx.player2._distance_attack_cooldown_remaining = DISTANCE_ATTACK_COOLDOWN_FRAMES
-                            ctx.player2._distance_burst_remaining = DISTANCE_ATTACK_BURST_SIZE * DISTANCE_ATTACK_NUM_BURSTS - 1
-                            ctx.player2._distance_burst_timer = DISTANCE_ATTACK_BURST_DELAY
-            if event.type == pygame.JOYAXISMOTION and DEBUG_JOYSTICK_VERBOSE and abs(event.value) > JOY_DEADZONE:
-                print(f"[Manette EVENT] JOYAXISMOTION joy={event.joy} axis={event.axis} value={event.value:.2f}")
+                for pl in players:
+                    if event.key == pl.controls.get("jump"):
+                        presses[pl].add("jump")
+                    if event.key == pl.controls.get("attacking"):
+                        presses[pl].add("attack")
+                    if event.key == pl.controls.get("counter"):
+                        presses[pl].add("counter")
+                    if event.key == pl.controls.get("special"):
+                        presses[pl].add("special")
+            if event.type == pygame.JOYAXISMOTION and tr.on[_TR_AXIS] and abs(event.value) > JOY_DEADZONE:
+                tr.emit(_TR_AXIS, event.joy, event.axis, event.value)
             if event.type == pygame.JOYBUTTONDOWN:
                 joy_id, btn = event.joy, event.button
                 # Triche manette P1 : L1-L2-L1 = invincibilité, L2-L1-L2 = super dégâts (< 2 s)
-                if joy_id == 0 and btn in (JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT):
+                if joy_id == 0 and btn in (JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT) and ctx.netplay is None and ctx.replay is None:
                     seq = getattr(ctx, "_cheat_joy_seq", [])
-                    t = pygame.time.get_ticks()
+                    t = ctx.simulation.time_ms
                     if t - getattr(ctx, "_cheat_joy_last_time", 0) > 2000:
                         seq = []
                     ctx._cheat_joy_last_time = t
@@ -256,126 +199,75 @@ class PlayingScreen:
                     code_inv = (JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT, JOY_BTN_COUNTER)
                     code_dmg = (JOY_BTN_COUNTER_ALT, JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT)
                     if tuple(seq) == code_inv:
-                        ctx.player1.cheat_invincible_until = t + 10000
+                        self._activate_cheat(ctx, "cheat_invincible_until", t + 10000)
                         ctx._cheat_joy_seq = []
                         continue
                     if tuple(seq) == code_dmg:
-                        ctx.player1.cheat_super_damage_until = t + 10000
+                        self._activate_cheat(ctx, "cheat_super_damage_until", t + 10000)
                         ctx._cheat_joy_seq = []
                         continue
                     if len(seq) >= 2:
                         continue
-                if DEBUG_JOYSTICK or DEBUG_JOYSTICK_VERBOSE:
-                    print(f"[Manette EVENT] JOYBUTTONDOWN joy_id={event.joy} button={event.button}")
-                if joy_id == 0:
-                    if btn == JOY_BTN_JUMP: ctx.player1.jump()
-                    elif btn == JOY_BTN_ATTACK and ctx.player1.lives > 0:
-                        start_attack_from_input(ctx.player1, ctx.hitboxes, "jab", "ftilt", "utilt", "dtilt", "nair", "fair", "bair", "uair", "dair")
-                    elif btn in (JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT) and ctx.player1.lives > 0: ctx.player1.start_counter()
-                    elif btn == JOY_BTN_SPECIAL and ctx.player1.lives > 0:
-                        pl, pr, pu, pd = get_player_input_state(ctx.player1)
-                        if pl or pr: ctx.player1.start_attack("side_special", ctx.hitboxes)
-                        elif pu: ctx.player1.start_attack("up_special", ctx.hitboxes)
-                        elif pd: ctx.player1.start_attack("down_special", ctx.hitboxes)
-                        else:
-                            if getattr(ctx.player1, "_distance_attack_cooldown_remaining", 0) <= 0:
-                                ProjectileSprite(ctx.player1, ctx.hitboxes)
-                                ctx.player1.start_distance_attack_animation()
-                                ctx.player1._distance_attack_cooldown_remaining = DISTANCE_ATTACK_COOLDOWN_FRAMES
-                                ctx.player1._distance_burst_remaining = DISTANCE_ATTACK_BURST_SIZE * DISTANCE_ATTACK_NUM_BURSTS - 1
-                                ctx.player1._distance_burst_timer = DISTANCE_ATTACK_BURST_DELAY
-                elif joy_id == 1 and n_joy >= 2:
-                    if btn == JOY_BTN_JUMP: ctx.player2.jump()
-                    elif btn == JOY_BTN_ATTACK and ctx.player2.lives > 0:
-                        start_attack_from_input(ctx.player2, ctx.hitboxes, "jab", "ftilt", "utilt", "dtilt", "nair", "fair", "bair", "uair", "dair")
-                    elif btn in (JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT) and ctx.player2.lives > 0: ctx.player2.start_counter()
-                    elif btn == JOY_BTN_SPECIAL and ctx.player2.lives > 0:
-                        pl, pr, pu, pd = get_player_input_state(ctx.player2)
-                        if pl or pr: ctx.player2.start_attack("side_special", ctx.hitboxes)
-                        elif pu: ctx.player2.start_attack("up_special", ctx.hitboxes)
-                        elif pd: ctx.player2.start_attack("down_special", ctx.hitboxes)
-                        else:
-                            if getattr(ctx.player2, "_distance_attack_cooldown_remaining", 0) <= 0:
-                                ProjectileSprite(ctx.player2, ctx.hitboxes)
-                                ctx.player2.start_distance_attack_animation()
-                                ctx.player2._distance_attack_cooldown_remaining = DISTANCE_ATTACK_COOLDOWN_FRAMES
-                                ctx.player2._distance_burst_remaining = DISTANCE_ATTACK_BURST_SIZE * DISTANCE_ATTACK_NUM_BURSTS - 1
-                                ctx.player2._distance_burst_timer = DISTANCE_ATTACK_BURST_DELAY
+                if tr.on[_TR_BUTTON]:
+                    tr.emit(_TR_BUTTON, joy_id, btn)
+                pl = joy_players.get(joy_id)
+                if pl is not None:
+                    if btn == JOY_BTN_JUMP: presses[pl].add("jump")
+                    elif btn == JOY_BTN_ATTACK: presses[pl].add("attack")
+                    elif btn in (JOY_BTN_COUNTER, JOY_BTN_COUNTER_ALT): presses[pl].add("counter")
+                    elif btn == JOY_BTN_SPECIAL: presses[pl].add("special")
 
         if ctx.paused:
-            ctx.world_surface.blit(ctx.assets.background, (0, 0))
-            ctx.hitboxes.draw(ctx.world_surface)
-            ctx.platforms.draw(ctx.world_surface)
-            ctx.players.draw(ctx.world_surface)
-            smog_list = getattr(ctx.assets, "smog_surfaces", [])
-            valid_smog = [s for s in smog_list if s is not None] if smog_list else []
-            for pl in (ctx.player1, ctx.player2):
-                if getattr(pl, "_smoke_frames_remaining", 0) > 0 and getattr(pl, "_smoke_surface", None) is not None:
-                    surf = pl._smoke_surface
-                    x, y = pl._smoke_x - surf.get_width() // 2, pl._smoke_y - surf.get_height() // 2
-                    ctx.world_surface.blit(surf, (x, y))
-            draw_player_ping(ctx.world_surface, ctx.player1, ctx.assets.ping_p1, ctx.assets.ping_offset_above)
-            draw_player_ping(ctx.world_surface, ctx.player2, ctx.assets.ping_p2, ctx.assets.ping_offset_above)
-            ctx.screen.blit(ctx.world_surface, (0, 0), (int(ctx.camera_x), int(ctx.camera_y), ctx.screen_w, ctx.screen_h))
-            hud_y = ctx.screen_h - ctx.assets.hud_bottom_y_offset
-            percent_y = hud_y - 28
-            margin = ctx.assets.portrait_side_margin
-            draw_percent_hud(ctx.screen, ctx.player1, margin, percent_y, ctx.assets, align_left=True)
-            draw_percent_hud(ctx.screen, ctx.player2, ctx.screen_w - margin, percent_y, ctx.assets, align_left=False)
-            draw_portraits(ctx.screen, ctx.assets, ctx.screen_w, hud_y, ctx.player1, ctx.player2)
-            overlay = pygame.Surface((ctx.screen_w, ctx.screen_h))
-            overlay.set_alpha(140)
-            overlay.fill((0, 0, 0))
-            ctx.screen.blit(overlay, (0, 0))
-            panel_w, panel_h = 340, 200
-            panel_rect = pygame.Rect(ctx.screen_w // 2 - panel_w // 2, ctx.screen_h // 2 - panel_h // 2, panel_w, panel_h)
-            pygame.draw.rect(ctx.screen, (45, 50, 62), panel_rect, border_radius=14)
-            pygame.draw.rect(ctx.screen, (255, 215, 100), panel_rect, 3, border_radius=14)
-            try:
-                font_title = pygame.font.SysFont("arial", 38, bold=True)
-                font_opt = pygame.font.SysFont("arial", 28, bold=True)
-            except Exception:
-                font_title = pygame.font.Font(None, 48)
-                font_opt = pygame.font.Font(None, 36)
-            title_surf = font_title.render("PAUSE", True, (255, 252, 245))
-            ctx.screen.blit(title_surf, title_surf.get_rect(center=(ctx.screen_w // 2, panel_rect.y + 42)))
-            for i, label in enumerate(("Reprendre", "Quitter la partie")):
-                color = (255, 220, 100) if i == ctx.pause_menu_cursor else (220, 220, 220)
-                opt_surf = font_opt.render(label, True, color)
-                y = panel_rect.y + 88 + i * 44
-                ctx.screen.blit(opt_surf, opt_surf.get_rect(center=(ctx.screen_w // 2, y)))
-            hint = font_opt.render("Échap / Start : reprendre", True, (150, 155, 165))
-            ctx.screen.blit(hint, hint.get_rect(center=(ctx.screen_w // 2, ctx.screen_h - 40)))
-            pygame.display.flip()
-            ctx.clock.tick(60)
-            return
+            ctx.sim_accumulator_ms = 0
+        ctx.profiler.lap("events")
+        return True
 
-        for player in (ctx.player1, ctx.player2):
-            cooldown = getattr(player, "_distance_attack_cooldown_remaining", 0)
-            if cooldown > 0:
-                player._distance_attack_cooldown_remaining = cooldown - 1
-            burst_remaining = getattr(player, "_distance_burst_remaining", 0)
-            if burst_remaining > 0:
-                timer = getattr(player, "_distance_burst_timer", 0)
-                player._distance_burst_timer = max(0, timer - 1)
-                if player._distance_burst_timer <= 0:
-                    ProjectileSprite(player, ctx.hitboxes)
-                    player._distance_burst_remaining -= 1
-                    player._distance_burst_timer = DISTANCE_ATTACK_BURST_DELAY
+    def _activate_cheat(self, ctx, name: str, until_ms: int):
+        """Triche sur P1 jusqu'à until_ms ; notée dans le replay en cours (elle ne passe pas par les entrées)."""
+        sim = ctx.simulation
+        if sim.recorder is not None:
+            sim.recorder.note(sim, ctx.player1, name, until_ms)
+        else:
+            setattr(ctx.player1, name, until_ms)
 
-        ctx.player1.handle_input()
-        ctx.player2.handle_input()
-        for pl in (ctx.player1, ctx.player2):
-            if getattr(pl, "joystick", None) and not pl.on_ground and pl.jump_count < pl.jump_max:
-                joy_in = pl._get_joy_input()
-                if joy_in and joy_in[4] and not getattr(pl, "_did_air_jump_this_flight", True):
-                    pl.jump()
-                    pl._did_air_jump_this_flight = True
-        ctx.player1.update([ctx.player2] + list(ctx.platforms))
-        ctx.player2.update([ctx.player1] + list(ctx.platforms))
-        ctx.hitboxes.update(list(ctx.players))
+    def _finish_recording(self, ctx):
+        """Match fini ou quitté : écrit le replay en cours (s'il y en a un) dans src/replays."""
+        sim = ctx.simulation
+        recorder, sim.recorder = sim.recorder, None
+        if recorder is None or sim.frame == 0:
+            return
+        try:
+            path = save_replay(recorder.finish(sim, ctx.selected_map_index), keep=REPLAY_KEEP)
+        except OSError as e:
+            print(f"Replay non enregistré : {e}")
+            return
+        print(f"Replay enregistré : {path}")
 
-        living = [p for p in (ctx.player1, ctx.player2) if getattr(p, "lives", 1) > 0]
+    def step(self, ctx, inputs=None):
+        """
+        Un tick fixe : simulation (entrées échantillonnées + appuis en attente), caméra, timers d'effets.
+        inputs : InputFrame par joueur fournis par l'appelant (benchmarks, replays) au lieu des périphériques.
+        """
+        sim = ctx.simulation
+        presses = self._pending_presses
+        if inputs is None and ctx.replay is not None:
+            inputs = ctx.replay.inputs_for(sim)
+            if inputs is None:
+                return
+        if inputs is None and ctx.netplay is not None:
+            # En ligne : le joueur local utilise les commandes de P1 ; l'adversaire arrive par le réseau
+            device = sim.players[0]
+            inputs = ctx.netplay.advance(sample_player_input(device, presses.get(device, ())))
+            if inputs is None:
+                # En attente de l'autre joueur : appuis gardés pour le prochain tick
+                return
+        if inputs is None:
+            inputs = sample_inputs(sim.players, presses)
+        sim.step(inputs)
+        presses.clear()
+
+        ctx.camera_prev_x, ctx.camera_prev_y = ctx.camera_x, ctx.camera_y
+        living = [p for p in sim.players if getattr(p, "lives", 1) > 0]
         if living:
             cx = sum(p.rect.centerx for p in living) / len(living)
             cy = sum(p.rect.centery for p in living) / len(living)
@@ -386,34 +278,69 @@ class PlayingScreen:
             ctx.camera_x = max(0, min(ctx.world_w - ctx.screen_w, ctx.camera_x))
             ctx.camera_y = max(0, min(ctx.world_h - ctx.screen_h, ctx.camera_y))
 
-        ctx.world_surface.blit(ctx.assets.background, (0, 0))
-        ctx.hitboxes.draw(ctx.world_surface)
-        ctx.platforms.draw(ctx.world_surface)
-        ctx.players.draw(ctx.world_surface)
+        for pl in sim.players:
+            if getattr(pl, "_smoke_frames_remaining", 0) > 0:
+                pl._smoke_frames_remaining -= 1
+        ctx.profiler.lap("camera")
+
+    def draw(self, ctx, alpha: float = 1.0):
+        """Dessine le monde entre les deux derniers états de simulation (alpha dans [0, 1]) puis le HUD."""
+        sim = ctx.simulation
+        cam_x = ctx.camera_prev_x + (ctx.camera_x - ctx.camera_prev_x) * alpha
+        cam_y = ctx.camera_prev_y + (ctx.camera_y - ctx.camera_prev_y) * alpha
+        view = WorldView(ctx.screen, cam_x, cam_y)
+        view.draw_background(ctx.stage_layer.surface_for(ctx))
+        for sprite in ctx.hitboxes:
+            view.blit(sprite.image, sim.interpolated_rect(sprite, alpha))
+        player_rects = {pl: sim.interpolated_rect(pl, alpha) for pl in sim.players}
+        for pl in sim.players:
+            view.blit(pl.image, player_rects[pl])
         smog_list = getattr(ctx.assets, "smog_surfaces", [])
         valid_smog = [s for s in smog_list if s is not None] if smog_list else []
-        for pl in (ctx.player1, ctx.player2):
+        for pl in sim.players:
             if getattr(pl, "_show_smoke", False) and valid_smog:
                 pl._show_smoke = False
                 pl._smoke_surface = random.choice(valid_smog)
                 pl._smoke_x, pl._smoke_y = pl.rect.centerx, pl.rect.centery
                 pl._smoke_frames_remaining = 12
             if getattr(pl, "_smoke_frames_remaining", 0) > 0 and pl._smoke_surface is not None:
-                surf = pl._smoke_surface
-                w, h = surf.get_size()
-                x = pl._smoke_x - w // 2
-                y = pl._smoke_y - h // 2
-                ctx.world_surface.blit(surf, (x, y))
-                pl._smoke_frames_remaining -= 1
-        draw_player_ping(ctx.world_surface, ctx.player1, ctx.assets.ping_p1, ctx.assets.ping_offset_above)
-        draw_player_ping(ctx.world_surface, ctx.player2, ctx.assets.ping_p2, ctx.assets.ping_offset_above)
-        ctx.screen.blit(ctx.world_surface, (0, 0), (int(ctx.camera_x), int(ctx.camera_y), ctx.screen_w, ctx.screen_h))
+                view.blit_centered(pl._smoke_surface, (pl._smoke_x, pl._smoke_y))
+        for i, pl in enumerate(sim.players):
+            ping = player_ping_surface(ctx.assets, i)
+            draw_player_ping(ctx.screen, pl, ping, ctx.assets.ping_offset_above, view.to_screen(player_rects[pl]))
+        ctx.profiler.lap("world")
 
-        hud_y = ctx.screen_h - ctx.assets.hud_bottom_y_offset
-        percent_y = hud_y - 28
-        margin = ctx.assets.portrait_side_margin
-        draw_percent_hud(ctx.screen, ctx.player1, margin, percent_y, ctx.assets, align_left=True)
-        draw_percent_hud(ctx.screen, ctx.player2, ctx.screen_w - margin, percent_y, ctx.assets, align_left=False)
-        draw_portraits(ctx.screen, ctx.assets, ctx.screen_w, hud_y, ctx.player1, ctx.player2)
+        self.hud.draw(ctx.screen, ctx.assets, sim.players)
+        if ctx.paused:
+            self._draw_pause_menu(ctx)
+        ctx.profiler.lap("hud")
+        ctx.profiler.draw(ctx.screen)
+        ctx.profiler.skip()
         pygame.display.flip()
-        ctx.clock.tick(60)
+        ctx.profiler.lap("flip")
+        ctx.profiler.end_frame()
+
+    def _draw_pause_menu(self, ctx):
+        overlay = pygame.Surface((ctx.screen_w, ctx.screen_h))
+        overlay.set_alpha(140)
+        overlay.fill((0, 0, 0))
+        ctx.screen.blit(overlay, (0, 0))
+        panel_w, panel_h = 340, 200
+        panel_rect = pygame.Rect(ctx.screen_w // 2 - panel_w // 2, ctx.screen_h // 2 - panel_h // 2, panel_w, panel_h)
+        pygame.draw.rect(ctx.screen, (45, 50, 62), panel_rect, border_radius=14)
+        pygame.draw.rect(ctx.screen, (255, 215, 100), panel_rect, 3, border_radius=14)
+        try:
+            font_title = pygame.font.SysFont("arial", 38, bold=True)
+            font_opt = pygame.font.SysFont("arial", 28, bold=True)
+        except Exception:
+            font_title = pygame.font.Font(None, 48)
+            font_opt = pygame.font.Font(None, 36)
+        title_surf = font_title.render("PAUSE", True, (255, 252, 245))
+        ctx.screen.blit(title_surf, title_surf.get_rect(center=(ctx.screen_w // 2, panel_rect.y + 42)))
+        for i, label in enumerate(("Reprendre", "Quitter la partie")):
+            color = (255, 220, 100) if i == ctx.pause_menu_cursor else (220, 220, 220)
+            opt_surf = font_opt.render(label, True, color)
+            y = panel_rect.y + 88 + i * 44
+            ctx.screen.blit(opt_surf, opt_surf.get_rect(center=(ctx.screen_w // 2, y)))
+        hint = font_opt.render("Échap / Start : reprendre", True, (150, 155, 165))
+        ctx.screen.blit(hint, hint.get_rect(center=(ctx.screen_w // 2, ctx.screen_h - 40)))
@@ -0,0 +1,228 @@
+"""
+Simulation de combat sans affichage : un tick = une liste d'entrées explicites (InputFrame) par joueur,
+puis mise à jour joueurs, hitboxes, projectiles, stocks et KO. Aucune lecture clavier/manette/horloge ici :
+PlayingScreen échantillonne les périphériques et dessine le même état ; sous le driver SDL "dummy",
+la simulation tourne seule (tests, analyse, milliers de frames par seconde).
+"""
+import os
+import pygame
+from game.config import SIM_FPS, WIDTH, HEIGHT
+from game.input_handling import select_attack_id
+from combat.projectile_sprite import ProjectileSprite
+from combat.spatial_grid import SpatialGrid
+from player.player import (
+    DISTANCE_ATTACK_COOLDOWN_FRAMES,
+    DISTANCE_ATTACK_BURST_DELAY,
+    DISTANCE_ATTACK_BURST_SIZE,
+    DISTANCE_ATTACK_NUM_BURSTS,
+)
+from player.player_input import NEUTRAL_INPUT
+
+# Au-delà de ce déplacement en un tick (respawn, téléport), on n'interpole pas
+INTERPOLATION_SNAP_DISTANCE = 300
+NORMAL_ATTACK_IDS = ("jab", "ftilt", "utilt", "dtilt", "nair", "fair", "bair", "uair", "dair")
+STARTING_LIVES = 3
+# Marge (px) ajoutée à la zone de requête des collisions joueur (gravité, fast fall, bonds de stomp)
+COLLISION_QUERY_MARGIN = 16
+
+
+def collision_query_rect(player) -> pygame.Rect:
+    """
+    Zone où Player.resolve_collisions peut toucher quelque chose pendant ce tick : rect agrandi du déplacement
+    du tick (vitesse) et d'une hauteur de perso (repoussées successives pendant la résolution).
+    """
+    margin = int(abs(player.speed_x) + abs(player.speed_y)) + COLLISION_QUERY_MARGIN + player.rect.height
+    return player.rect.inflate(2 * margin, 2 * margin)
+
+
+class Simulation:
+    """État d'un match (joueurs, plateformes, hitboxes/projectiles) avancé tick par tick par step(inputs)."""
+
+    def __init__(self, players, platforms, hitboxes=None):
+        self.players = list(players)
+        self.platforms = platforms
+        self.hitboxes = hitboxes if hitboxes is not None else pygame.sprite.Group()
+        self.frame = 0
+        # Index des joueurs ayant perdu un stock pendant le dernier tick
+        self.last_kos = []
+        # Positions (topleft) avant le dernier tick, pour l'interpolation du rendu
+        self._prev_topleft = {}
+        # FrameProfiler optionnel (overlay F3) : temps de handle_input / Player.update / hitboxes
+        self.profiler = None
+        # ReplayRecorder optionnel (game/replay.py) : entrées de chaque tick
+        self.recorder = None
+        # Broadphase : joueurs (reconstruite à chaque tick, suivie pendant les updates) et plateformes
+        # (reconstruite seulement si le groupe change) ; seules les entités proches sont passées aux updates
+        self.fighter_grid = SpatialGrid()
+        self.platform_grid = SpatialGrid()
+        self._platform_ids = None
+
+    @property
+    def time_ms(self) -> int:
+        """Temps de simulation en ms (dérivé du numéro de frame, donc déterministe)."""
+        return self.frame * 1000 // SIM_FPS
+
+    def reset_match(self, lives: int = STARTING_LIVES):
+        """Remet les stocks, replace les joueurs et vide hitboxes / projectiles."""
+        self.frame = 0
+        self.last_kos = []
+        for player in self.players:
+            player.reset_for_match()
+            player.lives = lives
+            player.respawn()
+            player.input = NEUTRAL_INPUT
+            player.clock_ms = 0
+        self.hitboxes.empty()
+        self._prev_topleft = {}
+
+    def living_players(self):
+        return [p for p in self.players if p.lives > 0]
+
+    @property
+    def winner(self):
+        """Dernier joueur encore en vie (None tant que le match n'est pas fini)."""
+        living = self.living_players()
+        if len(self.players) > 1 and len(living) == 1:
+            return living[0]
+        return None
+
+    def match_point(self) -> bool:
+        """Le prochain KO peut finir le match (deux joueurs en vie au plus, dont un au dernier stock)."""
+        living = self.living_players()
+        return 0 < len(living) <= 2 and min(p.lives for p in living) <= 1
+
+    def step(self, inputs):
+        """Avance d'un tick. inputs : un InputFrame (ou None = neutre) par joueur, dans l'ordre de self.players."""
+        self._prev_topleft = {sprite: sprite.rect.topleft for sprite in self.players}
+        for sprite in self.hitboxes:
+            self._prev_topleft[sprite] = sprite.rect.topleft
+
+        now = self.time_ms
+        for i, player in enumerate(self.players):
+            inp = inputs[i] if i < len(inputs) and inputs[i] is not None else NEUTRAL_INPUT
+            player.input = inp
+            player.clock_ms = now
+        if self.recorder is not None:
+            self.recorder.record(self)
+
+        for player in self.players:
+            self._apply_presses(player, player.input)
+        self._tick_distance_attacks()
+
+        for player in self.players:
+            player.handle_input()
+        for player in self.players:
+            inp = player.input
+            if inp.via_joystick and not player.on_ground and player.jump_count < player.jump_max:
+                if inp.jump and not getattr(player, "_did_air_jump_this_flight", True):
+                    player.jump()
+                    player._did_air_jump_this_flight = True
+        prof = self.profiler
+        if prof is not None:
+            prof.lap("handle_input")
+
+        lives_before = [p.lives for p in self.players]
+        fighters = self.fighter_grid
+        fighters.clear()
+        for player in self.players:
+            fighters.insert(player, player.rect)
+        self._sync_platform_grid()
+        for player in self.players:
+            # Même ordre qu'avant la grille : autres joueurs puis plateformes (la résolution en dépend)
+            area = collision_query_rect(player)
+            player.update(fighters.query(area, exclude=player) + self.platform_grid.query(area))
+            fighters.move(player, player.rect)
+        if prof is not None:
+            prof.lap("player_update")
+        for sprite in self.hitboxes.sprites():
+            sprite.update(fighters.query(sprite.reach_rect()))
+        if prof is not None:
+            prof.lap("hitboxes")
+
+        self.last_kos = [i for i, p in enumerate(self.players) if p.lives < lives_before[i]]
+        self.frame += 1
+        return self.last_kos
+
+    def _sync_platform_grid(self):
+        ids = tuple(id(p) for p in self.platforms)
+        if ids == self._platform_ids:
+            return
+        self.platform_grid.clear()
+        for platform in self.platforms:
+            self.platform_grid.insert(platform, platform.rect)
+        self._platform_ids = ids
+
+    def interpolated_rect(self, sprite, alpha: float) -> pygame.Rect:
+        """Rect du sprite entre sa position avant et après le dernier tick (alpha = 0 → avant, 1 → après)."""
+        rect = sprite.rect
+        prev = self._prev_topleft.get(sprite)
+        if prev is None:
+            return rect.copy()
+        dx = rect.x - prev[0]
+        dy = rect.y - prev[1]
+        if abs(dx) > INTERPOLATION_SNAP_DISTANCE or abs(dy) > INTERPOLATION_SNAP_DISTANCE:
+            return rect.copy()
+        return pygame.Rect(round(prev[0] + dx * alpha), round(prev[1] + dy * alpha), rect.width, rect.height)
+
+    def _apply_presses(self, player, inp):
+        """Appuis du tick (front montant) : saut, attaque normale, contre, special."""
+        if inp.jump_pressed:
+            player.jump()
+        if player.lives <= 0:
+            return
+        if inp.attack_pressed:
+            attack_id = select_attack_id(player, inp.left, inp.right, inp.up, inp.down, *NORMAL_ATTACK_IDS)
+            player.start_attack(attack_id, self.hitboxes)
+        if inp.counter_pressed:
+            player.start_counter()
+        if inp.special_pressed:
+            if inp.left or inp.right:
+                player.start_attack("side_special", self.hitboxes)
+            elif inp.up:
+                player.start_attack("up_special", self.hitboxes)
+            elif inp.down:
+                player.start_attack("down_special", self.hitboxes)
+            elif getattr(player, "_distance_attack_cooldown_remaining", 0) <= 0:
+                ProjectileSprite(player, self.hitboxes)
+                player.start_distance_attack_animation()
+                player._distance_attack_cooldown_remaining = DISTANCE_ATTACK_COOLDOWN_FRAMES
+                player._distance_burst_remaining = DISTANCE_ATTACK_BURST_SIZE * DISTANCE_ATTACK_NUM_BURSTS - 1
+                player._distance_burst_timer = DISTANCE_ATTACK_BURST_DELAY
+
+    def _tick_distance_attacks(self):
+        """Cooldown de l'attaque à distance + projectiles restants de la rafale."""
+        for player in self.players:
+            cooldown = getattr(player, "_distance_attack_cooldown_remaining", 0)
+            if cooldown > 0:
+                player._distance_attack_cooldown_remaining = cooldown - 1
+            burst_remaining = getattr(player, "_distance_burst_remaining", 0)
+            if burst_remaining > 0:
+                timer = getattr(player, "_distance_burst_timer", 0)
+                player._distance_burst_timer = max(0, timer - 1)
+                if player._distance_burst_timer <= 0:
+                    ProjectileSprite(player, self.hitboxes)
+                    player._distance_burst_remaining -= 1
+                    player._distance_burst_timer = DISTANCE_ATTACK_BURST_DELAY
+
+
+def init_headless():
+    """Initialise pygame sans fenêtre réelle (driver SDL "dummy") : suffisant pour charger les sprites."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+def create_headless_simulation(characters=("judy", "nick"), world_size=(WIDTH * 2, HEIGHT * 2), count: int = 2):
+    """Crée un match complet (count joueurs + plateformes) sans écran, prêt pour step()."""
+    from game.assets import load_platform_surfaces
+    from game.match_setup import create_players, create_platforms
+
+    init_headless()
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    players = create_players(world_size, characters, count)
+    platforms = create_platforms(world_size, *load_platform_surfaces(base_dir))
+    sim = Simulation(players, platforms)
+    sim.reset_match()
+    return sim
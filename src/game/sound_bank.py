@@ -0,0 +1,139 @@
+"""
+Banque de sons (SFX) : tous les effets chargés en une fois (groupe d'assets "sounds", avant le combat)
+puis joués par identifiant. Chaque catégorie (coups, projectiles, voix) a ses propres canaux réservés :
+une rafale de projectiles ne peut voler que les canaux des projectiles, jamais ceux des coups ou des voix.
+La musique (pygame.mixer.music) n'est pas concernée.
+"""
+import os
+import random
+import threading
+import pygame
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Catégorie -> nombre de canaux réservés (= voix simultanées max ; au-delà, la plus ancienne est coupée)
+CHANNEL_POOLS = {
+    "hits": 4,
+    "projectiles": 3,
+    "voice": 2,
+}
+# Identifiant -> (chemins candidats sous assets/, le premier existant est chargé ; catégorie ; volume)
+SOUND_FILES = {
+    "melee_attack": ((("song", "combat", "body to body", "aerial-attack.wav"),), "hits", 0.35),
+    "counter": ((("song", "combat", "counter", "dash-attack.wav"),), "hits", 0.4),
+    "stomp": ((("song", "combat", " crushing", "jab-attack.wav"),), "hits", 0.4),
+    "distance_attack": ((("song", "combat", "distance_attack", "tilt-attack.wav"),), "projectiles", 0.35),
+    "versus_sfx": ((("song", "menu", "sfx versus", "special-attack_1.wav"),), "voice", 0.4),
+    "nick_win": (
+        (
+            ("song", "nick win", "nick_win.wav"),
+            ("song", "nick win", "[Fandub] Zootopie - La Rencontre de Judy et Nick (mp3cut (mp3cut.net).mp3"),
+        ),
+        "voice", 1.0,
+    ),
+    "judy_win_1": ((("song", "JudyWin", "winJudy.wav"),), "voice", 1.0),
+    "judy_win_2": ((("song", "JudyWin", "WinJudy3.wav"),), "voice", 1.0),
+}
+JUDY_WIN_SOUNDS = ("judy_win_1", "judy_win_2")
+
+
+class _ChannelPool:
+    """Canaux d'une catégorie : un canal libre s'il y en a, sinon vol du son démarré le plus tôt."""
+
+    def __init__(self, channels):
+        self.channels = channels
+        self._started = [0] * len(channels)
+
+    def play(self, sound):
+        now = pygame.time.get_ticks()
+        free = [i for i, ch in enumerate(self.channels) if not ch.get_busy()]
+        i = free[0] if free else min(range(len(self.channels)), key=self._started.__getitem__)
+        self.channels[i].play(sound)
+        self._started[i] = now
+        return self.channels[i]
+
+
+class SoundBank:
+    """preload() charge tous les SOUND_FILES ; play(id) joue sur le canal de sa catégorie (sans effet sans mixer)."""
+
+    def __init__(self, base_dir: str = _BASE_DIR):
+        self.base_dir = base_dir
+        self._sounds = {}
+        self._pools = None
+        self._lock = threading.Lock()
+        # Coupé pendant la resimulation d'un rollback : les sons de ces frames ont déjà été joués
+        self.muted = False
+
+    def path_for(self, sound_id: str):
+        """Premier fichier existant pour sound_id, None si aucun."""
+        for parts in SOUND_FILES[sound_id][0]:
+            path = os.path.join(self.base_dir, "assets", *parts)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def preload(self):
+        for sound_id in SOUND_FILES:
+            self.get(sound_id)
+
+    def get(self, sound_id: str):
+        """Sound chargé (une seule fois, au premier appel si preload() n'a pas été fait) ; None si absent."""
+        sound = self._sounds.get(sound_id, False)
+        if sound is not False:
+            return sound
+        with self._lock:
+            if sound_id not in self._sounds:
+                self._sounds[sound_id] = self._load(sound_id)
+            return self._sounds[sound_id]
+
+    def _load(self, sound_id):
+        path = self.path_for(sound_id)
+        if path is None or not pygame.mixer.get_init():
+            return None
+        try:
+            sound = pygame.mixer.Sound(path)
+            sound.set_volume(SOUND_FILES[sound_id][2])
+            return sound
+        except Exception:
+            return None
+
+    def _pool(self, category):
+        if self._pools is None:
+            # Canaux 0..n-1 réservés aux catégories : Sound.play() sans canal ne peut pas les prendre
+            total = sum(CHANNEL_POOLS.values())
+            if pygame.mixer.get_num_channels() < total + 4:
+                pygame.mixer.set_num_channels(total + 4)
+            pygame.mixer.set_reserved(total)
+            self._pools = {}
+            first = 0
+            for name, count in CHANNEL_POOLS.items():
+                self._pools[name] = _ChannelPool([pygame.mixer.Channel(first + i) for i in range(count)])
+                first += count
+        return self._pools[category]
+
+    def play(self, sound_id: str):
+        """Joue sound_id ; renvoie le canal utilisé, ou None (son absent, mixer indisponible, banque muette)."""
+        if self.muted:
+            return None
+        sound = self.get(sound_id)
+        if sound is None:
+            return None
+        try:
+            return self._pool(SOUND_FILES[sound_id][1]).play(sound)
+        except pygame.error:
+            return None
+
+    def play_random(self, sound_ids):
+        """Un des sons au hasard (comme avant : si celui tiré manque, rien n'est joué)."""
+        return self.play(random.choice(sound_ids))
+
+
+_sound_bank = None
+
+
+def get_sound_bank() -> SoundBank:
+    """Banque partagée (joueurs, hitboxes, projectiles, écrans)."""
+    global _sound_bank
+    if _sound_bank is None:
+        _sound_bank = SoundBank()
+    return _sound_bank
@@ -0,0 +1,51 @@
+"""
+Couche statique de la scène : carte de fond + plateformes (qui ne bougent jamais pendant un match)
+composées une seule fois, à la validation de la carte. En combat, un seul blit de la zone sous la caméra
+remplace fond + plateformes ; la couche n'est refaite que si la carte ou la taille du monde change.
+"""
+import pygame
+
+
+class StageLayer:
+    """Cache de la couche fond + plateformes, clé = (index de carte, taille du monde)."""
+
+    def __init__(self):
+        self.surface = None
+        self.key = None
+
+    def invalidate(self):
+        """À appeler si la surface d'affichage est recréée (set_mode) ou si les plateformes changent."""
+        self.surface = None
+        self.key = None
+
+    def surface_for(self, ctx) -> pygame.Surface:
+        """Couche de la carte sélectionnée (construite au premier appel pour cette carte / taille)."""
+        key = (ctx.selected_map_index, ctx.world_w, ctx.world_h)
+        if self.surface is None or self.key != key:
+            # Ancienne couche lâchée avant de construire la nouvelle : jamais deux couches du monde à la fois
+            self.surface = None
+            self.surface = build_stage_surface(_map_surface(ctx), ctx.platforms)
+            self.key = key
+        return self.surface
+
+
+def _map_surface(ctx) -> pygame.Surface:
+    maps = ctx.assets.map_surfaces
+    if 0 <= ctx.selected_map_index < len(maps):
+        return maps[ctx.selected_map_index]
+    return ctx.assets.background
+
+
+def build_stage_surface(background: pygame.Surface, platforms) -> pygame.Surface:
+    """
+    Copie du fond au format d'affichage (un seul convert : pas de copie intermédiaire) avec les plateformes
+    dessinées dessus. Une surface de la taille du monde gardée en plus de l'entrée map_surfaces :
+    largeur × hauteur × 4 octets, soit ~33 Mo en 3840x2160.
+    """
+    try:
+        layer = background.convert()
+    except pygame.error:
+        layer = background.copy()
+    if platforms is not None:
+        platforms.draw(layer)
+    return layer
@@ -0,0 +1,144 @@
+"""
+Trace de debug : événements de forme fixe (instant, frame, code, trois valeurs numériques) écrits dans un
+tampon circulaire préalloué, formatés seulement au dump (fichier texte dans src/traces/, touche F9 ou crash).
+Rien n'est écrit sur la console pendant le jeu. Niveau minimal par catégorie (TRACE_LEVELS dans config) ;
+un site d'appel teste `trace.on[CODE]` avant de calculer ses valeurs : désactivé, il ne coûte qu'un index de liste.
+
+    _PAD_ADDED = define(JOY, INFO, "manette branchée slot={a:.0f}")
+    ...
+    tr = get_trace()
+    if tr.on[_PAD_ADDED]:
+        tr.emit(_PAD_ADDED, slot)
+"""
+import os
+import sys
+import time
+from array import array
+from game.config import TRACE_CAPACITY, TRACE_LEVELS, DEBUG_JOYSTICK, DEBUG_JOYSTICK_VERBOSE
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DEFAULT_DIR = os.path.join(_BASE_DIR, "traces")
+
+ERROR, WARN, INFO, DEBUG = range(4)
+LEVEL_NAMES = ("error", "warn", "info", "debug")
+CATEGORIES = ("joy", "input", "net", "replay")
+JOY, INPUT, NET, REPLAY = range(len(CATEGORIES))
+
+# Code d'événement -> (catégorie, niveau, format) ; le format reçoit a, b, c
+_EVENTS = []
+
+
+def define(category: int, level: int, fmt: str) -> int:
+    """Déclare un type d'événement (au chargement du module appelant) ; renvoie son code."""
+    _EVENTS.append((category, level, fmt))
+    if _trace is not None:
+        _trace.set_level(category, _trace.levels[category])
+    return len(_EVENTS) - 1
+
+
+class TraceBuffer:
+    """Tampon circulaire : les capacity derniers événements, en tableaux parallèles (aucune allocation par événement)."""
+
+    def __init__(self, capacity: int = TRACE_CAPACITY, levels=None):
+        self.capacity = capacity
+        self._time_ms = array("d", [0.0]) * capacity
+        self._frame = array("q", [0]) * capacity
+        self._code = array("l", [0]) * capacity
+        self._a = array("d", [0.0]) * capacity
+        self._b = array("d", [0.0]) * capacity
+        self._c = array("d", [0.0]) * capacity
+        self._count = 0  # total émis (la position d'écriture est count % capacity)
+        self._t0 = time.perf_counter()
+        self.frame = 0  # frame courante de la boucle principale (horodatage des événements)
+        self.levels = [WARN] * len(CATEGORIES)
+        self.on = []  # code -> enregistré ? (recalculé quand un niveau change)
+        for name, level in (levels or {}).items():
+            self.set_level(CATEGORIES.index(name), LEVEL_NAMES.index(level))
+        self._refresh()
+
+    def set_level(self, category: int, level: int):
+        """Niveau maximal enregistré pour la catégorie (ERROR..DEBUG ; -1 = rien)."""
+        self.levels[category] = level
+        self._refresh()
+
+    def _refresh(self):
+        self.on = [level <= self.levels[category] for category, level, _ in _EVENTS]
+
+    def emit(self, code: int, a: float = 0.0, b: float = 0.0, c: float = 0.0):
+        i = self._count % self.capacity
+        self._time_ms[i] = (time.perf_counter() - self._t0) * 1000.0
+        self._frame[i] = self.frame
+        self._code[i] = code
+        self._a[i] = a
+        self._b[i] = b
+        self._c[i] = c
+        self._count += 1
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Événements écrasés par le tour du tampon."""
+        return max(0, self._count - self.capacity)
+
+    def events(self):
+        """(instant ms, frame, code, a, b, c) du plus ancien au plus récent."""
+        start = self._count - len(self)
+        for n in range(start, self._count):
+            i = n % self.capacity
+            yield self._time_ms[i], self._frame[i], self._code[i], self._a[i], self._b[i], self._c[i]
+
+    def format_lines(self):
+        for t_ms, frame, code, a, b, c in self.events():
+            category, level, fmt = _EVENTS[code]
+            yield f"{t_ms:10.1f} ms  f{frame:<7d} {LEVEL_NAMES[level]:5s} {CATEGORIES[category]:6s} {fmt.format(a=a, b=b, c=c)}"
+
+    def dump(self, path: str = None, reason: str = "dump") -> str:
+        """Écrit le tampon dans un fichier texte (src/traces/ par défaut) ; renvoie son chemin."""
+        if path is None:
+            os.makedirs(_DEFAULT_DIR, exist_ok=True)
+            path = os.path.join(_DEFAULT_DIR, time.strftime("trace_%Y%m%d_%H%M%S.txt"))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# {reason} : {len(self)} événements, {self.dropped} écrasés, frame {self.frame}\n")
+            for line in self.format_lines():
+                f.write(line + "\n")
+        return path
+
+    def clear(self):
+        self._count = 0
+
+
+def _initial_levels() -> dict:
+    levels = dict(TRACE_LEVELS)
+    if DEBUG_JOYSTICK_VERBOSE:
+        levels["joy"] = "debug"
+    elif DEBUG_JOYSTICK:
+        levels["joy"] = "info"
+    return levels
+
+
+_trace = None
+
+
+def get_trace() -> TraceBuffer:
+    """Tampon partagé (boucle principale, entrées, manettes, écrans)."""
+    global _trace
+    if _trace is None:
+        _trace = TraceBuffer(levels=_initial_levels())
+    return _trace
+
+
+def install_crash_dump():
+    """Exception non rattrapée : le tampon est écrit sur disque avant le traceback habituel."""
+    previous = sys.excepthook
+
+    def hook(exc_type, exc, tb):
+        try:
+            path = get_trace().dump(reason=f"crash {exc_type.__name__}: {exc}")
+            print(f"Trace écrite : {path}", file=sys.stderr)
+        except OSError:
+            pass
+        previous(exc_type, exc, tb)
+
+    sys.excepthook = hook
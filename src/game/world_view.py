@@ -0,0 +1,36 @@
+"""
+Rendu du monde en espace caméra : seule la portion du fond sous la caméra est copiée, les sprites sont
+dessinés directement sur l'écran avec le décalage caméra et ignorés s'ils sont hors champ
+(plus de surface monde plein format, 2x l'écran, remplie puis recadrée à chaque frame).
+"""
+import pygame
+
+
+class WorldView:
+    """Fenêtre caméra sur le monde : convertit les rects monde en positions écran et fait le culling."""
+
+    def __init__(self, surface: pygame.Surface, camera_x: float, camera_y: float):
+        self.surface = surface
+        self.rect = pygame.Rect(int(camera_x), int(camera_y), surface.get_width(), surface.get_height())
+
+    def to_screen(self, world_rect: pygame.Rect) -> pygame.Rect:
+        return world_rect.move(-self.rect.x, -self.rect.y)
+
+    def draw_background(self, background: pygame.Surface):
+        """Copie uniquement la zone du fond sous la caméra."""
+        self.surface.blit(background, (0, 0), self.rect)
+
+    def blit(self, image: pygame.Surface, world_rect: pygame.Rect) -> bool:
+        """Dessine image à world_rect (coordonnées monde) ; False si hors champ (rien dessiné)."""
+        if not self.rect.colliderect(world_rect):
+            return False
+        self.surface.blit(image, (world_rect.x - self.rect.x, world_rect.y - self.rect.y))
+        return True
+
+    def blit_centered(self, image: pygame.Surface, world_center) -> bool:
+        return self.blit(image, image.get_rect(center=world_center))
+
+    def draw_group(self, group):
+        """Équivalent de Group.draw(world_surface), en espace caméra avec culling."""
+        for sprite in group:
+            self.blit(sprite.image, sprite.rect)
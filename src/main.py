@@ -22,21 +22,36 @@
 #
 """
 Point d'entrée du jeu : init pygame, création du contexte, des joueurs, des plateformes,
-puis boucle principale qui délègue à chaque écran selon game_state.
+puis boucle principale qui délègue à l'écran de game_state (registre des écrans, game/screens/base.py).
+
+    python main.py [--netplay HOTE:PORT --player 1|2 [--port 7000]]   # versus en ligne (rollback)
+    python main.py --replay replays/FICHIER.smr [--seek FRAME]           # revoir un match enregistré
 """
+import argparse
 import os
+import random
 import time
 import pygame
-from player.player import Player
-from smash_platform.game_platform import Platform
 from menu import MainMenu, SettingsMenu, ControlsMenu
 
 from game.config import (
-    WIDTH, HEIGHT, JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_START,
+    WIDTH, HEIGHT, JOY_DEADZONE, JOY_BTN_JUMP, JOY_BTN_START, MATCH_PLAYERS, NET_PORT, RECORD_REPLAYS,
 )
 from game.context import GameContext
-from game.input_handling import init_joysticks, tick_joystick_rescan
+from game.match_setup import create_players, create_platforms
+from game.simulation import Simulation, STARTING_LIVES
+from game.replay import ReplayRecorder, load_replay
+from game.sound_bank import get_sound_bank
+from game.input_handling import init_joysticks, tick_gamepads, safe_event_get
+from game.trace import get_trace, install_crash_dump
+from game.hud import draw_loading_indicator
+from net import RollbackSession, UdpTransport
 from game.screens import (
+    ScreenRegistry,
+    MainMenuScreen,
+    SettingsScreen,
+    ControlsScreen,
+    TitleScreen,
     MapSelectScreen,
     CharacterSelectScreen,
     JudyNickIntroVideoScreen,
@@ -77,6 +92,15 @@ SMASHTOPIA_BANNER = r"""
 """
 print(SMASHTOPIA_BANNER)
 
+# Versus en ligne : chaque machine choisit la même carte et les mêmes persos, puis lance VERSUS
+arg_parser = argparse.ArgumentParser(description="Smashtopia")
+arg_parser.add_argument("--netplay", metavar="HOTE:PORT", help="adresse de l'autre joueur (versus en ligne)")
+arg_parser.add_argument("--player", type=int, choices=(1, 2), default=1, help="joueur joué sur cette machine")
+arg_parser.add_argument("--port", type=int, default=NET_PORT, help="port UDP local")
+arg_parser.add_argument("--replay", metavar="FICHIER", help="rejoue un match enregistré (src/replays)")
+arg_parser.add_argument("--seek", type=int, default=0, metavar="FRAME", help="avance le replay sans rendu jusqu'à ce frame")
+args, _ = arg_parser.parse_known_args()
+
 # --- Init Pygame (écran, polices, manettes, son) ---
 pygame.init()
 pygame.font.init()
@@ -87,7 +111,6 @@ except Exception:
     pass
 
 time.sleep(0.3)
-print(f"Manettes détectées : {pygame.joystick.get_count()}")
 
 # Fenêtre en plein écran, monde 2x la taille de l'écran pour le scroll
 fullscreen_mode = True
@@ -101,75 +124,75 @@ ctx = GameContext(screen, clock, base_dir, (screen_w, screen_h), (world_w, world
 ctx.fullscreen_mode = fullscreen_mode
 ctx.window_size = (WIDTH, HEIGHT)
 
-# Contrôles type Brawlhalla : P1 clavier A/D + F/E/H (ou manette 0), P2 flèches + M/I/J (ou manette 1).
-player1 = Player(
-    start_pos=(world_w // 2 - 200, world_h // 2),
-    color=(255, 0, 0),
-    controls={
-        "left": pygame.K_a,
-        "right": pygame.K_d,
-        "jump": pygame.K_SPACE,
-        "down": pygame.K_s,
-        "attacking": pygame.K_f,
-        "special": pygame.K_e,
-        "grab": pygame.K_g,
-        "counter": pygame.K_h
-    },
-    screen_size=(world_w, world_h),
-    joystick_id=0
-)
-player2 = Player(
-    start_pos=(world_w // 2 + 200, world_h // 2),
-    color=(0, 0, 255),
-    controls={
-        "left": pygame.K_LEFT, 
-        "right": pygame.K_RIGHT, 
-        "jump": pygame.K_UP, 
-        "down": pygame.K_DOWN, 
-        "attacking": pygame.K_m, 
-        "special": pygame.K_i, 
-        "grab": pygame.K_o, 
-        "counter": pygame.K_j
-    },
-    screen_size=(world_w, world_h),
-    character="nick",
-    joystick_id=1
-)
+players = create_players((world_w, world_h), count=max(2, MATCH_PLAYERS))
+player1, player2 = players[0], players[1]
 
 ctx.player1 = player1
 ctx.player2 = player2
-ctx.players = pygame.sprite.Group(player1, player2)
+ctx.players = pygame.sprite.Group(*players)
 ctx.hitboxes = pygame.sprite.Group()
 
 # Plateformes : une centrale + deux petites en hauteur (one-way)
 a = ctx.assets
-wc_x, wc_y = world_w // 2, world_h // 2
-platforms = pygame.sprite.Group()
-platforms.add(
-    Platform(
-        a.main_platform_size, 
-        (wc_x - a.main_platform_size[0] // 2, wc_y + 200), 
-        image=a.main_platform_image, 
-        surface_offset=int(a.main_platform_size[1] * 0.42) if a.main_platform_image else 0
-    ),
-    Platform(
-        a.small_platform_size, 
-        (wc_x - 350 - a.small_platform_size[0] // 2, wc_y - 150), 
-        one_way=True, 
-        image=a.small_platform_image, 
-        surface_offset=int(a.small_platform_size[1] * 0.38)
-    ),
-    Platform(
-        a.small_platform_size, 
-        (wc_x + 350 - a.small_platform_size[0] // 2, wc_y - 150), 
-        one_way=True, 
-        image=a.small_platform_image, 
-        surface_offset=int(a.small_platform_size[1] * 0.38)
-    ),
+ctx.platforms = create_platforms(
+    (world_w, world_h),
+    a.main_platform_size,
+    a.main_platform_image,
+    a.small_platform_size,
+    a.small_platform_image,
 )
-ctx.platforms = platforms
+ctx.simulation = Simulation(players, ctx.platforms, ctx.hitboxes)
+ctx.simulation.profiler = ctx.profiler
+
+install_crash_dump()
+init_joysticks(players)
+
+
+def start_netplay():
+    """Nouvelle session de rollback pour le match qui commence (si --netplay), la précédente est fermée."""
+    if ctx.netplay is not None:
+        ctx.netplay.close()
+        ctx.netplay = None
+    if args.netplay:
+        host, port = args.netplay.rsplit(":", 1)
+        ctx.netplay = RollbackSession(ctx.simulation, args.player - 1, UdpTransport(args.port, (host, int(port))))
+
+
+def start_recording():
+    """Graine du module random pour le match qui commence, et enregistrement de ses entrées (replay)."""
+    seed = random.randrange(1 << 32)
+    random.seed(seed)
+    ctx.simulation.recorder = ReplayRecorder(seed, STARTING_LIVES) if RECORD_REPLAYS else None
+
+
+def start_replay(path: str, seek: int):
+    """Lecture à 1x du replay path (après seek frames joués sans rendu ni son) ; False s'il est illisible."""
+    try:
+        replay = load_replay(path)
+    except (OSError, ValueError) as e:
+        print(f"Replay illisible ({path}) : {e}")
+        return False
+    sim = ctx.simulation
+    if len(replay.characters) != len(sim.players):
+        print(f"Replay à {len(replay.characters)} joueurs, le jeu en a {len(sim.players)} (MATCH_PLAYERS)")
+        return False
+    if replay.world_size != (world_w, world_h):
+        print(f"Replay enregistré avec un monde de {replay.world_size}, ici {(world_w, world_h)} : la lecture peut diverger")
+    replay.start(sim)
+    ctx.selected_map_index = replay.map_index
+    if seek > 0:
+        sounds = get_sound_bank()
+        profiler, sim.profiler = sim.profiler, None
+        sounds.muted = True
+        try:
+            replay.play(sim, seek)
+        finally:
+            sounds.muted = False
+            sim.profiler = profiler
+    ctx.replay = replay
+    ctx.game_state = "playing"
+    return True
 
-init_joysticks(player1, player2)
 
 # --- Instances des écrans et menus ---
 main_menu = MainMenu(
@@ -198,252 +221,67 @@ controls_menu = ControlsMenu(
     joy_confirm_buttons=(JOY_BTN_JUMP, JOY_BTN_START)
 )
 
-map_select_screen = MapSelectScreen()
-character_select_screen = CharacterSelectScreen()
-judy_nick_intro_video_screen = JudyNickIntroVideoScreen()
-countdown_screen = CountdownScreen()
-versus_gif_screen = VersusGifScreen()
-wait_p1_enter_screen = WaitP1EnterScreen()
-versus_gif_p1_confirm_screen = VersusGifP1ConfirmScreen()
-enter_gif_screen = EnterGifScreen()
-enter_then_a_screen = EnterThenAGifScreen()
-nick_win_screen = NickWinScreen()
-judy_win_screen = JudyWinScreen()
-playing_screen = PlayingScreen()
 
-while ctx.running:
-    tick_joystick_rescan(player1, player2)
-    
-    # --- Menu principal (seule la manette P1 pilote le menu) ---
-    if ctx.game_state == "main_menu":
-        if a.menu_music_loaded and not ctx.menu_music_playing:
-            try:
-                pygame.mixer.music.set_volume(0.15)
-                pygame.mixer.music.play(-1)
-                ctx.menu_music_playing = True
-            except Exception:
-                pass
-        
-        try:
-            events = pygame.event.get()
-        except (KeyError, SystemError):
-            events = []
-        
-        n_joy = pygame.joystick.get_count()
-        
-        for event in events:
-            if event.type == pygame.QUIT:
-                if ctx.menu_music_playing:
-                    try:
-                        pygame.mixer.music.stop()
-                        ctx.menu_music_playing = False
-                    except Exception:
-                        pass
-                ctx.running = False
-                break
-            
-            selected = main_menu.handle_event(event, n_joy)
-            
-            if selected == "QUITTER":
-                if ctx.menu_music_playing:
-                    try:
-                        pygame.mixer.music.stop()
-                        ctx.menu_music_playing = False
-                    except Exception:
-                        pass
-                ctx.running = False
-                break
-            
-            if selected == "VERSUS":
-                # Reset partie + curseurs map P1/P2 avant d’aller en sélection de carte
-                ctx.game_state = "map_select"
-                ctx.map_select_cursor = 0
-                ctx.map_select_cursor_p1 = 0
-                ctx.map_select_cursor_p2 = 0
-                ctx.map_select_p1_confirmed = False
-                ctx.map_select_p2_confirmed = False
-                ctx.selected_map_index = 0
-                ctx.map_select_ignore_confirm_frame = True
-                ctx.char_select_phase = "p1"
-                ctx.char_select_cursor = 0
-                ctx.p1_character_choice = None
-                ctx.p2_character_choice = None
-                player1.lives = 3
-                player2.lives = 3
-                player1.respawn()
-                player2.respawn()
-                ctx.hitboxes.empty()
-                ctx.paused = False
-                break
-            
-            if selected == "PARAMETRES":
-                ctx.game_state = "settings"
-                break
-        
-        if not ctx.running:
-            break
-        
-        main_menu.update(n_joy)
-        
-        if ctx.game_state == "main_menu":
-            main_menu.draw(screen)
-            pygame.display.flip()
-            clock.tick(60)
-            continue
+def start_match(ctx):
+    """VERSUS depuis le menu : partie remise à zéro, nouvel enregistrement, session en ligne si --netplay."""
+    ctx.selected_map_index = 0
+    ctx.simulation.reset_match()
+    ctx.replay = None
+    start_recording()
+    start_netplay()
+    ctx.paused = False
 
-    if ctx.game_state == "settings":
-        try:
-            events = pygame.event.get()
-        except (KeyError, SystemError):
-            events = []
-        
-        n_joy = pygame.joystick.get_count()
-        
-        for event in events:
-            if event.type == pygame.QUIT:
-                ctx.running = False
-                break
-            
-            action = settings_menu.handle_event(event, n_joy)
-            
-            if action == "back":
-                ctx.game_state = "main_menu"
-                break
-            if action == "controls":
-                ctx.game_state = "controls"
-                break
-            if action == "toggle_fullscreen":
-                ctx.fullscreen_mode = not ctx.fullscreen_mode
-                ctx.screen = pygame.display.set_mode(
-                    (WIDTH, HEIGHT), 
-                    pygame.FULLSCREEN if ctx.fullscreen_mode else 0
-                )
-                break
-        
-        if not ctx.running:
-            break
-        
-        settings_menu.update(n_joy)
-        
-        if ctx.game_state == "settings":
-            settings_menu.draw(screen)
-            pygame.display.flip()
-            clock.tick(60)
-            continue
 
-    if ctx.game_state == "controls":
-        try:
-            events = pygame.event.get()
-        except (KeyError, SystemError):
-            events = []
-        
-        n_joy = pygame.joystick.get_count()
-        
-        for event in events:
-            if event.type == pygame.QUIT:
-                ctx.running = False
-                break
-            
-            action = controls_menu.handle_event(event, n_joy)
-            
-            if action == "back":
-                ctx.game_state = "settings"
-                break
-        
-        if not ctx.running:
-            break
-        
-        controls_menu.update(n_joy)
-        
-        if ctx.game_state == "controls":
-            controls_menu.draw(screen)
-            pygame.display.flip()
-            clock.tick(60)
-            continue
+# game_state -> écran (ressources, musique, images/s déclarées par chaque écran : game/screens/base.py)
+screens = ScreenRegistry()
+screens.register("main_menu", MainMenuScreen(main_menu, on_versus=start_match))
+screens.register("settings", SettingsScreen(settings_menu))
+screens.register("controls", ControlsScreen(controls_menu))
+screens.register("title_screen", TitleScreen())
+screens.register("map_select", MapSelectScreen())
+screens.register("character_select", CharacterSelectScreen())
+screens.register("intro_video", JudyNickIntroVideoScreen())
+screens.register("versus_gif", VersusGifScreen())
+screens.register("wait_p1_enter", WaitP1EnterScreen())
+screens.register("versus_gif_p1_confirm", VersusGifP1ConfirmScreen())
+screens.register("versus_gif_enter", EnterGifScreen())
+screens.register("versus_gif_enter_then_a", EnterThenAGifScreen())
+screens.register("countdown", CountdownScreen())
+screens.register("playing", PlayingScreen())
+screens.register("nick_wins", NickWinScreen())
+screens.register("judy_wins", JudyWinScreen())
 
-    if ctx.game_state == "title_screen":
-        try:
-            events = pygame.event.get()
-        except (KeyError, SystemError):
-            events = []
-        
-        for event in events:
-            if event.type == pygame.QUIT:
-                ctx.running = False
-            
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_a:
-                ctx.game_state = "versus_gif"
-                ctx.versus_gif_frame_index = 0
-                ctx.versus_gif_timer_ms = 0
-                ctx.versus_gif_phase = "playing"
-                ctx.wait_after_gif_timer_ms = 0
-            
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                ctx.game_state = "versus_gif_enter"
-                ctx.enter_gif_frame_index = 0
-                ctx.enter_gif_timer_ms = 0
-                ctx.enter_gif_phase = "playing"
-                ctx.wait_after_enter_gif_timer_ms = 0
-            
-            if event.type == pygame.JOYBUTTONDOWN:
-                if event.button == JOY_BTN_JUMP:
-                    ctx.game_state = "versus_gif"
-                    ctx.versus_gif_frame_index = 0
-                    ctx.versus_gif_timer_ms = 0
-                    ctx.versus_gif_phase = "playing"
-                    ctx.wait_after_gif_timer_ms = 0
-                elif event.button == JOY_BTN_START:
-                    ctx.game_state = "versus_gif_enter"
-                    ctx.enter_gif_frame_index = 0
-                    ctx.enter_gif_timer_ms = 0
-                    ctx.enter_gif_phase = "playing"
-                    ctx.wait_after_enter_gif_timer_ms = 0
-        
-        if not ctx.running:
-            break
-        
-        if ctx.game_state == "title_screen":
-            if a.title_screen:
-                screen.blit(a.title_screen, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
-            continue
+loading_since_ms = None
+if args.replay:
+    start_replay(args.replay, args.seek)
 
-    if ctx.game_state == "map_select":
-        map_select_screen.run(ctx)
-        continue
-    if ctx.game_state == "character_select":
-        character_select_screen.run(ctx)
-        continue
-    if ctx.game_state == "intro_video":
-        judy_nick_intro_video_screen.run(ctx)
-        continue
-    if ctx.game_state == "versus_gif":
-        versus_gif_screen.run(ctx)
-        continue
-    if ctx.game_state == "wait_p1_enter":
-        wait_p1_enter_screen.run(ctx)
-        continue
-    if ctx.game_state == "versus_gif_p1_confirm":
-        versus_gif_p1_confirm_screen.run(ctx)
-        continue
-    if ctx.game_state == "versus_gif_enter":
-        enter_gif_screen.run(ctx)
-        continue
-    if ctx.game_state == "versus_gif_enter_then_a":
-        enter_then_a_screen.run(ctx)
-        continue
-    if ctx.game_state == "countdown":
-        countdown_screen.run(ctx)
-        continue
-    if ctx.game_state == "nick_wins":
-        nick_win_screen.run(ctx)
-        continue
-    if ctx.game_state == "judy_wins":
-        judy_win_screen.run(ctx)
-        continue
-    if ctx.game_state == "playing":
-        playing_screen.run(ctx)
+trace = get_trace()
+while ctx.running:
+    # Changement d'état demandé au frame précédent : exit() de l'ancien écran, enter() du nouveau
+    current = screens.sync(ctx)
+    # Un seul tick d'horloge par frame ; les écrans lisent la durée via ctx.clock.get_time() / ctx.frame_dt_ms
+    ctx.frame_dt_ms = clock.tick(current.frame_rate)
+    trace.frame += 1
+    for group in a.failed_groups(*current.asset_groups):
+        # Préchargement en échec : chargé ici, sur le thread principal (l'erreur remonte, pas d'attente sans fin)
+        a.load_group(group)
+    if not a.is_loaded(*current.asset_groups):
+        # Pas prêt à temps : on continue le chargement en arrière-plan et on affiche l'attente
+        a.preload(*current.asset_groups)
+        now_ms = pygame.time.get_ticks()
+        if loading_since_ms is None:
+            loading_since_ms = now_ms
+        if any(e.type == pygame.QUIT for e in safe_event_get()):
+            ctx.running = False
+            break
+        draw_loading_indicator(ctx.screen, a.font_percent, now_ms - loading_since_ms)
+        pygame.display.flip()
         continue
+    loading_since_ms = None
+    tick_gamepads(players)
+    current.run(ctx)
 
-pygame.quit()
\ No newline at end of file
+screens.close(ctx)
+if ctx.netplay is not None:
+    ctx.netplay.close()
+pygame.quit()
@@ -4,6 +4,7 @@ Permet de remapper les touches pour P1 et P2.
 """
 from typing import Optional, Tuple, Dict, Any
 import pygame
+from game.gamepads import get_gamepads
 from game.input_handling import get_poll_axis
 
 
@@ -179,11 +180,11 @@ class ControlsMenu:
             for joy_id in (0, 1):
                 self._axis1_prev[joy_id] = get_poll_axis(joy_id, 1)
         elif joystick_count > 0 and self._step != "listening":
+            j = get_gamepads().joystick(0)
             try:
-                j = pygame.joystick.Joystick(0)
-                if j.get_numaxes() > 1:
+                if j is not None and j.get_numaxes() > 1:
                     self._axis1_prev[0] = j.get_axis(1)
-            except Exception:
+            except pygame.error:
                 pass
 
     def draw(self, screen: pygame.Surface) -> None:
@@ -4,6 +4,7 @@ Seul P1 (manette 0 ou clavier) pilote le menu.
 """
 from typing import Optional, Tuple, Sequence
 import pygame
+from game.gamepads import get_gamepads
 from game.input_handling import get_poll_axis
 
 
@@ -174,14 +175,15 @@ class MainMenu:
                 self._axis_prev[key0] = ax0
                 self._axis_prev[key1] = ax1
             else:
+                j = get_gamepads().joystick(joy_id)
+                if j is None:
+                    continue
                 try:
-                    j = pygame.joystick.Joystick(joy_id)
-                    j.init()
                     if j.get_numaxes() > 0:
                         self._axis_prev[(joy_id, 0)] = j.get_axis(0)
                     if j.get_numaxes() > 1:
                         self._axis_prev[(joy_id, 1)] = j.get_axis(1)
-                except Exception:
+                except pygame.error:
                     pass
 
     def _draw_rounded_card(self, screen: pygame.Surface, rect: pygame.Rect, fill_color: tuple, radius: int, shadow: bool = True) -> None:
@@ -4,6 +4,7 @@ Options : Plein écran (toggle), Retour.
 """
 from typing import Optional, Tuple, Callable
 import pygame
+from game.gamepads import get_gamepads
 from game.input_handling import get_poll_axis
 
 
@@ -104,11 +105,11 @@ class SettingsMenu:
             for joy_id in (0, 1):
                 self._axis1_prev[joy_id] = get_poll_axis(joy_id, 1)
         elif joystick_count > 0:
+            j = get_gamepads().joystick(0)
             try:
-                j = pygame.joystick.Joystick(0)
-                if j.get_numaxes() > 1:
+                if j is not None and j.get_numaxes() > 1:
                     self._axis1_prev[0] = j.get_axis(1)
-            except Exception:
+            except pygame.error:
                 pass
 
     def draw(self, screen: pygame.Surface) -> None:
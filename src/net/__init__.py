@@ -0,0 +1,10 @@
+"""Jeu en ligne : rollback (RollbackSession), format des paquets, transports UDP et loopback simulé."""
+from .rollback import RollbackSession, RollbackStats
+from .transport import UdpTransport, LoopbackNetwork
+
+__all__ = [
+    "RollbackSession",
+    "RollbackStats",
+    "UdpTransport",
+    "LoopbackNetwork",
+]
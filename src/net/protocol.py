@@ -0,0 +1,32 @@
+"""
+Format des paquets du jeu en ligne : entrées d'un joueur pour une suite de frames consécutives (bitmasks de
+InputFrame.to_bits) + accusé de réception. Chaque paquet renvoie toutes les entrées pas encore acquittées :
+un paquet perdu est couvert par le suivant, sans retransmission dédiée.
+"""
+import struct
+
+PROTOCOL_VERSION = 1
+PACKET_INPUTS = 1
+# version, type, premier frame des entrées, dernier frame reçu sans trou de l'autre joueur (-1 : aucun), nombre
+_HEADER = struct.Struct("!BBIiB")
+_INPUT = struct.Struct("!H")
+MAX_INPUTS_PER_PACKET = 64
+
+
+def encode_inputs(first_frame: int, ack_frame: int, inputs) -> bytes:
+    """Paquet d'entrées (au plus MAX_INPUTS_PER_PACKET, les plus anciennes d'abord)."""
+    inputs = list(inputs)[:MAX_INPUTS_PER_PACKET]
+    return _HEADER.pack(PROTOCOL_VERSION, PACKET_INPUTS, first_frame, ack_frame, len(inputs)) + b"".join(
+        _INPUT.pack(bits) for bits in inputs
+    )
+
+
+def decode_inputs(data: bytes):
+    """(premier frame, ack, [bits...]) ou None si le paquet est invalide / d'une autre version."""
+    if len(data) < _HEADER.size:
+        return None
+    version, kind, first_frame, ack_frame, count = _HEADER.unpack_from(data)
+    if version != PROTOCOL_VERSION or kind != PACKET_INPUTS or len(data) != _HEADER.size + count * _INPUT.size:
+        return None
+    inputs = [_INPUT.unpack_from(data, _HEADER.size + i * _INPUT.size)[0] for i in range(count)]
+    return first_frame, ack_frame, inputs
@@ -0,0 +1,194 @@
+"""
+Rollback à la GGPO pour un versus à deux en ligne. Chaque frame, l'entrée locale part avec un retard
+(input_delay) ; celle de l'autre joueur, si elle n'est pas encore arrivée, est prédite (dernière entrée
+connue, sans les appuis). Quand la vraie entrée arrive et diffère de la prédiction, l'état sauvegardé au
+frame fautif est restauré (game/match_state.py) et les frames suivants sont rejoués, son coupé.
+On ne prédit jamais plus de max_rollback frames d'avance : au-delà, la session attend (stall).
+Le nombre de frames rejouables est aussi plafonné par le budget de temps d'une resimulation.
+"""
+import collections
+import time
+
+from game.config import NET_INPUT_DELAY, NET_MAX_ROLLBACK, NET_ROLLBACK_BUDGET_MS
+from game.match_state import capture, restore
+from game.sound_bank import get_sound_bank
+from player.player_input import InputFrame, PRESS_BITS
+from net.protocol import encode_inputs, decode_inputs
+
+HISTORY_FRAMES = 120
+
+
+class RollbackStats:
+    """Compteurs de la session (overlay, benchmark) : rollbacks, frames rejoués, attentes, coût (ms)."""
+
+    def __init__(self, history=HISTORY_FRAMES):
+        self.rollbacks = 0
+        self.resimulated_frames = 0
+        self.stalls = 0
+        self.mispredictions = 0
+        # Derniers rollbacks (history=None : tous)
+        self.rollback_ms = collections.deque(maxlen=history)
+        self.rollback_depths = collections.deque(maxlen=history)
+
+
+class RollbackSession:
+    """
+    Session pour sim (2 joueurs) où le joueur local_index est joué sur cette machine.
+    Chaque tick : inputs = advance(entrée locale) ; si inputs n'est pas None, sim.step(inputs) juste après.
+    """
+
+    def __init__(
+        self,
+        sim,
+        local_index: int,
+        transport,
+        input_delay: int = NET_INPUT_DELAY,
+        max_rollback: int = NET_MAX_ROLLBACK,
+        budget_ms: float = NET_ROLLBACK_BUDGET_MS,
+    ):
+        self.sim = sim
+        self.local_index = local_index
+        self.remote_index = 1 - local_index
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.budget_ms = budget_ms
+        self.stats = RollbackStats()
+
+        # Les input_delay premiers frames sont neutres des deux côtés
+        self._local = {frame: 0 for frame in range(input_delay)}
+        self._remote = {frame: 0 for frame in range(input_delay)}
+        # Dernier frame de l'autre joueur reçu sans trou, et dernier des nôtres qu'il a acquitté
+        self.confirmed_frame = input_delay - 1
+        self._remote_ack = input_delay - 1
+        # Entrée adverse utilisée pour chaque frame simulé pas encore confirmé, états sauvegardés avant ces frames
+        self._used_remote = {}
+        self._states = {}
+        # Coût moyen (ms) d'un frame rejoué, pour borner la profondeur de rollback au budget
+        self._step_ms = 0.0
+
+    # --- Entrées ---
+
+    def _inputs_for(self, frame: int):
+        """(bits local, bits adverse) pour frame : entrée adverse reçue, ou prédite."""
+        remote = self._remote.get(frame)
+        if remote is None:
+            remote = self._remote.get(self.confirmed_frame, 0) & ~PRESS_BITS
+        return self._local[frame], remote
+
+    def _player_inputs(self, local_bits: int, remote_bits: int):
+        inputs = [None, None]
+        inputs[self.local_index] = InputFrame.from_bits(local_bits)
+        inputs[self.remote_index] = InputFrame.from_bits(remote_bits)
+        return inputs
+
+    @property
+    def rollback_window(self) -> int:
+        """Frames d'avance sur la dernière entrée confirmée : max_rollback, réduit si le rejeu dépasserait le budget."""
+        if self._step_ms <= 0:
+            return self.max_rollback
+        return max(1, min(self.max_rollback, int(self.budget_ms / self._step_ms)))
+
+    # --- Réseau ---
+
+    def _send(self):
+        first = self._remote_ack + 1
+        last = max(self._local, default=first - 1)
+        self.transport.send(encode_inputs(first, self.confirmed_frame, (self._local[f] for f in range(first, last + 1))))
+
+    def poll(self):
+        """Lit le réseau, rejoue si une prédiction était fausse, renvoie nos entrées non acquittées."""
+        prof = self.sim.profiler
+        rollback_to = None
+        for data in self.transport.receive():
+            packet = decode_inputs(data)
+            if packet is None:
+                continue
+            first, ack, inputs = packet
+            self._remote_ack = max(self._remote_ack, ack)
+            for frame, bits in enumerate(inputs, first):
+                if frame <= self.confirmed_frame or frame in self._remote:
+                    continue
+                self._remote[frame] = bits
+                used = self._used_remote.get(frame)
+                if used is not None and used != bits:
+                    self.stats.mispredictions += 1
+                    rollback_to = frame if rollback_to is None else min(rollback_to, frame)
+        while self.confirmed_frame + 1 in self._remote:
+            self.confirmed_frame += 1
+
+        if rollback_to is not None:
+            self._rollback(rollback_to)
+        self._forget_confirmed()
+        self._send()
+        if prof is not None:
+            prof.lap("rollback")
+
+    def _forget_confirmed(self):
+        """Oublie ce qui ne sera plus rejoué ni simulé (avant le premier frame non confirmé et le frame courant)."""
+        keep_from = min(self.confirmed_frame + 1, self.sim.frame)
+        for table, first_kept in (
+            (self._states, keep_from),
+            (self._used_remote, keep_from),
+            # Dernière entrée adverse confirmée : base de la prédiction
+            (self._remote, min(self.confirmed_frame, keep_from)),
+            # Nos entrées : encore à simuler / rejouer ou pas encore acquittées
+            (self._local, min(keep_from, self._remote_ack + 1)),
+        ):
+            for frame in [f for f in table if f < first_kept]:
+                del table[frame]
+
+    def _rollback(self, frame: int):
+        """Restaure l'état d'avant frame et rejoue jusqu'au frame courant avec les entrées corrigées."""
+        sim = self.sim
+        target = sim.frame
+        t0 = time.perf_counter()
+        profiler, sim.profiler = sim.profiler, None
+        sounds = get_sound_bank()
+        sounds.muted = True
+        try:
+            restore(sim, self._states[frame])
+            while sim.frame < target:
+                self._step_frame()
+        finally:
+            sounds.muted = False
+            sim.profiler = profiler
+        ms = (time.perf_counter() - t0) * 1000.0
+        depth = target - frame
+        stats = self.stats
+        stats.rollbacks += 1
+        stats.resimulated_frames += depth
+        stats.rollback_ms.append(ms)
+        stats.rollback_depths.append(depth)
+        per_frame = ms / depth
+        self._step_ms = per_frame if self._step_ms <= 0 else self._step_ms * 0.9 + per_frame * 0.1
+
+    def _begin_frame(self):
+        """Sauvegarde l'état avant le frame courant ; entrées du frame (adverse reçue ou prédite)."""
+        frame = self.sim.frame
+        local_bits, remote_bits = self._inputs_for(frame)
+        self._states[frame] = capture(self.sim)
+        if frame > self.confirmed_frame:
+            self._used_remote[frame] = remote_bits
+        return self._player_inputs(local_bits, remote_bits)
+
+    def _step_frame(self):
+        self.sim.step(self._begin_frame())
+
+    # --- Tick ---
+
+    def advance(self, local_input: InputFrame):
+        """
+        Tick suivant : enregistre local_input (joué input_delay frames plus tard), lit le réseau (rollback
+        éventuel). Renvoie les entrées à passer à sim.step, ou None s'il faut attendre l'autre joueur.
+        """
+        self.poll()
+        frame = self.sim.frame
+        if frame - self.confirmed_frame > self.rollback_window:
+            self.stats.stalls += 1
+            return None
+        self._local[frame + self.input_delay] = local_input.to_bits()
+        return self._begin_frame()
+
+    def close(self):
+        self.transport.close()
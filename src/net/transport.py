@@ -0,0 +1,100 @@
+"""
+Transports du jeu en ligne : send(bytes) / receive() -> liste de paquets arrivés, jamais bloquants.
+UdpTransport parle à un autre PC ; LoopbackNetwork relie deux endpoints dans le même processus avec latence,
+gigue et pertes réglables, pour tester le rollback sur une seule machine (tests, benchmark).
+"""
+import heapq
+import random
+import socket
+import time
+
+
+class UdpTransport:
+    """Socket UDP non bloquante liée à local_port, envoie à remote_addr (host, port)."""
+
+    MAX_DATAGRAM = 2048
+
+    def __init__(self, local_port: int, remote_addr, bind_host: str = "0.0.0.0"):
+        host, port = remote_addr
+        self.remote_addr = (socket.gethostbyname(host), int(port))
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        self._sock.bind((bind_host, local_port))
+
+    def send(self, data: bytes):
+        try:
+            self._sock.sendto(data, self.remote_addr)
+        except OSError:
+            # Réseau momentanément indisponible : l'envoi suivant renverra les mêmes entrées
+            pass
+
+    def receive(self):
+        packets = []
+        while True:
+            try:
+                data, addr = self._sock.recvfrom(self.MAX_DATAGRAM)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # ICMP "port unreachable" (Windows) tant que l'autre joueur n'écoute pas encore
+                continue
+            if addr[:2] == self.remote_addr:
+                packets.append(data)
+        return packets
+
+    def close(self):
+        self._sock.close()
+
+
+class _LoopbackEndpoint:
+    def __init__(self, network):
+        self._network = network
+        self.peer = None
+        # Tas de (heure d'arrivée ms, n° d'envoi, paquet)
+        self._inbox = []
+
+    def send(self, data: bytes):
+        self._network._deliver(self.peer, data)
+
+    def receive(self):
+        now = self._network.now_ms()
+        packets = []
+        inbox = self._inbox
+        while inbox and inbox[0][0] <= now:
+            packets.append(heapq.heappop(inbox)[2])
+        return packets
+
+    def close(self):
+        self._inbox.clear()
+
+
+class LoopbackNetwork:
+    """
+    Réseau simulé entre deux endpoints (endpoints()) : latence aller simple (ms) ± gigue uniforme, perte de
+    chaque paquet avec la probabilité loss ; la gigue peut réordonner les paquets, comme sur Internet.
+    clock : fonction -> ms (par défaut l'horloge réelle ; une horloge virtuelle rend un test reproductible).
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, loss: float = 0.0, seed=None, clock=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+        self._rng = random.Random(seed)
+        self.now_ms = clock or (lambda: time.perf_counter() * 1000.0)
+        self._sent = 0
+        self.sent_packets = 0
+        self.lost_packets = 0
+
+    def endpoints(self):
+        a, b = _LoopbackEndpoint(self), _LoopbackEndpoint(self)
+        a.peer, b.peer = b, a
+        return a, b
+
+    def _deliver(self, endpoint, data: bytes):
+        self.sent_packets += 1
+        if self._rng.random() < self.loss:
+            self.lost_packets += 1
+            return
+        delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms))
+        self._sent += 1
+        heapq.heappush(endpoint._inbox, (self.now_ms() + delay, self._sent, bytes(data)))
@@ -4,12 +4,18 @@ Cooldown rafale distance pour limiter le spam.
 """
 import math
 import os
+import threading
 import pygame
 from game.config import JOY_DEADZONE
+from game.asset_cache import get_asset_cache
+from game.sound_bank import get_sound_bank
+from game.trace import get_trace, define, JOY, WARN
 from player.stats import Stats
 from combat.hitbox_sprite import HitboxSprite
-from combat.knockback import decay_launch_speed, KnockbackResult
+from combat.knockback import KnockbackResult, decay_launch_speed
+from combat.sweep import sweep_rect, contact_position
 from combat.attack import HitResult
+from player.player_input import NEUTRAL_INPUT
 
 WALK_ANIM_FRAMES = 8
 SPRITE_HEIGHT = 130
@@ -17,18 +23,10 @@ SPRITE_WIDTH_SCALE = 0.85
 ATTACK_ANIM_DURATION = 24
 ATTACK_ANIM_FRAME_DURATION = 8
 
-_stomp_sound = None
-
-def _get_stomp_sound():
-    global _stomp_sound
-    if _stomp_sound is None:
-        base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        path = os.path.join(base, "assets", "song", "combat", " crushing", "jab-attack.wav")
-        try:
-            _stomp_sound = pygame.mixer.Sound(path)
-        except Exception:
-            _stomp_sound = False
-    return _stomp_sound if _stomp_sound else None
+def _sprite_size(src_w, src_h):
+    """Taille d'affichage d'une frame de perso : hauteur fixe, largeur proportionnelle (légèrement resserrée)."""
+    h = SPRITE_HEIGHT
+    return max(1, int(src_w * h / src_h * SPRITE_WIDTH_SCALE)), h
 
 
 def _load_walk_frames(character: str):
@@ -39,10 +37,10 @@ def _load_walk_frames(character: str):
     else:
         folder = os.path.join(base, "assets", "JUDY_HOPPS", "judy_hopps_walk")
         paths = [os.path.join(folder, "1.png"), os.path.join(folder, "2.png"), os.path.join(folder, "3.png")]
-    frames_raw = [pygame.image.load(p).convert_alpha() for p in paths]
+    cache = get_asset_cache()
     h = SPRITE_HEIGHT
-    w = max(max(1, int(f.get_width() * h / f.get_height() * SPRITE_WIDTH_SCALE)) for f in frames_raw)
-    return [pygame.transform.smoothscale(f, (w, h)) for f in frames_raw]
+    w = max(_sprite_size(*cache.source_size(p))[0] for p in paths)
+    return [cache.scaled(p, (w, h)) for p in paths]
 
 
 def _load_attack_frames(character: str):
@@ -58,10 +56,7 @@ def _load_attack_frames(character: str):
     for i in range(n_frames):
         path = os.path.join(folder, f"{i + 1}.png")
         try:
-            img = pygame.image.load(path).convert_alpha()
-            h = SPRITE_HEIGHT
-            w = max(1, int(img.get_width() * h / img.get_height() * SPRITE_WIDTH_SCALE))
-            result.append(pygame.transform.smoothscale(img, (w, h)))
+            result.append(get_asset_cache().scaled(path, _sprite_size))
         except Exception:
             result.append(None)
     return result
@@ -76,10 +71,7 @@ def _load_distance_attack_frame(character: str):
     else:
         return None
     try:
-        img = pygame.image.load(path).convert_alpha()
-        h = SPRITE_HEIGHT
-        w = max(1, int(img.get_width() * h / img.get_height() * SPRITE_WIDTH_SCALE))
-        return pygame.transform.smoothscale(img, (w, h))
+        return get_asset_cache().scaled(path, _sprite_size)
     except Exception:
         return None
 
@@ -93,14 +85,33 @@ def _load_counter_frame(character: str):
     else:
         return None
     try:
-        img = pygame.image.load(path).convert_alpha()
-        h = SPRITE_HEIGHT
-        w = max(1, int(img.get_width() * h / img.get_height() * SPRITE_WIDTH_SCALE))
-        return pygame.transform.smoothscale(img, (w, h))
+        return get_asset_cache().scaled(path, _sprite_size)
     except Exception:
         return None
 
 
+def _facing_variants(frame, character: str):
+    """
+    (image regard à gauche, image regard à droite) d'une frame source, calculées une fois au chargement.
+    Les sources Nick regardent vers la gauche, celles de Judy vers la droite.
+    """
+    if frame is None:
+        return None
+    flipped = pygame.transform.flip(frame, True, False)
+    if character == "nick":
+        return (frame, flipped)
+    return (flipped, frame)
+
+
+def _load_oriented_frames(character: str):
+    """Toutes les animations du perso en paires (gauche, droite), indexables par facing_right."""
+    walk = [_facing_variants(f, character) for f in _load_walk_frames(character)]
+    attack = [_facing_variants(f, character) for f in _load_attack_frames(character)]
+    distance = _facing_variants(_load_distance_attack_frame(character), character)
+    counter = _facing_variants(_load_counter_frame(character), character)
+    return walk, attack, distance, counter
+
+
 DISTANCE_ATTACK_DURATION = 28
 DISTANCE_ATTACK_COOLDOWN_FRAMES = 90
 DISTANCE_ATTACK_BURST_SIZE = 3
@@ -108,6 +119,16 @@ DISTANCE_ATTACK_NUM_BURSTS = 1
 DISTANCE_ATTACK_BURST_DELAY = 8
 COUNTER_DURATION = 40
 
+_TR_JOY_READ = define(JOY, WARN, "lecture manette impossible joy_id={a:.0f}")
+
+
+def _collide_rect(other) -> pygame.Rect:
+    """Rect de collision : celui du sprite, sans la marge au-dessus de la surface marchable (surface_offset)."""
+    so = getattr(other, "surface_offset", 0)
+    if so > 0:
+        return pygame.Rect(other.rect.left, other.rect.top + so, other.rect.width, other.rect.height - so)
+    return other.rect
+
 
 class Player(pygame.sprite.Sprite):
     STALE_QUEUE_MAX = 9
@@ -119,10 +140,13 @@ class Player(pygame.sprite.Sprite):
     JUMP_BUFFER_FRAMES = 8
     KNOCKBACK_SCALE = 5.0
 
+    # Par personnage : frames en paires (regard gauche, regard droite), indexées par facing_right
     _walk_frames_cache = {}
     _attack_frames_cache = {}
     _distance_attack_frame_cache = {}
     _counter_frame_cache = {}
+    # Les frames peuvent être préchargées par le thread d'assets (groupe "characters")
+    _frames_lock = threading.Lock()
 
     def __init__(self, start_pos, color, controls, screen_size, character: str = "judy", joystick_id=None):
         super().__init__()
@@ -133,19 +157,12 @@ class Player(pygame.sprite.Sprite):
         self.joystick_id = joystick_id
         self.joystick = None
 
-        if self.character not in Player._walk_frames_cache:
-            Player._walk_frames_cache[self.character] = _load_walk_frames(self.character)
-        if self.character not in Player._attack_frames_cache:
-            Player._attack_frames_cache[self.character] = _load_attack_frames(self.character)
-        if self.character not in Player._distance_attack_frame_cache:
-            Player._distance_attack_frame_cache[self.character] = _load_distance_attack_frame(self.character)
-        if self.character not in Player._counter_frame_cache:
-            Player._counter_frame_cache[self.character] = _load_counter_frame(self.character)
-
-        self._walk_frames = Player._walk_frames_cache[self.character]
-        self._attack_frames = Player._attack_frames_cache[self.character]
-        self._distance_attack_frame = Player._distance_attack_frame_cache[self.character]
-        self._counter_frame = Player._counter_frame_cache[self.character]
+        # Frames chargées au premier besoin (ou préchargées) : pas de chargement des deux persos au démarrage
+        self._frames_bound = False
+        self._walk_frames = None
+        self._attack_frames = None
+        self._distance_attack_frame = None
+        self._counter_frame = None
 
         self._walk_index = 0
         self._anim_timer = 0
@@ -157,14 +174,20 @@ class Player(pygame.sprite.Sprite):
         self._distance_attack_remaining = 0
         self._counter_remaining = 0
 
-        self.image = self._walk_frames[0].copy()
+        self.facing_right = True
+        self.image = pygame.Surface((int(SPRITE_HEIGHT * SPRITE_WIDTH_SCALE * 0.6), SPRITE_HEIGHT), pygame.SRCALPHA)
         self.rect = self.image.get_rect(topleft=start_pos)
         self.spawn_pos = start_pos
+        # Position au début du tick (origine des tests balayés de resolve_collisions)
+        self.prev_x = self.rect.x
         self.prev_y = self.rect.y
         self.drop_through = False
 
         self.controls = controls
         self.joy_id = joystick_id
+        # Entrées du tick courant (InputFrame) et horloge de simulation (ms), posées par Simulation.step
+        self.input = NEUTRAL_INPUT
+        self.clock_ms = 0
         
         self.speed_x = 0
         self.speed_y = 0
@@ -208,6 +231,42 @@ class Player(pygame.sprite.Sprite):
         self.STOMP_HITSTUN = 20
         self.STOMP_BOUNCE_Y = -6
 
+    def reset_for_match(self):
+        """
+        Début de match : efface ce que le match précédent a laissé (animations et timers d'attaque, contre,
+        rafale, staleness, sens du regard, triches, taille du rect) ; l'état ne dépend alors que du perso.
+        """
+        self._walk_index = 0
+        self._anim_timer = 0
+        self._attack_animation_remaining = 0
+        self._attack_animation_variant = 0
+        self._attack_variant_toggle = 0
+        self._attack_frame_index = 0
+        self._attack_frame_timer = 0
+        self._distance_attack_remaining = 0
+        self._distance_attack_cooldown_remaining = 0
+        self._distance_burst_remaining = 0
+        self._distance_burst_timer = 0
+        self._counter_remaining = 0
+        self.facing_right = True
+        self.drop_through = False
+        self.coyote_frames = 0
+        self.jump_buffer_frames = 0
+        self._jump_held = False
+        self._did_air_jump_this_flight = False
+        self._jump_btn_prev = False
+        self._down_held = False
+        self._stomp_cooldown = 0
+        self.di_angle_rad = None
+        self.stale_queue = []
+        self._show_smoke = False
+        self._smoke_frames_remaining = 0
+        self.cheat_invincible_until = 0
+        self.cheat_super_damage_until = 0
+        if self._frames_bound:
+            self.image = self._walk_frames[0][self.facing_right]
+            self.rect.size = self.image.get_size()
+
     def respawn(self):
         self.rect.topleft = self.spawn_pos
         self.speed_x = 0
@@ -221,39 +280,68 @@ class Player(pygame.sprite.Sprite):
         self.state = "idle"
         self.respawn_invuln = self.RESPAWN_INVULN_FRAMES
 
+    def _blast_out(self):
+        """Sorti des blast zones : perte d'un stock (sauf triche invincible) puis respawn, ou hors jeu au dernier."""
+        if getattr(self, "cheat_invincible_until", 0) > self.clock_ms:
+            self.respawn()
+        else:
+            self.lives -= 1
+            if self.lives > 0:
+                self.respawn()
+            else:
+                self.rect.center = (-999, -999)
+
     def set_character(self, new_character: str):
         """Change le personnage (judy / nick) et met à jour sprites et image."""
         if new_character not in ("judy", "nick"):
             return
         self.character = new_character
-        if self.character not in Player._walk_frames_cache:
-            Player._walk_frames_cache[self.character] = _load_walk_frames(self.character)
-        if self.character not in Player._attack_frames_cache:
-            Player._attack_frames_cache[self.character] = _load_attack_frames(self.character)
-        if self.character not in Player._distance_attack_frame_cache:
-            Player._distance_attack_frame_cache[self.character] = _load_distance_attack_frame(self.character)
-        if self.character not in Player._counter_frame_cache:
-            Player._counter_frame_cache[self.character] = _load_counter_frame(self.character)
-        self._walk_frames = Player._walk_frames_cache[self.character]
-        self._attack_frames = Player._attack_frames_cache[self.character]
-        self._distance_attack_frame = Player._distance_attack_frame_cache[self.character]
-        self._counter_frame = Player._counter_frame_cache[self.character]
-        self.image = self._walk_frames[0].copy()
+        if not self._frames_bound:
+            # Rect encore provisoire (frames jamais chargées) : on garde la position de spawn (topleft)
+            self._ensure_frames()
+            return
+        self._bind_frames()
+        self.image = self._walk_frames[0][self.facing_right]
+        self.rect.size = self.image.get_size()
         cx, cy = self.rect.center
         self.rect = self.image.get_rect(center=(cx, cy))
 
+    @classmethod
+    def preload_frames(cls, character: str):
+        """Charge une fois les frames orientées d'un perso dans les caches de classe (thread-safe)."""
+        with cls._frames_lock:
+            if character in cls._walk_frames_cache:
+                return
+            walk, attack, distance, counter = _load_oriented_frames(character)
+            cls._attack_frames_cache[character] = attack
+            cls._distance_attack_frame_cache[character] = distance
+            cls._counter_frame_cache[character] = counter
+            cls._walk_frames_cache[character] = walk
+
+    def _ensure_frames(self):
+        """Premier besoin des frames (update, attaque) : les associe et ajuste le rect à la vraie taille."""
+        if self._frames_bound:
+            return
+        self._bind_frames()
+        self.image = self._walk_frames[0][self.facing_right]
+        self.rect.size = self.image.get_size()
+
+    def _bind_frames(self):
+        """Charge (une fois par perso, caches de classe) puis associe les frames orientées (gauche, droite)."""
+        character = self.character
+        Player.preload_frames(character)
+        self._frames_bound = True
+        self._walk_frames = Player._walk_frames_cache[character]
+        self._attack_frames = Player._attack_frames_cache[character]
+        self._distance_attack_frame = Player._distance_attack_frame_cache[character]
+        self._counter_frame = Player._counter_frame_cache[character]
+
     def _get_joy_input(self):
-        """✅ CORRIGÉ : Retourne (left, right, up, down, jump_held) depuis la manette si connectée."""
+        """✅ CORRIGÉ : Retourne (left, right, up, down, jump_held, stick_x, stick_y) depuis la manette si connectée."""
         if self.joystick is None:
-            if self.joystick_id is not None and self.joystick_id < pygame.joystick.get_count():
-                try:
-                    self.joystick = pygame.joystick.Joystick(self.joystick_id)
-                    self.joystick.init()
-                except:
-                    return None
-            else:
-                return None
-        
+            # Handle ouvert et assigné par le GamepadManager (game/gamepads.py)
+            return None
+
         try:
             dead = JOY_DEADZONE
 
@@ -278,23 +366,22 @@ class Player(pygame.sprite.Sprite):
             
             jump_held = self.joystick.get_button(0) if self.joystick.get_numbuttons() > 0 else False
             
-            return (left, right, up, down, jump_held)
+            return (left, right, up, down, jump_held, ax0, ax1)
         
-        except Exception as e:
-            print(f"⚠️ Erreur lecture manette {self.joystick_id}: {e}")
+        except Exception:
+            tr = get_trace()
+            if tr.on[_TR_JOY_READ]:
+                tr.emit(_TR_JOY_READ, -1 if self.joystick_id is None else self.joystick_id)
             return None
 
     def update_di(self):
         """Directional Influence pour le knockback"""
-        joy_in = self._get_joy_input()
-        if joy_in is not None:
-            left, right, up, down, _ = joy_in
-            dx = 1 if right else (-1 if left else 0)
-            dy = 1 if up else (-1 if down else 0)
+        inp = self.input
+        dx = 1 if inp.right else (-1 if inp.left else 0)
+        if inp.via_joystick:
+            dy = 1 if inp.up else (-1 if inp.down else 0)
         else:
-            keys = pygame.key.get_pressed()
-            dx = 1 if keys[self.controls["right"]] else (-1 if keys[self.controls["left"]] else 0)
-            dy = 1 if keys[self.controls["jump"]] else (-1 if keys[self.controls.get("down", pygame.K_s)] else 0)
+            dy = 1 if inp.jump else (-1 if inp.down else 0)
         
         if dx != 0 or dy != 0:
             self.di_angle_rad = math.atan2(dy, dx)
@@ -315,7 +402,7 @@ class Player(pygame.sprite.Sprite):
             self.stale_queue.pop(0)
 
     def handle_input(self):
-        """✅ CORRIGÉ : Gère manette OU clavier"""
+        """Applique les entrées du tick (self.input) : manette OU clavier"""
         if self.lives <= 0:
             return
         if self.hitstun > 0:
@@ -324,38 +411,22 @@ class Player(pygame.sprite.Sprite):
         self.speed_x = 0
         move = self.move_speed if self.on_ground else self.move_speed * self.air_move_mult
 
-        joy_in = self._get_joy_input()
-        if joy_in is not None:
-            left, right, up, down, jump_held = joy_in
-            
-            if left:
-                self.speed_x = -move
-                self.facing_right = False
-            if right:
-                self.speed_x = move
-                self.facing_right = True
-            
-            self.drop_through = down and jump_held
-            jump_just_pressed = jump_held and not getattr(self, "_jump_btn_prev", False)
+        inp = self.input
+        if inp.left:
+            self.speed_x = -move
+            self.facing_right = False
+        if inp.right:
+            self.speed_x = move
+            self.facing_right = True
+        self.drop_through = inp.down and inp.jump
+        if inp.via_joystick:
+            jump_just_pressed = inp.jump and not getattr(self, "_jump_btn_prev", False)
             if not self.on_ground and self.jump_count < self.jump_max and not self._did_air_jump_this_flight and jump_just_pressed:
                 self.jump()
                 self._did_air_jump_this_flight = True
-            self._jump_held = jump_held
-            self._jump_btn_prev = jump_held
-            self._down_held = down
-        else:
-            keys = pygame.key.get_pressed()
-            down_key = keys[self.controls.get("down", pygame.K_s)]
-            if keys[self.controls["left"]]:
-                self.speed_x = -move
-                self.facing_right = False
-            if keys[self.controls["right"]]:
-                self.speed_x = move
-                self.facing_right = True
-            self.drop_through = down_key and keys[self.controls["jump"]]
-            self._jump_held = keys[self.controls["jump"]]
-            self._jump_btn_prev = keys[self.controls["jump"]]
-            self._down_held = down_key
+        self._jump_held = inp.jump
+        self._jump_btn_prev = inp.jump
+        self._down_held = inp.down
 
     def start_attack(self, attack_id: str, hitboxes_group, charge_mult: float = 1.0):
         hb = HitboxSprite(owner=self, attack_id=attack_id, charge_mult=charge_mult)
@@ -367,6 +438,7 @@ class Player(pygame.sprite.Sprite):
         self._attack_frame_timer = 0
 
     def start_distance_attack_animation(self):
+        self._ensure_frames()
         if self._distance_attack_frame is not None:
             self._distance_attack_remaining = DISTANCE_ATTACK_DURATION
 
@@ -374,21 +446,18 @@ class Player(pygame.sprite.Sprite):
         self._counter_remaining = COUNTER_DURATION
 
     def _update_walk_animation(self):
-        """Met à jour l'animation de marche"""
+        """Met à jour l'animation de marche (sélection d'une frame pré-orientée, aucun flip ici)"""
+        self._ensure_frames()
         if self._counter_remaining > 0:
             self._counter_remaining -= 1
             if self._counter_frame is not None:
-                frame = self._counter_frame
-                flip_x = self.facing_right if self.character == "nick" else not self.facing_right
-                self.image = pygame.transform.flip(frame, flip_x, False)
+                self.image = self._counter_frame[self.facing_right]
             return
         
         if self._distance_attack_remaining > 0:
             self._distance_attack_remaining -= 1
             if self._distance_attack_frame is not None:
-                frame = self._distance_attack_frame
-                flip_x = self.facing_right if self.character == "nick" else not self.facing_right
-                self.image = pygame.transform.flip(frame, flip_x, False)
+                self.image = self._distance_attack_frame[self.facing_right]
             return
         
         if self._attack_animation_remaining > 0:
@@ -399,11 +468,10 @@ class Player(pygame.sprite.Sprite):
                 self._attack_frame_index += 1
             idx = min(self._attack_frame_index, len(self._attack_frames) - 1)
             if idx >= 0 and self._attack_frames[idx] is not None:
-                frame = self._attack_frames[idx]
+                variants = self._attack_frames[idx]
             else:
-                frame = self._walk_frames[0]
-            flip_x = self.facing_right if self.character == "nick" else not self.facing_right
-            self.image = pygame.transform.flip(frame, flip_x, False)
+                variants = self._walk_frames[0]
+            self.image = variants[self.facing_right]
             return
         
         if self.speed_x != 0:
@@ -417,9 +485,7 @@ class Player(pygame.sprite.Sprite):
             self._walk_index = 0
             self._anim_timer = 0
         
-        frame = self._walk_frames[self._walk_index]
-        flip_x = self.facing_right if self.character == "nick" else not self.facing_right
-        self.image = pygame.transform.flip(frame, flip_x, False)
+        self.image = self._walk_frames[self._walk_index][self.facing_right]
 
     def jump(self):
         if self.coyote_frames > 0:
@@ -444,7 +510,7 @@ class Player(pygame.sprite.Sprite):
     def receive_hit(self, hit_result):
         if self.respawn_invuln > 0:
             return
-        if getattr(self, "cheat_invincible_until", 0) > pygame.time.get_ticks():
+        if getattr(self, "cheat_invincible_until", 0) > self.clock_ms:
             return
         self._show_smoke = True
         self.stats.take_damage(hit_result.damage_dealt)
@@ -454,14 +520,17 @@ class Player(pygame.sprite.Sprite):
         self.tumbling = hit_result.tumble
         self.state = "hitstun"
 
-    def update(self, platforms):
-        """✅ Mise à jour complète du joueur"""
+    def update(self, others):
+        """
+        Un tick : forces (lancer / gravité réduite en hitstun, sinon entrées + gravité), déplacement, collisions
+        avec others (autres joueurs puis plateformes), coyote time / buffer de saut, animation, blast zones.
+        """
         if self.respawn_invuln > 0:
             self.respawn_invuln -= 1
-        
         if self.lives <= 0:
             return
-        
+
+        self.prev_x = self.rect.x
         self.prev_y = self.rect.y
         prev_on_ground = self.on_ground
         self.on_ground = False
@@ -477,40 +546,99 @@ class Player(pygame.sprite.Sprite):
             else:
                 self.speed_y += self.gravity_for_kb
         else:
+            # Entrées du tick (posées par Simulation.step) ; on_ground vient d'être remis à False : vitesse et sauts d'air
             self.handle_input()
             self.speed_y += self.gravity
-            if not self.on_ground and getattr(self, "_down_held", False):
-                self.speed_y += getattr(self, "STOMP_FALL_BOOST", 1.2)
-            if getattr(self, "_stomp_cooldown", 0) > 0:
+            if self._down_held:
+                self.speed_y += self.STOMP_FALL_BOOST
+            if self._stomp_cooldown > 0:
                 self._stomp_cooldown -= 1
             if not self._jump_held and self.speed_y < self.jump_cut_speed:
                 self.speed_y = self.jump_cut_speed
 
         self.rect.x += int(self.speed_x)
         self.rect.y += int(self.speed_y)
+        self.resolve_collisions(others)
 
-        others = list(platforms)
-        for player in pygame.sprite.Group():
-            if hasattr(player, 'lives') and player != self:
-                others.append(player)
+        if not self.on_ground:
+            if prev_on_ground:
+                self.coyote_frames = self.COYOTE_FRAMES
+            else:
+                self.coyote_frames = max(0, self.coyote_frames - 1)
+            self.jump_buffer_frames = max(0, self.jump_buffer_frames - 1)
+        else:
+            self._did_air_jump_this_flight = False
+            self.coyote_frames = 0
+            if self.jump_buffer_frames > 0 and self.jump_count < self.jump_max:
+                # Saut bufferisé : part à l'atterrissage
+                mult = self.double_jump_mult if self.jump_count > 0 else 1.0
+                self.speed_y = self.jump_force * mult
+                self.jump_count += 1
+                self.jump_buffer_frames = 0
+                self.drop_through = False
 
+        self._update_walk_animation()
+
+        margin = self.BLAST_MARGIN
+        if (
+            self.rect.right < -margin
+            or self.rect.left > self.screen_width + margin
+            or self.rect.bottom < -margin
+            or self.rect.top > self.screen_height + margin
+        ):
+            self._blast_out()
+
+    def _stop_at_first_contact(self, others):
+        """
+        Trajet du tick qui traverse quelque chose sans le chevaucher à l'arrivée (lancer rapide) : le rect est
+        ramené au premier contact (plus petit temps d'impact), que la résolution habituelle traite ensuite.
+        """
+        dx, dy = self.rect.x - self.prev_x, self.rect.y - self.prev_y
+        if dx == 0 and dy == 0:
+            return
+        start = pygame.Rect(self.prev_x, self.prev_y, self.rect.width, self.rect.height)
+        first = None
         for other in others:
-            if not hasattr(other, "rect"):
+            target = _collide_rect(other)
+            hit = sweep_rect(start, dx, dy, target)
+            if hit is None:
                 continue
-
-            other_collide_rect = other.rect
-            surface_offset = getattr(other, "surface_offset", 0)
-            if surface_offset > 0:
-                so = surface_offset
-                other_collide_rect = pygame.Rect(
-                    other.rect.left, other.rect.top + so,
-                    other.rect.width, other.rect.height - so
-                )
-            
-            if not self.rect.colliderect(other_collide_rect):
+            if getattr(other, "one_way", False) and (hit[1] != "y" or dy <= 0 or self.drop_through):
                 continue
-
+            if first is None or hit[0] < first[0]:
+                first = (hit[0], hit[1], target)
+        if first is not None and not self.rect.colliderect(first[2]):
+            self.rect.topleft = contact_position(self.rect, dx, dy, first[2], first[1])
+
+    def resolve_collisions(self, others):
+        """
+        Collisions après intégration (rect déjà déplacé) : autres joueurs (repoussée, stomp) puis plateformes.
+        Chevauchement en fin de tick, ou à défaut test balayé depuis (prev_x, prev_y) : pas d'effet tunnel à haute vitesse.
+        """
+        others = [other for other in others if hasattr(other, "rect")]
+        self._stop_at_first_contact(others)
+        for other in others:
+            other_collide_rect = _collide_rect(other)
             is_other_player = getattr(other, "lives", None) is not None
+            one_way = getattr(other, "one_way", False)
+            if not self.rect.colliderect(other_collide_rect):
+                # Pas de chevauchement en fin de tick : le trajet du tick a pu traverser other (lancer rapide)
+                dx, dy = self.rect.x - self.prev_x, self.rect.y - self.prev_y
+                start = pygame.Rect(self.prev_x, self.prev_y, self.rect.width, self.rect.height)
+                hit = sweep_rect(start, dx, dy, other_collide_rect)
+                if hit is None:
+                    continue
+                axis = hit[1]
+                if one_way and not is_other_player:
+                    # Plateforme traversable : seul l'atterrissage par le dessus compte
+                    if axis != "y" or dy <= 0:
+                        continue
+                else:
+                    # Arrêt au contact sur la face touchée ; sur le côté d'une plateforme pleine, rien d'autre
+                    self.rect.topleft = contact_position(self.rect, dx, dy, other_collide_rect, axis)
+                    if axis == "x" and not is_other_player:
+                        continue
+
             if is_other_player:
                 overlap_left = max(0, self.rect.right - other.rect.left)
                 overlap_right = max(0, other.rect.right - self.rect.left)
@@ -526,18 +654,12 @@ class Player(pygame.sprite.Sprite):
                     and getattr(other, "respawn_invuln", 0) <= 0
                 )
                 if stomp_ok:
-                    snd = _get_stomp_sound()
-                    if snd is not None:
-                        try:
-                            snd.set_volume(0.4)
-                            snd.play()
-                        except Exception:
-                            pass
+                    get_sound_bank().play("stomp")
                     vx = getattr(self, "STOMP_LAUNCH_X", 6) * (1 if self.facing_right else -1)
                     vy = getattr(self, "STOMP_LAUNCH_Y", -4)
                     dummy_kb = KnockbackResult(0, 0, 0, vx, vy)
                     stomp_dmg = getattr(self, "STOMP_DAMAGE", 24)
-                    if getattr(self, "cheat_super_damage_until", 0) > pygame.time.get_ticks():
+                    if getattr(self, "cheat_super_damage_until", 0) > self.clock_ms:
                         stomp_dmg *= 5
                     stomp_result = HitResult(
                         stomp_dmg,
@@ -562,8 +684,7 @@ class Player(pygame.sprite.Sprite):
                 continue
 
             surface_top = other.rect.top + getattr(other, "surface_offset", 0)
-            one_way = getattr(other, "one_way", False)
-            
+
             if one_way:
                 if (
                     self.speed_y > 0 and
@@ -584,43 +705,5 @@ class Player(pygame.sprite.Sprite):
                     self.rect.top = other.rect.bottom
                     self.speed_y = 0
         
-        if self.on_ground:
-            joy_in = self._get_joy_input()
-            down_pressed = (joy_in[3] if joy_in is not None else False) or (
-                pygame.key.get_pressed()[self.controls.get("down", pygame.K_s)]
-            )
-            if down_pressed:
-                self.crouching = True
-
-        if not self.on_ground:
-            if prev_on_ground:
-                self.coyote_frames = self.COYOTE_FRAMES
-            else:
-                self.coyote_frames = max(0, self.coyote_frames - 1)
-            self.jump_buffer_frames = max(0, self.jump_buffer_frames - 1)
-        else:
-            self._did_air_jump_this_flight = False
-            self.coyote_frames = 0
-            if self.jump_buffer_frames > 0 and self.jump_count < self.jump_max:
-                mult = self.double_jump_mult if self.jump_count > 0 else 1.0
-                self.speed_y = self.jump_force * mult
-                self.jump_count += 1
-                self.jump_buffer_frames = 0
-                self.drop_through = False
-
-        self._update_walk_animation()
-
-        if (
-            self.rect.right < -self.BLAST_MARGIN
-            or self.rect.left > self.screen_width + self.BLAST_MARGIN
-            or self.rect.bottom < -self.BLAST_MARGIN
-            or self.rect.top > self.screen_height + self.BLAST_MARGIN
-        ):
-            if getattr(self, "cheat_invincible_until", 0) > pygame.time.get_ticks():
-                self.respawn()
-            else:
-                self.lives -= 1
-                if self.lives > 0:
-                    self.respawn()
-                else:
-                    self.rect.center = (-999, -999)
\ No newline at end of file
+        if self.on_ground and self.input.down:
+            self.crouching = True
@@ -0,0 +1,80 @@
+"""
+Entrées d'un joueur pour un tick de simulation : directions / saut tenus + appuis (front montant), plus la
+position du stick. Échantillonnées une fois par tick par PlayingScreen (game/input_handling.py), ou fournies
+directement (simulation headless, replays, réseau, bots).
+"""
+from operator import itemgetter
+
+# Bit i du bitmask = FLAGS[i] (format des paquets réseau et des replays : ne pas réordonner)
+FLAGS = (
+    "left", "right", "up", "down", "jump",
+    "jump_pressed", "attack_pressed", "special_pressed", "counter_pressed",
+    "via_joystick",
+)
+
+
+class InputFrame(tuple):
+    """
+    Instantané immuable des entrées d'un joueur pour un tick : (bitmask, stick_x, stick_y).
+    Les drapeaux (left, jump_pressed...) se lisent comme des attributs. La simulation ne lit que le bitmask :
+    un replay ou un paquet réseau (bits seuls) la reproduit exactement ; les axes (-1..1, 0 au clavier)
+    servent à l'affichage et aux outils.
+    """
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        left: bool = False,
+        right: bool = False,
+        up: bool = False,
+        down: bool = False,
+        jump: bool = False,
+        jump_pressed: bool = False,
+        attack_pressed: bool = False,
+        special_pressed: bool = False,
+        counter_pressed: bool = False,
+        via_joystick: bool = False,
+        stick_x: float = 0.0,
+        stick_y: float = 0.0,
+    ):
+        # Bit i = FLAGS[i]
+        bits = (
+            (1 if left else 0) | (2 if right else 0) | (4 if up else 0) | (8 if down else 0)
+            | (16 if jump else 0) | (32 if jump_pressed else 0) | (64 if attack_pressed else 0)
+            | (128 if special_pressed else 0) | (256 if counter_pressed else 0) | (512 if via_joystick else 0)
+        )
+        return tuple.__new__(cls, (bits, stick_x, stick_y))
+
+    @classmethod
+    def from_bits(cls, bits: int, stick_x: float = 0.0, stick_y: float = 0.0) -> "InputFrame":
+        return tuple.__new__(cls, (bits, stick_x, stick_y))
+
+    bits = property(itemgetter(0))
+    stick_x = property(itemgetter(1))
+    stick_y = property(itemgetter(2))
+
+    def to_bits(self) -> int:
+        """Entrées compactées en un entier (bit i = FLAGS[i]) : réseau, enregistrement."""
+        return self[0]
+
+    def __repr__(self):
+        held = [name for i, name in enumerate(FLAGS) if self[0] >> i & 1]
+        return f"InputFrame({', '.join(held)})"
+
+
+def _flag(mask: int):
+    return property(lambda self: self[0] & mask != 0)
+
+
+for _i, _name in enumerate(FLAGS):
+    setattr(InputFrame, _name, _flag(1 << _i))
+del _i, _name
+
+
+# Bits des appuis (front montant) : ne se répètent pas d'un tick à l'autre
+PRESS_BITS = sum(1 << FLAGS.index(name) for name in (
+    "jump_pressed", "attack_pressed", "special_pressed", "counter_pressed",
+))
+
+
+NEUTRAL_INPUT = InputFrame()
@@ -0,0 +1,3 @@
+"""
+Outils hors jeu (équilibrage, replays...) : lancer depuis src/, ex. python -m tools.ko_table
+"""
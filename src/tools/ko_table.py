@@ -0,0 +1,217 @@
+"""
+Tables de pourcentage de KO (équilibrage de ATTACKS) : pour chaque hitbox × poids × crouch cancel × DI,
+pourcentage minimal de la victime (avant le coup) pour qu'elle sorte de la blast zone (Player.BLAST_MARGIN)
+pendant son hitstun, lancée depuis une position type de la scène. Tout est calculé d'un coup en NumPy
+(resolve_hit_batch puis vol simulé frame par frame) et écrit en CSV.
+
+    cd src && python -m tools.ko_table [--output ko_table.csv] [--position center|ledge] [--check 20000]
+
+Vol simulé comme Player.update pendant le hitstun (décroissance du lancer en tumble, gravity_for_kb sinon),
+sans entrées ni collisions, sauf le dessus de la scène principale : la victime y retombe et glisse (elle
+peut encore en sortir). Après le hitstun la victime reprend la main : pas de KO.
+"""
+import argparse
+import csv
+import math
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+from combat.attack import HitboxArrays, VictimStats, resolve_hit, resolve_hit_batch
+from combat.attacks_data import ATTACKS
+from combat.knockback import KNOCKBACK_DECAY
+from game.simulation import create_headless_simulation
+from player.player import Player
+from player.player_input import NEUTRAL_INPUT
+
+DEFAULT_WEIGHTS = (80, 90, 100, 110, 120)
+# DI : aucun, puis les 8 directions du stick (degrés, même repère que les angles des hitbox)
+DEFAULT_DI_DEGREES = (None, 0, 45, 90, 135, 180, 225, 270, 315)
+DEFAULT_MAX_PERCENT = 300
+DI_STRENGTH = 0.18
+HITSTUN_STYLE = "ultimate"
+# Ticks d'attente pour que le joueur de référence soit posé sur la scène
+SETTLE_TICKS = 120
+CSV_COLUMNS = ("attack", "hitbox", "position", "weight", "crouch_cancel", "di_deg", "ko_percent")
+
+
+class LaunchSetup:
+    """Position de départ de la victime, scène principale et limites des blast zones (px monde)."""
+
+    def __init__(self, position: str):
+        sim = create_headless_simulation()
+        for _ in range(SETTLE_TICKS):
+            sim.step([NEUTRAL_INPUT] * len(sim.players))
+        victim = sim.players[0]
+        stage = max((p for p in sim.platforms if not getattr(p, "one_way", False)), key=lambda p: p.rect.width)
+        floor = stage.rect.top + getattr(stage, "surface_offset", 0)
+        self.w, self.h = victim.rect.size
+        self.x = victim.rect.x if position == "center" else stage.rect.right - self.w
+        self.y = floor - self.h
+        self.floor_top, self.floor_left, self.floor_right = floor, stage.rect.left, stage.rect.right
+        self.world_w, self.world_h = victim.screen_width, victim.screen_height
+        self.margin = victim.BLAST_MARGIN
+        self.gravity_kb = victim.gravity_for_kb
+
+
+def simulate_launches(setup: LaunchSetup, speed_x, speed_y, hitstun, tumbling):
+    """Vol de chaque cas pendant son hitstun ; renvoie le masque des victimes sorties de la blast zone."""
+    n = speed_x.shape[0]
+    ko = np.zeros(n, dtype=np.bool_)
+    idx = np.arange(n)
+    x = np.full(n, setup.x, dtype=np.int64)
+    y = np.full(n, setup.y, dtype=np.int64)
+    vx, vy = speed_x.astype(np.float64), speed_y.astype(np.float64)
+    stun, tumble = hitstun.astype(np.int64), tumbling.astype(np.bool_)
+    while idx.size:
+        stun = stun - 1
+        tumble = tumble & (stun > 0)
+        speed = np.hypot(vx, vy)
+        scale = np.divide(np.maximum(0.0, speed - KNOCKBACK_DECAY), speed, out=np.zeros_like(speed), where=speed > 0)
+        vx = np.where(tumble, vx * scale, vx)
+        vy = np.where(tumble, vy * scale, vy + setup.gravity_kb)
+        prev_bottom = y + setup.h
+        x = x + vx.astype(np.int64)
+        y = y + vy.astype(np.int64)
+
+        out = (
+            (x + setup.w < -setup.margin) | (x > setup.world_w + setup.margin)
+            | (y + setup.h < -setup.margin) | (y > setup.world_h + setup.margin)
+        )
+        ko[idx[out]] = True
+        landed = (
+            (vy >= 0) & (prev_bottom <= setup.floor_top) & (y + setup.h >= setup.floor_top)
+            & (x + setup.w > setup.floor_left) & (x < setup.floor_right)
+        )
+        y = np.where(landed, setup.floor_top - setup.h, y)
+        vy = np.where(landed, 0.0, vy)
+        keep = ~out & (stun > 0)
+        idx, x, y, vx, vy, stun, tumble = idx[keep], x[keep], y[keep], vx[keep], vy[keep], stun[keep], tumble[keep]
+    return ko
+
+
+def ko_table(setup: LaunchSetup, weights, di_degrees, max_percent: int, percent_step: int, attacker_percent: float):
+    """Lignes du CSV : une par (attaque, hitbox, poids, crouch cancel, DI), ko_percent vide si pas de KO."""
+    keys = [(attack_id, i) for attack_id, hitboxes in ATTACKS.items() for i in range(len(hitboxes))]
+    arrays = HitboxArrays([ATTACKS[attack_id][i] for attack_id, i in keys])
+    crouch = (1.0, Player.CROUCH_CANCEL_MULT)
+    di_rad = np.array([np.nan if d is None else math.radians(d) for d in di_degrees])
+    percents = np.arange(0, max_percent + 1, percent_step, dtype=np.float64)
+
+    # Grille complète : (hitbox, poids, crouch, DI, pourcentage), aplatie
+    shape = (len(keys), len(weights), len(crouch), len(di_rad), len(percents))
+    hb_i, w_i, c_i, d_i, p_i = (a.ravel() for a in np.indices(shape))
+    result = resolve_hit_batch(
+        arrays.take(hb_i),
+        percents[p_i],
+        np.asarray(weights, dtype=np.float64)[w_i],
+        True,
+        crouch_cancel=np.asarray(crouch)[c_i],
+        di_angle_rad=di_rad[d_i],
+        di_strength=DI_STRENGTH,
+        hitstun_style=HITSTUN_STYLE,
+        attacker_percent=attacker_percent,
+        victim_gravity=setup.gravity_kb,
+    )
+    ko = simulate_launches(
+        setup,
+        result.velocity_x * Player.KNOCKBACK_SCALE,
+        result.velocity_y * Player.KNOCKBACK_SCALE,
+        result.hitstun_frames,
+        result.tumble,
+    ) & result.landed
+    ko = ko.reshape(shape)
+    first = ko.argmax(axis=-1)
+    any_ko = ko.any(axis=-1)
+
+    for h, (attack_id, i) in enumerate(keys):
+        for w, weight in enumerate(weights):
+            for c, cc in enumerate(crouch):
+                for d, di in enumerate(di_degrees):
+                    ko_percent = percents[first[h, w, c, d]] if any_ko[h, w, c, d] else None
+                    yield attack_id, i, weight, cc, di, ko_percent
+
+
+def check_against_scalar(samples: int, seed: int = 15):
+    """Compare resolve_hit_batch à resolve_hit sur des cas tirés au hasard ; renvoie les écarts trouvés."""
+    rng = random.Random(seed)
+    hitboxes = [h for hbs in ATTACKS.values() for h in hbs]
+    cases = []
+    for _ in range(samples):
+        di = rng.choice((None, rng.uniform(0, 2 * math.pi)))
+        cases.append((
+            rng.randrange(len(hitboxes)), rng.uniform(0, 300), rng.choice(DEFAULT_WEIGHTS),
+            rng.choice((1.0, Player.CROUCH_CANCEL_MULT)), di, rng.random() < 0.5, rng.uniform(0, 200),
+        ))
+    hb_i, percent, weight, cc, di, facing, attacker = (np.array(col, dtype=float) for col in zip(*[
+        (c[0], c[1], c[2], c[3], np.nan if c[4] is None else c[4], c[5], c[6]) for c in cases
+    ]))
+    batch = resolve_hit_batch(
+        HitboxArrays(hitboxes).take(hb_i.astype(np.int64)), percent, weight, facing.astype(np.bool_),
+        crouch_cancel=cc, di_angle_rad=di, di_strength=DI_STRENGTH, hitstun_style=HITSTUN_STYLE,
+        attacker_percent=attacker,
+    )
+    mismatches = []
+    for k, (h, p, w, c, d, f, a) in enumerate(cases):
+        ref = resolve_hit(
+            hitboxes[h], VictimStats(p, w, crouch_cancel=c), f, di_angle_rad=d, di_strength=DI_STRENGTH,
+            hitstun_style=HITSTUN_STYLE, attacker_percent=a,
+        )
+        if ref is None:
+            if batch.landed[k]:
+                mismatches.append(k)
+            continue
+        if (
+            ref.hitstun_frames != batch.hitstun_frames[k] or ref.tumble != batch.tumble[k]
+            or not math.isclose(ref.velocity_x, batch.velocity_x[k], rel_tol=1e-9, abs_tol=1e-9)
+            or not math.isclose(ref.velocity_y, batch.velocity_y[k], rel_tol=1e-9, abs_tol=1e-9)
+            or not math.isclose(ref.knockback.knockback_units, batch.knockback_units[k], rel_tol=1e-9)
+        ):
+            mismatches.append(k)
+    return mismatches
+
+
+def _number_list(text):
+    return tuple(float(v) for v in text.split(","))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tables de pourcentage de KO par attaque (CSV).")
+    parser.add_argument("--output", default="ko_table.csv")
+    parser.add_argument("--position", choices=("center", "ledge"), default="center")
+    parser.add_argument("--weights", type=_number_list, default=DEFAULT_WEIGHTS)
+    parser.add_argument("--max-percent", type=int, default=DEFAULT_MAX_PERCENT)
+    parser.add_argument("--percent-step", type=int, default=1)
+    parser.add_argument("--attacker-percent", type=float, default=0.0, help="rage de l'attaquant")
+    parser.add_argument("--check", type=int, default=0, metavar="N",
+                        help="vérifie d'abord le calcul NumPy contre resolve_hit sur N cas")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        mismatches = check_against_scalar(args.check)
+        print(f"check: {args.check} cas, {len(mismatches)} écart(s)", file=sys.stderr)
+        if mismatches:
+            return 1
+
+    setup = LaunchSetup(args.position)
+    rows = ko_table(setup, args.weights, DEFAULT_DI_DEGREES, args.max_percent, args.percent_step, args.attacker_percent)
+    with open(args.output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for attack_id, i, weight, cc, di, ko_percent in rows:
+            writer.writerow((
+                attack_id, i, args.position, f"{weight:g}", f"{cc:g}",
+                "" if di is None else di, "" if ko_percent is None else f"{ko_percent:g}",
+            ))
+    print(f"écrit {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Replays sans affichage (game/replay.py) : résumé d'un fichier, re-vérification d'un résultat (l'état final
+rejoué doit avoir l'empreinte enregistrée), état à un frame donné, coût d'un tick sur une partie réelle.
+Un bug ou une régression de performance se joint donc sous forme de fichier .smr.
+
+    cd src && python -m tools.replay info replays/FICHIER.smr
+    cd src && python -m tools.replay verify replays/*.smr          # code 1 si un replay ne se reproduit pas
+    cd src && python -m tools.replay seek replays/FICHIER.smr --frame 1800
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game.config import SIM_FPS
+from game.match_state import checksum
+from game.replay import load_replay, replay_simulation
+
+
+def info(path: str) -> dict:
+    replay = load_replay(path)
+    return {
+        "file": path,
+        "bytes": os.path.getsize(path),
+        "frames": replay.frames,
+        "duration_s": round(replay.frames / SIM_FPS, 1),
+        "seed": replay.seed,
+        "map": replay.map_index,
+        "characters": list(replay.characters),
+        "lives": replay.lives,
+        "world_size": list(replay.world_size),
+        "events": len(replay.events),
+        "checksum": replay.final_checksum,
+    }
+
+
+def player_summary(sim) -> list:
+    return [
+        {
+            "character": p.character,
+            "lives": p.lives,
+            "percent": p.stats.percent,
+            "state": p.state,
+            "rect": list(p.rect),
+            "speed": [p.speed_x, p.speed_y],
+            "hitstun": p.hitstun,
+        }
+        for p in sim.players
+    ]
+
+
+def verify(path: str) -> dict:
+    """Rejoue tout le match headless : l'empreinte finale doit être celle enregistrée (ok None : pas d'empreinte)."""
+    replay = load_replay(path)
+    sim = replay_simulation(replay)
+    t0 = time.perf_counter()
+    replay.play(sim)
+    elapsed = time.perf_counter() - t0
+    digest = checksum(sim)
+    return {
+        "file": path,
+        "frames": sim.frame,
+        "ok": None if replay.final_checksum is None else digest == replay.final_checksum,
+        "checksum": digest,
+        "expected": replay.final_checksum,
+        "tick_us": round(elapsed * 1e6 / max(1, sim.frame), 1),
+        "speedup": round(sim.frame / SIM_FPS / elapsed, 1) if elapsed > 0 else None,
+    }
+
+
+def seek(path: str, frame: int) -> dict:
+    replay = load_replay(path)
+    sim = replay_simulation(replay)
+    replay.play(sim, frame)
+    return {"file": path, "frame": sim.frame, "checksum": checksum(sim), "players": player_summary(sim)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replays headless : résumé, vérification, état à un frame (JSON).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("info").add_argument("files", nargs="+")
+    sub.add_parser("verify").add_argument("files", nargs="+")
+    seek_parser = sub.add_parser("seek")
+    seek_parser.add_argument("file")
+    seek_parser.add_argument("--frame", type=int, required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "seek":
+        print(json.dumps(seek(args.file, args.frame), indent=2))
+        return 0
+    run = info if args.command == "info" else verify
+    failed = False
+    for path in args.files:
+        try:
+            report = run(path)
+        except (OSError, ValueError) as e:
+            report = {"file": path, "error": str(e)}
+        failed |= "error" in report or report.get("ok") is False
+        print(json.dumps(report))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())